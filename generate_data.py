@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dataset Generator Launcher
+Writes large nodes.csv / edges.csv files for stress-testing submissions
+
+Usage:
+    python generate_data.py --kind road --nodes 100000 --seed 7
+    python grade.py -d /path/to/student --dataset data/synthetic/road_100000_seed7
+    python generate_data.py --kind road --nodes 1000000 --snapshot
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.reference_implementation.network_generator import KINDS, generate, write_csv
+from src.reference_implementation.snapshot import build_snapshot
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic road networks in the project CSV format'
+    )
+    parser.add_argument(
+        '--kind',
+        choices=KINDS,
+        default='road',
+        help='Network type (default: road)'
+    )
+    parser.add_argument(
+        '--nodes',
+        type=int,
+        default=10000,
+        help='Number of nodes, e.g. 1000 to 1000000 (default: 10000)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Random seed; the same seed always produces the same files (default: 0)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default=None,
+        help='Output directory (default: data/synthetic/<kind>_<nodes>_seed<seed>/)'
+    )
+    parser.add_argument(
+        '--snapshot',
+        action='store_true',
+        help='Also write graph.snapshot, a binary copy that load_snapshot() maps without parsing'
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    output_dir = args.output or str(project_root / "data" / "synthetic" / f"{args.kind}_{args.nodes}_seed{args.seed}")
+
+    print(f"Generating {args.kind} network with {args.nodes} nodes (seed {args.seed})...")
+    started = time.time()
+    try:
+        network = generate(args.kind, args.nodes, seed=args.seed)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    nodes_path, edges_path = write_csv(network, output_dir)
+
+    print(f"✓ {len(network.xs)} nodes, {2 * len(network.weights)} directed edges "
+          f"in {time.time() - started:.1f}s")
+    print(f"  {nodes_path}")
+    print(f"  {edges_path}")
+
+    if args.snapshot:
+        started = time.time()
+        snapshot_path = build_snapshot(nodes_path, edges_path, str(Path(output_dir) / "graph.snapshot"))
+        print(f"✓ Snapshot written in {time.time() - started:.1f}s")
+        print(f"  {snapshot_path}")
+
+
+if __name__ == "__main__":
+    main()
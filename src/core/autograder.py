@@ -10,26 +10,85 @@ import json
 import subprocess
 import shutil
 import tempfile
-import importlib.util
 import argparse
+import time
+from concurrent.futures import wait, FIRST_COMPLETED, ALL_COMPLETED
 from datetime import datetime
 from pathlib import Path
 import traceback
 
 # Test imports
-from test_suite import GraphTester, DijkstraTester, AStarTester, PerformanceTester
+from test_suite import GraphTester, DijkstraTester, AStarTester, PerformanceTester, QueryResultStore, correctness_points
 from report_generator import generate_pdf_report
+from clone_stage import ClonePrefetcher, Submission
+from clone_cache import CloneCache
+from result_cache import ResultCache, compute_input_hash
+from sandbox import SandboxLimits, DEFAULT_LIMITS, run_sandboxed
+from worker_pool import create_worker_pool, configure_forkserver, DEFAULT_RECYCLE_AFTER
+from module_loader import StudentNamespace
+from benchmark import ScalingBenchmark, DEFAULT_BUDGET, dataset_root, prepare_datasets
+
+# Seconds of the submission budget kept free after the performance timing runs
+MEASUREMENT_RESERVE = 5
+
+try:
+    from src.reference_implementation.graph import Graph as ReferenceGraph
+    from src.reference_implementation.oracle import ReferenceOracle
+    from src.reference_implementation.bidirectional import (
+        bidirectional_dijkstra, bidirectional_astar, reverse_adjacency
+    )
+    from src.reference_implementation.astar import astar as reference_astar
+    from src.reference_implementation.alt import load_or_build as load_or_build_landmarks, graph_checksum
+except ImportError:
+    # Running from src/core directly: the project root is two levels up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.reference_implementation.graph import Graph as ReferenceGraph
+    from src.reference_implementation.oracle import ReferenceOracle
+    from src.reference_implementation.bidirectional import (
+        bidirectional_dijkstra, bidirectional_astar, reverse_adjacency
+    )
+    from src.reference_implementation.astar import astar as reference_astar
+    from src.reference_implementation.alt import load_or_build as load_or_build_landmarks, graph_checksum
 
 
 class Autograder:
     """Main autograder class that orchestrates the testing process"""
 
-    def __init__(self, submissions_file=None, output_dir="grading_reports", dataset_dir=None):
+    def __init__(self, submissions_file=None, output_dir="grading_reports", dataset_dir=None, clone_cache_dir=None,
+                 incremental=False, sandbox=True, limits=DEFAULT_LIMITS, recycle_after=DEFAULT_RECYCLE_AFTER,
+                 benchmark_budget=None, random_queries=0, score_random_queries=False):
         self.submissions_file = submissions_file
         self.output_dir = output_dir
         self.dataset_dir = dataset_dir
         self.results = []
 
+        # Student code runs in a child process unless sandbox=False; the
+        # per-query timeout applies either way
+        self.sandbox = sandbox
+        self.limits = limits
+
+        # ALT landmarks for the reference baseline, by graph checksum
+        self._landmarks = {}
+
+        # Parallel workers are replaced after this many submissions
+        self.recycle_after = recycle_after
+
+        # Seconds for the opt-in scaling benchmark (None = don't run it)
+        self.benchmark_budget = benchmark_budget
+
+        # Extra queries checked against the reference oracle; unscored unless
+        # score_random_queries is set
+        self.random_queries = random_queries
+        self.score_random_queries = score_random_queries
+
+        # Reuse stored results when a submission's graded inputs are unchanged
+        self.result_cache = ResultCache(output_dir) if incremental else None
+
+        # Persistent checkouts (keyed by repo URL) instead of throwaway temp clones
+        self.clone_cache = CloneCache(clone_cache_dir) if clone_cache_dir else None
+        # repo URL -> index of the submission whose checkout lives in the cache
+        self._cache_owners = {}
+
         # Validate submissions file exists (if provided)
         if submissions_file and not os.path.exists(submissions_file):
             raise FileNotFoundError(f"Submissions file not found: {submissions_file}")
@@ -48,16 +107,19 @@ class Autograder:
         # Create output directory
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    def clone_repository(self, repo_url, dest_dir):
-        """Clone a GitHub repository"""
+    def clone_repository(self, repo_url, dest_dir, shallow=False):
+        """Clone a GitHub repository (shallow=True fetches only the tip of the default branch)"""
         try:
             # Clean destination if exists
             if os.path.exists(dest_dir):
                 shutil.rmtree(dest_dir)
 
             # Clone repo
+            command = ["git", "clone"]
+            if shallow:
+                command += ["--depth", "1", "--single-branch"]
             result = subprocess.run(
-                ["git", "clone", repo_url, dest_dir],
+                command + [repo_url, dest_dir],
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -92,15 +154,13 @@ class Autograder:
 
         return results
 
-    def load_student_module(self, repo_dir, module_name):
-        """Dynamically load a Python module from the student's repo"""
+    def load_student_module(self, namespace, module_name):
+        """Load a Python module from the student's repo into its private namespace"""
         try:
-            module_path = os.path.join(repo_dir, f"{module_name}.py")
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-            return module, None
+            module_path = os.path.join(namespace.repo_dir, f"{module_name}.py")
+            if not os.path.isfile(module_path):
+                raise FileNotFoundError(f"No such file: '{module_path}'")
+            return namespace.load(module_name), None
         except Exception as e:
             return None, f"Failed to load {module_name}.py: {str(e)}"
 
@@ -171,40 +231,88 @@ class Autograder:
         else:
             print("  ✓ All required files found")
 
+        # Grader-side reference data, prepared outside the student's sandbox budget
+        generated, baseline = self.prepare_reference(repo_dir, results)
+
+        # Steps 2-6 execute student code
+        if self.sandbox:
+            completed = self.run_code_tests_sandboxed(repo_dir, results, generated, baseline)
+        else:
+            completed = self.run_code_tests(repo_dir, results, generated=generated, baseline=baseline)
+        if not completed:
+            return results
+
+        # Check for code quality flags
+        print("\nChecking code quality flags...")
+        results["flags"].extend(self.check_code_flags(repo_dir, results["performance_tests"].get("scaling")))
+
+        # Calculate automated score
+        results["automated_score"] = self.calculate_score(results)
+
+        print(f"\n{'=' * 60}")
+        print(f"Automated Score: {results['automated_score']}/{results['max_automated_score']} points")
+        print(f"{'=' * 60}")
+
+        return results
+
+    def run_code_tests(self, repo_dir, results, report=lambda snapshot: None, deadline=None,
+                       generated=None, baseline=None):
+        """
+        Load the student's modules and run steps 2-6 (graph, Dijkstra, A*, performance)
+
+        Args:
+            repo_dir: Student checkout
+            results: Results dict to fill in
+            report: Called with `results` after each completed step
+            deadline: time.monotonic() at which the sandbox stops the submission
+                (None: unlimited); timing runs leave the rest of the run room
+            generated: {(start, end): expected_cost} from prepare_reference(), or None
+            baseline: {(start, end): reference numbers} from prepare_reference(), or None
+
+        Returns:
+            bool: False if the student's modules could not be loaded
+        """
+        # Student modules live in a private package for the duration of the
+        # tests and are removed from sys.modules afterwards
+        with StudentNamespace(repo_dir) as namespace:
+            return self._run_code_tests(namespace, repo_dir, results, report, deadline, generated, baseline)
+
+    def _run_code_tests(self, namespace, repo_dir, results, report, deadline, generated, baseline):
+        """Body of run_code_tests() while the student's namespace is open"""
         # Step 2: Load student modules
         print("\n[2/6] Loading student code...")
         try:
-            # Add repo to path
-            sys.path.insert(0, repo_dir)
-
-            graph_module, error = self.load_student_module(repo_dir, "graph")
+            graph_module, error = self.load_student_module(namespace, "graph")
             if error:
                 results["errors"].append(error)
                 print(f"  ❌ {error}")
-                return results
+                return False
 
-            dijkstra_module, error = self.load_student_module(repo_dir, "dijkstra")
+            dijkstra_module, error = self.load_student_module(namespace, "dijkstra")
             if error:
                 results["errors"].append(error)
                 print(f"  ❌ {error}")
-                return results
+                return False
 
-            astar_module, error = self.load_student_module(repo_dir, "astar")
+            astar_module, error = self.load_student_module(namespace, "astar")
             if error:
                 results["errors"].append(error)
                 print(f"  ❌ {error}")
-                return results
+                return False
 
             print("  ✓ All modules loaded successfully")
 
         except Exception as e:
             results["errors"].append(f"Module loading error: {str(e)}")
             print(f"  ❌ {str(e)}")
-            return results
+            return False
 
         # Initialize safe reference
         graph_instance = None
 
+        # Query results from steps 4 and 5, reused by the performance step
+        query_store = QueryResultStore()
+
         # Step 3: Test graph operations
         print("\n[3/6] Testing graph operations...")
         try:
@@ -214,6 +322,7 @@ class Autograder:
             passed = sum(1 for t in results["graph_tests"]["tests"] if t["passed"])
             total = len(results["graph_tests"]["tests"])
             print(f"  ✓ Passed {passed}/{total} graph tests")
+            report(results)
 
         except Exception as e:
             results["errors"].append(f"Graph testing error: {str(e)}")
@@ -226,12 +335,16 @@ class Autograder:
             # Need to build graph first
             graph_instance = graph_tester.build_graph()
 
-            dijkstra_tester = DijkstraTester(dijkstra_module, graph_instance)
+            dijkstra_tester = DijkstraTester(dijkstra_module, graph_instance, query_timeout=self.limits.query_timeout,
+                                             store=query_store)
             results["dijkstra_tests"] = dijkstra_tester.run_all_tests()
 
             passed = sum(1 for t in results["dijkstra_tests"]["tests"] if t["passed"])
             total = len(results["dijkstra_tests"]["tests"])
             print(f"  ✓ Passed {passed}/{total} Dijkstra tests")
+            if generated:
+                self._add_generated(results["dijkstra_tests"], dijkstra_tester.run_generated_queries(generated))
+            report(results)
 
         except Exception as e:
             results["errors"].append(f"Dijkstra testing error: {str(e)}")
@@ -244,12 +357,16 @@ class Autograder:
             if graph_instance is None:
                 raise Exception("Graph could not be built, skipping A* tests")
 
-            astar_tester = AStarTester(astar_module, graph_instance)
+            astar_tester = AStarTester(astar_module, graph_instance, query_timeout=self.limits.query_timeout,
+                                       store=query_store)
             results["astar_tests"] = astar_tester.run_all_tests()
 
             passed = sum(1 for t in results["astar_tests"]["tests"] if t["passed"])
             total = len(results["astar_tests"]["tests"])
             print(f"  ✓ Passed {passed}/{total} A* tests")
+            if generated:
+                self._add_generated(results["astar_tests"], astar_tester.run_generated_queries(generated))
+            report(results)
 
         except Exception as e:
             results["errors"].append(f"A* testing error: {str(e)}")
@@ -262,45 +379,218 @@ class Autograder:
             if graph_instance is None:
                 raise Exception("Graph could not be built, skipping performance tests")
 
-            perf_tester = PerformanceTester(dijkstra_module, astar_module, graph_instance)
+            # Repeated timing is extra work added by the grader: it must not
+            # use up the time the benchmark and the rest of the run need
+            measure_until = None
+            if deadline is not None:
+                measure_until = deadline - (self.benchmark_budget or 0) - MEASUREMENT_RESERVE
+            perf_tester = PerformanceTester(dijkstra_module, astar_module, graph_instance,
+                                            query_timeout=self.limits.query_timeout, store=query_store,
+                                            baseline=baseline, deadline=measure_until)
             results["performance_tests"] = perf_tester.run_all_tests()
 
             print(f"  ✓ Performance tests complete")
+            report(results)
+
+            if self.benchmark_budget:
+                print(f"  Running scaling benchmark (budget {self.benchmark_budget}s)...")
+                benchmark = ScalingBenchmark(graph_module, dijkstra_module, astar_module,
+                                             budget=self.benchmark_budget, query_timeout=self.limits.query_timeout,
+                                             data_root=dataset_root(self.output_dir))
+                scaling = benchmark.run()
+                results["performance_tests"]["scaling"] = scaling
+                for name, label in [("dijkstra", "Dijkstra"), ("astar", "A*")]:
+                    exponent = scaling[name]["exponent"]
+                    measured = f"time ~ n^{exponent:.2f}" if exponent is not None else "not enough sizes measured"
+                    print(f"  ✓ {label}: {measured} ({', '.join(str(n) for n in scaling[name]['sizes']) or 'none'})")
+                    if scaling[name]["wrong_costs"]:
+                        print(f"  ⚠️  {label}: {scaling[name]['wrong_costs']} benchmark queries returned a wrong cost")
+                report(results)
 
         except Exception as e:
             results["errors"].append(f"Performance testing error: {str(e)}")
             print(f"  ❌ Performance testing failed: {str(e)}")
             # traceback.print_exc()
 
-        # Check for code quality flags
-        print("\nChecking code quality flags...")
-        results["flags"].extend(self.check_code_flags(repo_dir))
+        return True
 
-        # Calculate automated score
-        results["automated_score"] = self.calculate_score(results)
+    def prepare_reference(self, repo_dir, results):
+        """
+        Reference numbers for steps 2-6, computed by the grader process
 
-        print(f"\n{'=' * 60}")
-        print(f"Automated Score: {results['automated_score']}/{results['max_automated_score']} points")
-        print(f"{'=' * 60}")
+        They are built here rather than in the sandbox so they neither use the
+        student's time and memory budget nor count as the student's errors:
+        a failure only adds a warning flag and leaves that part out.
 
-        return results
+        Returns:
+            tuple: (generated, baseline), either may be None -
+                {(start, end): expected_cost} for the generated queries and
+                {(start, end): reference nodes explored} for the performance table
+        """
+        # Reference graph on the same CSVs the student's graph is loaded from
+        try:
+            reference_graph = self.load_reference_graph(repo_dir)
+        except Exception as e:
+            print(f"  ⚠️  Could not load the reference graph: {str(e)}")
+            return None, None
+
+        generated = None
+        if self.random_queries:
+            try:
+                generated = self.generate_queries(reference_graph)
+            except Exception as e:
+                # Grader-side failure in an optional check: not the student's fault
+                results["flags"].append({"type": "warning", "message": f"Query generation error: {str(e)}"})
+                print(f"  ⚠️  Could not generate reference queries: {str(e)}")
+
+        # Without landmarks the baseline just has no ALT column
+        landmarks = None
+        try:
+            landmarks = self.reference_landmarks(reference_graph)
+        except Exception as e:
+            results["flags"].append({"type": "warning", "message": f"ALT landmark error: {str(e)}"})
+            print(f"  ⚠️  Could not build the ALT landmarks: {str(e)}")
+
+        baseline = None
+        try:
+            baseline = self.reference_baseline(reference_graph, landmarks)
+        except Exception as e:
+            results["flags"].append({"type": "warning", "message": f"Reference baseline error: {str(e)}"})
+            print(f"  ⚠️  Could not compute the reference baseline: {str(e)}")
+
+        return generated, baseline
+
+    @staticmethod
+    def load_reference_graph(repo_dir):
+        """Reference Graph built from the same nodes.csv/edges.csv the student's graph was loaded from"""
+        graph = ReferenceGraph()
+        graph.load_from_csv(os.path.join(repo_dir, "nodes.csv"), os.path.join(repo_dir, "edges.csv"))
+        return graph
+
+    def generate_queries(self, reference_graph):
+        """
+        Seeded random queries with exact costs from the reference oracle
+
+        Returns:
+            dict: {(start, end): expected_cost}
+        """
+        return ReferenceOracle(reference_graph).random_queries(self.random_queries, seed=0)
+
+    def reference_landmarks(self, reference_graph):
+        """
+        ALT landmarks for the reference graph, built once per dataset
+
+        They are kept under the output directory (keyed by the graph's
+        checksum) rather than next to the CSVs, which may sit in a student's
+        checkout, and stay loaded for the next submission on the same map.
+        """
+        checksum = graph_checksum(reference_graph)
+        if checksum not in self._landmarks:
+            path = os.path.join(os.path.abspath(self.output_dir), "landmarks", f"{checksum:08x}.alt")
+            self._landmarks[checksum] = load_or_build_landmarks(reference_graph, path)
+        return self._landmarks[checksum]
+
+    @staticmethod
+    def reference_baseline(reference_graph, landmarks=None):
+        """
+        Bidirectional (and, given landmarks, ALT A*) reference searches, reported
+        next to the student's numbers
 
-    def check_code_flags(self, repo_dir):
+        Returns:
+            dict: {(start, end): dict of nodes explored} for the performance
+                queries whose nodes exist in the reference graph
+        """
+        reverse = reverse_adjacency(reference_graph)
+        baseline = {}
+        for start, end, _ in DijkstraTester.REQUIRED_QUERIES:
+            if start not in reference_graph.nodes or end not in reference_graph.nodes:
+                continue
+            nodes = {
+                "bidirectional_dijkstra_nodes":
+                    bidirectional_dijkstra(reference_graph, start, end, reverse)['nodes_explored'],
+                "bidirectional_astar_nodes":
+                    bidirectional_astar(reference_graph, start, end, reverse)['nodes_explored'],
+            }
+            if landmarks is not None:
+                nodes["alt_astar_nodes"] = reference_astar(reference_graph, start, end,
+                                                           heuristic=landmarks)['nodes_explored']
+            baseline[(start, end)] = nodes
+        return baseline
+
+    def _add_generated(self, tests, summary):
+        """Attach a generated-query batch summary to a Dijkstra/A* section (and score it if enabled)"""
+        tests["generated"] = summary
+        if self.score_random_queries:
+            summary["scored"] = True
+            tests["total_points"] = round(correctness_points(tests), 1)
+
+        label = "scored" if summary["scored"] else "unscored"
+        print(f"  ✓ Generated queries ({label}): {summary['passed']}/{summary['total']} match the reference")
+        latency = summary.get("latency")
+        if latency:
+            print(f"    median {latency['median_ms']:.3f} ms, p95 {latency['p95_ms']:.3f} ms per query, "
+                  f"{summary['timeouts']} timed out")
+
+    def run_code_tests_sandboxed(self, repo_dir, results, generated=None, baseline=None):
+        """
+        Run run_code_tests() in a child process with per-query, CPU and memory limits
+
+        Steps that finished before a timeout or crash keep their results.
+
+        Returns:
+            bool: False if the student's modules could not be loaded
+        """
+        # Same clock the sandbox uses to stop the child
+        deadline = time.monotonic() + self.limits.submission_timeout
+        outcome = run_sandboxed(self._code_tests_entry, (repo_dir, results, deadline, generated, baseline),
+                                self.limits)
+
+        if outcome.status == "ok":
+            completed = outcome.value[1]
+            results.update(outcome.value[0])
+            return completed
+
+        if outcome.value is not None:
+            results.update(outcome.value)
+        message = outcome.message.splitlines()[0] if outcome.message else outcome.status
+        results["errors"].append(f"Sandbox: {message}")
+        print(f"  ❌ Sandbox: {message}")
+        return True
+
+    def _code_tests_entry(self, repo_dir, results, deadline, generated, baseline, report):
+        """Sandbox child entry point: send the filled-in results back with the outcome"""
+        completed = self.run_code_tests(repo_dir, results, report, deadline, generated, baseline)
+        return results, completed
+
+    def check_code_flags(self, repo_dir, scaling=None):
         """Check for informational flags (not scored)"""
         flags = []
 
-        # Check for heapq usage in dijkstra.py
-        try:
-            with open(os.path.join(repo_dir, "dijkstra.py"), 'r') as f:
-                dijkstra_code = f.read()
-                if 'heapq' not in dijkstra_code and 'PriorityQueue' not in dijkstra_code:
-                    flags.append({
-                        "type": "warning",
-                        "message": "No 'heapq' or 'PriorityQueue' import found in dijkstra.py",
-                        "recommendation": "Verify priority queue usage in manual review"
-                    })
-        except:
-            pass
+        # Measured growth from the scaling benchmark beats guessing from imports
+        dijkstra_exponent = scaling["dijkstra"]["exponent"] if scaling else None
+        if dijkstra_exponent is not None and dijkstra_exponent > ScalingBenchmark.SUPERLINEAR_EXPONENT:
+            sizes = scaling["dijkstra"]["sizes"]
+            flags.append({
+                "type": "warning",
+                "message": f"Dijkstra runtime grows as n^{dijkstra_exponent:.2f} "
+                           f"({sizes[0]}-{sizes[-1]} node road networks; heap-based is about n^1)",
+                "recommendation": "Likely a linear-scan priority queue; verify in manual review"
+            })
+
+        # Check for heapq usage in dijkstra.py (only a guess, so skipped when
+        # the benchmark measured the growth)
+        if dijkstra_exponent is None:
+            try:
+                with open(os.path.join(repo_dir, "dijkstra.py"), 'r') as f:
+                    dijkstra_code = f.read()
+                    if 'heapq' not in dijkstra_code and 'PriorityQueue' not in dijkstra_code:
+                        flags.append({
+                            "type": "warning",
+                            "message": "No 'heapq' or 'PriorityQueue' import found in dijkstra.py",
+                            "recommendation": "Verify priority queue usage in manual review"
+                        })
+            except:
+                pass
 
         # Check comment density
         try:
@@ -343,15 +633,18 @@ class Autograder:
             graph_passed = sum(1 for t in results["graph_tests"]["tests"] if t["passed"])
             score += graph_passed * 2.4
 
-        # Dijkstra correctness: 15 points (each test worth 3 points)
+        # Dijkstra correctness: 15 points (each test worth 3 points, scaled by
+        # the generated queries' pass rate when those are scored)
         if "dijkstra_tests" in results and "tests" in results["dijkstra_tests"]:
-            dijkstra_passed = sum(1 for t in results["dijkstra_tests"]["tests"] if t["passed"])
-            score += dijkstra_passed * 3
+            score += correctness_points(results["dijkstra_tests"])
 
-        # A* correctness: 15 points (each test worth 3 points)
+        # A* correctness: 15 points (same rule)
         if "astar_tests" in results and "tests" in results["astar_tests"]:
-            astar_passed = sum(1 for t in results["astar_tests"]["tests"] if t["passed"])
-            score += astar_passed * 3
+            score += correctness_points(results["astar_tests"])
+
+        # Generated-query latency is reported but deliberately not scored: it
+        # depends on the grading machine and on --jobs. Slow queries only cost
+        # points by exceeding --query-timeout, which fails them above.
 
         # Performance tracking: 5 points
         if "performance_tests" in results and results["performance_tests"].get("tracking_works", False):
@@ -393,27 +686,193 @@ class Autograder:
         print(f"Directory: {repo_path}")
         print(f"{'=' * 60}")
 
+        self.prepare_benchmark()
+
         # Run tests on this directory
-        results = self.run_tests_on_submission(str(repo_path), student_name)
+        results, reused = self.test_or_reuse(str(repo_path), student_name)
         results["repo_url"] = f"Local: {repo_path}"
 
-        # Generate PDF report
-        print(f"\nGenerating PDF report...")
+        self.write_reports(results, student_name, reuse_pdf=reused)
+
+        self.results.append(results)
+
+        return results
+
+    def prepare_benchmark(self):
+        """Generate the scaling benchmark networks before any submission is timed"""
+        if self.benchmark_budget:
+            prepare_datasets(dataset_root(self.output_dir))
+
+    def test_or_reuse(self, repo_dir, student_name):
+        """
+        Run the tests on a submission, or reuse stored results if its inputs are unchanged
+
+        The input hash is always stored in the results so a later --incremental
+        run can recognise them.
+
+        Returns:
+            tuple: (results, reused)
+        """
+        options = {"benchmark_budget": self.benchmark_budget, "random_queries": self.random_queries,
+                   "score_random_queries": self.score_random_queries and bool(self.random_queries)}
+        options = {name: value for name, value in options.items() if value}
+        # A query that timed out or ran out of memory under one set of limits
+        # (or outside the sandbox) may pass under another
+        options.update(self.limits._asdict(), sandbox=self.sandbox)
+        input_hash = compute_input_hash(repo_dir, self.dataset_dir, options)
+
+        if self.result_cache:
+            cached = self.result_cache.lookup(student_name, input_hash)
+            if cached is not None:
+                print(f"\n  ✓ {student_name}: graded inputs unchanged, reusing previous results")
+                return cached, True
+
+        results = self.run_tests_on_submission(repo_dir, student_name)
+        results["input_hash"] = input_hash
+        return results, False
+
+    def write_reports(self, results, student_name, reuse_pdf=False):
+        """Write the PDF report and JSON results (an existing PDF is kept when reuse_pdf is set)"""
         pdf_path = os.path.join(self.output_dir, f"{student_name.replace(' ', '_')}_report.pdf")
-        generate_pdf_report(results, pdf_path)
-        print(f"  ✓ Report saved: {pdf_path}")
+        if reuse_pdf and os.path.exists(pdf_path):
+            print(f"  ✓ Report unchanged: {pdf_path}")
+        else:
+            # Generate PDF report
+            print(f"\nGenerating PDF report...")
+            generate_pdf_report(results, pdf_path)
+            print(f"  ✓ Report saved: {pdf_path}")
 
         # Save JSON results
         json_path = os.path.join(self.output_dir, f"{student_name.replace(' ', '_')}_results.json")
         with open(json_path, 'w') as f:
             json.dump(results, f, indent=2)
 
-        self.results.append(results)
+    def read_submissions(self):
+        """
+        Read and parse the submissions file
 
-        return results
+        Returns:
+            list: Submission tuples in file order (malformed lines are reported and skipped)
+        """
+        with open(self.submissions_file, 'r') as f:
+            lines = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+        submissions = []
+        for index, submission_line in enumerate(lines, 1):
+            parts = submission_line.split(',')
+            if len(parts) != 2:
+                print(f"Error: Invalid format in line: {submission_line}")
+                continue
+            submissions.append(Submission(index, parts[0].strip(), parts[1].strip()))
+
+        return submissions
+
+    def checkout_submission(self, submission):
+        """
+        Shallow-clone one submission (runs in the prefetch stage)
+
+        Uses the clone cache when one is configured, otherwise a fresh temp directory.
+
+        Returns:
+            tuple: (repo_dir, success, message)
+        """
+        if self._uses_clone_cache(submission):
+            repo_dir, success, message = self.clone_cache.checkout(submission.repo_url)
+        else:
+            repo_dir = tempfile.mkdtemp(prefix=f"cs2500_{submission.student_name}_")
+            success, message = self.clone_repository(submission.repo_url, repo_dir, shallow=True)
+
+        if success:
+            print(f"  ✓ Cloned {submission.student_name}")
+        else:
+            print(f"  ❌ Clone failed for {submission.student_name}")
+        return repo_dir, success, message
+
+    def _uses_clone_cache(self, submission):
+        """
+        Whether a submission is checked out in the clone cache.
+
+        A URL listed more than once only uses the cache for its first
+        submission; the others get temp clones, so two prefetch threads (or
+        two graders) never work in the same cached checkout.
+        """
+        if not self.clone_cache:
+            return False
+        return self._cache_owners.get(submission.repo_url, submission.index) == submission.index
+
+    def grade_checkout(self, checkout, total):
+        """
+        Test and report on one prefetched checkout
+
+        Args:
+            checkout: Checkout produced by the prefetch stage
+            total: Total number of submissions (for progress output)
+
+        Returns:
+            dict: Grading results, or None if the submission could not be processed
+        """
+        submission = checkout.submission
+        student_name = submission.student_name
+        repo_url = submission.repo_url
+
+        print(f"\n\n{'#' * 60}")
+        print(f"Processing submission {submission.index}/{total}")
+        print(f"{'#' * 60}")
+
+        try:
+            reused = False
+            if not checkout.success:
+                print(f"  ❌ {checkout.message}")
+                results = {
+                    "student_name": student_name,
+                    "repo_url": repo_url,
+                    "errors": [checkout.message],
+                    "automated_score": 0,
+                    "max_automated_score": 52
+                }
+            else:
+                print(f"  ✓ {checkout.message}")
+
+                # Record the graded commit before tests touch the checkout
+                commit_sha = CloneCache.head_commit(checkout.repo_dir)
+
+                # Run tests
+                results, reused = self.test_or_reuse(checkout.repo_dir, student_name)
+                results["repo_url"] = repo_url
+                results["commit_sha"] = commit_sha
+
+            self.write_reports(results, student_name, reuse_pdf=reused)
+
+            return results
+
+        except Exception as e:
+            print(f"Error processing submission: {str(e)}")
+            traceback.print_exc()
+            return None
+
+        finally:
+            # Cleanup (cached checkouts are kept for the next run)
+            try:
+                if checkout.repo_dir and not self._uses_clone_cache(submission):
+                    shutil.rmtree(checkout.repo_dir)
+            except:
+                pass
+
+    def grade_all_submissions(self, jobs=1, clone_workers=4, prefetch=8):
+        """
+        Grade all submissions from the submissions file
+
+        Cloning runs as a separate prefetch stage: up to `clone_workers` shallow
+        clones run at once, and at most `prefetch` finished checkouts wait on
+        disk for the grading stage.
 
-    def grade_all_submissions(self):
-        """Grade all submissions from the submissions file"""
+        Args:
+            jobs: Number of worker processes. With jobs > 1 every submission is
+                graded in its own worker process; results are still merged in
+                submission-file order so the summary is identical to a serial run.
+            clone_workers: Number of concurrent git clones
+            prefetch: Maximum number of cloned-but-ungraded checkouts
+        """
 
         # Read submissions
         if not os.path.exists(self.submissions_file):
@@ -422,76 +881,77 @@ class Autograder:
             print("StudentName,https://github.com/username/repo")
             return
 
-        with open(self.submissions_file, 'r') as f:
-            submissions = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        submissions = self.read_submissions()
+        total = len(submissions)
 
-        print(f"Found {len(submissions)} submissions to grade")
+        # First submission of each URL owns its clone cache entry
+        self._cache_owners = {}
+        for submission in submissions:
+            self._cache_owners.setdefault(submission.repo_url, submission.index)
 
-        # Process each submission
-        for i, submission_line in enumerate(submissions, 1):
-            print(f"\n\n{'#' * 60}")
-            print(f"Processing submission {i}/{len(submissions)}")
-            print(f"{'#' * 60}")
+        print(f"Found {total} submissions to grade")
 
-            try:
-                # Parse submission line
-                parts = submission_line.split(',')
-                if len(parts) != 2:
-                    print(f"Error: Invalid format in line: {submission_line}")
-                    continue
-
-                student_name = parts[0].strip()
-                repo_url = parts[1].strip()
-
-                # Create temp directory for this submission
-                temp_dir = tempfile.mkdtemp(prefix=f"cs2500_{student_name}_")
-
-                # Clone repository
-                print(f"\nCloning repository...")
-                success, message = self.clone_repository(repo_url, temp_dir)
-
-                if not success:
-                    print(f"  ❌ {message}")
-                    results = {
-                        "student_name": student_name,
-                        "repo_url": repo_url,
-                        "errors": [message],
-                        "automated_score": 0,
-                        "max_automated_score": 52
-                    }
-                else:
-                    print(f"  ✓ Repository cloned")
-
-                    # Run tests
-                    results = self.run_tests_on_submission(temp_dir, student_name)
-                    results["repo_url"] = repo_url
-
-                # Generate PDF report
-                print(f"\nGenerating PDF report...")
-                pdf_path = os.path.join(self.output_dir, f"{student_name.replace(' ', '_')}_report.pdf")
-                generate_pdf_report(results, pdf_path)
-                print(f"  ✓ Report saved: {pdf_path}")
-
-                # Save JSON results
-                json_path = os.path.join(self.output_dir, f"{student_name.replace(' ', '_')}_results.json")
-                with open(json_path, 'w') as f:
-                    json.dump(results, f, indent=2)
+        self.prepare_benchmark()
 
-                self.results.append(results)
+        # Sandbox children started while the prefetch threads run come from
+        # the fork server too, so give it the grader runtime up front
+        configure_forkserver([type(self).__module__])
 
-                # Cleanup
-                try:
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
+        prefetcher = ClonePrefetcher(self.checkout_submission, concurrency=clone_workers, max_ready=prefetch)
+        checkouts = prefetcher.prefetch(submissions)
 
-            except Exception as e:
-                print(f"Error processing submission: {str(e)}")
-                traceback.print_exc()
+        if jobs > 1 and total > 1:
+            graded = self._grade_in_parallel(checkouts, total, jobs)
+        else:
+            graded = {checkout.submission.index: self.grade_checkout(checkout, total) for checkout in checkouts}
+
+        # Merge in file order, regardless of completion order
+        for submission in submissions:
+            results = graded.get(submission.index)
+            if results is not None:
+                self.results.append(results)
+                if self._uses_clone_cache(submission):
+                    self.clone_cache.record_graded(submission.repo_url, results.get("commit_sha"))
 
         # Generate summary
         self.generate_summary()
 
+    def _grade_in_parallel(self, checkouts, total, jobs):
+        """Grade prefetched checkouts across a process pool, keyed by submission index"""
+        workers = min(jobs, total)
+        graded = {}
+
+        print(f"Grading with {workers} worker processes")
+
+        # Warm workers come from a fork server with the grader runtime preloaded
+        # (never fork()ed from this process: the prefetch stage's clone threads
+        # may hold locks, e.g. on stdout) and are replaced every recycle_after
+        # submissions to cap memory growth
+        with create_worker_pool(workers, self.recycle_after, extra_modules=[type(self).__module__]) as pool:
+            futures = {}
+
+            for checkout in checkouts:
+                # Keep the pipeline bounded: wait for a free worker before
+                # taking the next checkout off the prefetch queue
+                if len(futures) >= workers:
+                    self._collect_finished(futures, graded, FIRST_COMPLETED)
+                futures[pool.submit(self.grade_checkout, checkout, total)] = checkout.submission.index
+
+            self._collect_finished(futures, graded, ALL_COMPLETED)
+
+        return graded
+
+    @staticmethod
+    def _collect_finished(futures, graded, return_when):
+        """Move finished futures into the graded dict"""
+        done, _ = wait(futures, return_when=return_when)
+        for future in done:
+            index = futures.pop(future)
+            try:
+                graded[index] = future.result()
+            except Exception as e:
+                print(f"Error in worker for submission {index}: {str(e)}")
+
     def generate_summary(self):
         """Generate a summary of all grading results"""
         print(f"\n\n{'=' * 60}")
@@ -551,6 +1011,9 @@ Examples:
 
   # Grade with shared dataset for all students
   python autograder.py -s submissions.txt -o reports --dataset ~/cs2500-data
+
+  # Grade a large class using 8 worker processes
+  python autograder.py -s submissions.txt -o reports --jobs 8
         """
     )
 
@@ -588,6 +1051,100 @@ Examples:
         help='Path to directory containing nodes.csv and edges.csv (if not in student repos)'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of submissions to grade in parallel worker processes (batch mode, default: 1)'
+    )
+
+    parser.add_argument(
+        '--recycle-after',
+        type=int,
+        default=DEFAULT_RECYCLE_AFTER,
+        help=f'Replace each parallel worker after this many submissions (default: {DEFAULT_RECYCLE_AFTER}, 0 = never)'
+    )
+
+    parser.add_argument(
+        '--clone-workers',
+        type=int,
+        default=4,
+        help='Number of repositories to clone concurrently (batch mode, default: 4)'
+    )
+
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=8,
+        help='Maximum number of cloned checkouts waiting to be graded (batch mode, default: 8)'
+    )
+
+    parser.add_argument(
+        '--clone-cache',
+        type=str,
+        help='Directory for persistent student checkouts; re-runs fetch updates instead of re-cloning (batch mode)'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Reuse results from the output directory for submissions whose graded inputs have not changed'
+    )
+
+    parser.add_argument(
+        '--no-sandbox',
+        action='store_true',
+        help='Run student code inside the grader process instead of a resource-limited child process'
+    )
+
+    parser.add_argument(
+        '--query-timeout',
+        type=float,
+        default=DEFAULT_LIMITS.query_timeout,
+        help=f'Wall-clock/CPU seconds allowed per search query (default: {DEFAULT_LIMITS.query_timeout})'
+    )
+
+    parser.add_argument(
+        '--submission-timeout',
+        type=float,
+        default=DEFAULT_LIMITS.submission_timeout,
+        help=f'Seconds allowed for all tests of one submission (default: {DEFAULT_LIMITS.submission_timeout})'
+    )
+
+    parser.add_argument(
+        '--memory-limit',
+        type=int,
+        default=DEFAULT_LIMITS.memory_mb,
+        help=f'Memory (MB) student code may allocate in the sandbox (default: {DEFAULT_LIMITS.memory_mb})'
+    )
+
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='Also time student searches on 1k-64k node road networks and fit their growth exponent'
+    )
+
+    parser.add_argument(
+        '--benchmark-budget',
+        type=float,
+        default=DEFAULT_BUDGET,
+        help=f'Seconds the scaling benchmark may use per submission (default: {DEFAULT_BUDGET})'
+    )
+
+    parser.add_argument(
+        '--random-queries',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Also check N seeded random queries against the reference oracle (unscored, default: 0)'
+    )
+
+    parser.add_argument(
+        '--score-random-queries',
+        action='store_true',
+        help='Count the --random-queries results towards the Dijkstra and A* correctness points'
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -602,6 +1159,11 @@ def main():
 
     # Parse arguments
     args = parse_arguments()
+    limits = SandboxLimits(
+        query_timeout=args.query_timeout,
+        memory_mb=args.memory_limit,
+        submission_timeout=args.submission_timeout
+    )
 
     print("""
 ╔══════════════════════════════════════════════════════════╗
@@ -627,7 +1189,13 @@ def main():
             autograder = Autograder(
                 submissions_file=None,
                 output_dir=args.output,
-                dataset_dir=args.dataset
+                dataset_dir=args.dataset,
+                incremental=args.incremental,
+                sandbox=not args.no_sandbox,
+                limits=limits,
+                benchmark_budget=args.benchmark_budget if args.benchmark else None,
+                random_queries=args.random_queries,
+                score_random_queries=args.score_random_queries
             )
 
             # Grade single directory
@@ -655,6 +1223,14 @@ def main():
         print(f"  Output directory: {os.path.abspath(args.output)}")
         if args.dataset:
             print(f"  Dataset: {os.path.abspath(args.dataset)}")
+        print(f"  Parallel jobs: {args.jobs}")
+        print(f"  Concurrent clones: {args.clone_workers}")
+        if args.clone_cache:
+            print(f"  Clone cache: {os.path.abspath(args.clone_cache)}")
+        if args.incremental:
+            print(f"  Incremental: reusing results for unchanged submissions")
+        if args.benchmark:
+            print(f"  Scaling benchmark: {args.benchmark_budget}s per submission")
         print()
 
         try:
@@ -662,11 +1238,23 @@ def main():
             autograder = Autograder(
                 submissions_file=args.submissions,
                 output_dir=args.output,
-                dataset_dir=args.dataset
+                dataset_dir=args.dataset,
+                clone_cache_dir=args.clone_cache,
+                incremental=args.incremental,
+                sandbox=not args.no_sandbox,
+                limits=limits,
+                recycle_after=args.recycle_after,
+                benchmark_budget=args.benchmark_budget if args.benchmark else None,
+                random_queries=args.random_queries,
+                score_random_queries=args.score_random_queries
             )
 
             # Grade all submissions
-            autograder.grade_all_submissions()
+            autograder.grade_all_submissions(
+                jobs=args.jobs,
+                clone_workers=args.clone_workers,
+                prefetch=args.prefetch
+            )
 
             print("\n" + "=" * 60)
             print("GRADING COMPLETE!")
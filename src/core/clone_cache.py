@@ -0,0 +1,175 @@
+"""
+Persistent Clone Cache for CS 2500 Autograder
+Keeps one checkout per repository URL between grading runs
+"""
+
+import os
+import re
+import json
+import hashlib
+import shutil
+import subprocess
+import threading
+
+
+class CloneCache:
+    """
+    Local cache of student checkouts, keyed by repository URL.
+
+    The first run clones each repository (shallow) into the cache directory.
+    Later runs update the existing checkout with `git fetch` + `git reset`
+    instead of downloading it again. The commit that was last graded for each
+    URL is recorded in manifest.json, so an unchanged repository can be
+    detected with a single `git ls-remote` round trip.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, cache_dir, timeout=60):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.manifest = self._load_manifest()
+
+    def path_for(self, repo_url):
+        """Checkout directory for a repository URL"""
+        digest = hashlib.sha1(repo_url.encode("utf-8")).hexdigest()[:12]
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", repo_url.rstrip("/").split("/")[-1])
+        if name.endswith(".git"):
+            name = name[:-4]
+        return os.path.join(self.cache_dir, f"{name}-{digest}")
+
+    def checkout(self, repo_url):
+        """
+        Bring the cached checkout of a repository up to date.
+
+        Args:
+            repo_url: Repository URL (anything `git clone` accepts)
+
+        Returns:
+            tuple: (repo_dir, success, message)
+        """
+        repo_dir = self.path_for(repo_url)
+
+        if not os.path.isdir(os.path.join(repo_dir, ".git")):
+            return repo_dir, *self._clone(repo_url, repo_dir)
+
+        graded = self.graded_commit(repo_url)
+        if graded and graded == self.remote_head(repo_url) and graded == self.head_commit(repo_dir, self.timeout):
+            # Nothing new upstream: just undo whatever the last grading run wrote
+            ok, message = self._git(repo_dir, ["reset", "--hard", "-q", "HEAD"], ["clean", "-fdxq"])
+            if ok:
+                return repo_dir, True, f"Repository unchanged since graded commit {graded[:10]}"
+            return repo_dir, False, message
+
+        ok, message = self._git(
+            repo_dir,
+            ["fetch", "--depth", "1", "-q", "origin"],
+            ["reset", "--hard", "-q", "FETCH_HEAD"],
+            ["clean", "-fdxq"],
+        )
+        if ok:
+            return repo_dir, True, "Cached repository updated"
+
+        # A broken cache entry should never block grading: start over
+        return repo_dir, *self._clone(repo_url, repo_dir)
+
+    @staticmethod
+    def head_commit(repo_dir, timeout=60):
+        """SHA of the commit checked out in repo_dir, or None"""
+        try:
+            result = subprocess.run(
+                ["git", "-C", repo_dir, "rev-parse", "HEAD"],
+                capture_output=True, text=True, timeout=timeout
+            )
+            return result.stdout.strip() if result.returncode == 0 else None
+        except Exception:
+            return None
+
+    def remote_head(self, repo_url):
+        """SHA of the remote default branch, without fetching any objects"""
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", repo_url, "HEAD"],
+                capture_output=True, text=True, timeout=self.timeout
+            )
+            if result.returncode != 0 or not result.stdout.strip():
+                return None
+            return result.stdout.split()[0]
+        except Exception:
+            return None
+
+    def graded_commit(self, repo_url):
+        """SHA recorded by the last record_graded() call for this URL"""
+        with self._lock:
+            return self.manifest.get(repo_url, {}).get("graded_commit")
+
+    def record_graded(self, repo_url, commit):
+        """Remember which commit of a repository was graded, and persist the manifest"""
+        if not commit:
+            return
+        with self._lock:
+            self.manifest[repo_url] = {
+                "path": os.path.basename(self.path_for(repo_url)),
+                "graded_commit": commit,
+            }
+            self._save_manifest()
+
+    def __getstate__(self):
+        # Locks cannot be pickled; worker processes only need the paths
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _clone(self, repo_url, repo_dir):
+        """Fresh shallow clone into repo_dir"""
+        if os.path.exists(repo_dir):
+            shutil.rmtree(repo_dir, ignore_errors=True)
+        try:
+            result = subprocess.run(
+                ["git", "clone", "--depth", "1", "--single-branch", repo_url, repo_dir],
+                capture_output=True, text=True, timeout=self.timeout
+            )
+            if result.returncode != 0:
+                return False, f"Git clone failed: {result.stderr}"
+            return True, "Repository cloned successfully"
+        except subprocess.TimeoutExpired:
+            return False, f"Git clone timeout ({self.timeout}s)"
+        except Exception as e:
+            return False, f"Git clone error: {str(e)}"
+
+    def _git(self, repo_dir, *commands):
+        """Run several git commands in repo_dir, stopping at the first failure"""
+        for args in commands:
+            try:
+                result = subprocess.run(
+                    ["git", "-C", repo_dir] + args,
+                    capture_output=True, text=True, timeout=self.timeout
+                )
+            except subprocess.TimeoutExpired:
+                return False, f"git {args[0]} timeout ({self.timeout}s)"
+            except Exception as e:
+                return False, f"git {args[0]} error: {str(e)}"
+            if result.returncode != 0:
+                return False, f"git {args[0]} failed: {result.stderr}"
+        return True, ""
+
+    def _load_manifest(self):
+        path = os.path.join(self.cache_dir, self.MANIFEST)
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        path = os.path.join(self.cache_dir, self.MANIFEST)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
@@ -0,0 +1,105 @@
+"""
+Repository Prefetch Stage for CS 2500 Autograder
+Clones submission repositories concurrently, ahead of test execution
+"""
+
+import queue
+import threading
+from collections import namedtuple
+
+# One parsed line of the submissions file (index is 1-based file position)
+Submission = namedtuple("Submission", ["index", "student_name", "repo_url"])
+
+# A submission whose clone attempt has finished (successfully or not)
+Checkout = namedtuple("Checkout", ["submission", "repo_dir", "success", "message"])
+
+# Marks the end of the ready queue
+_DONE = object()
+
+
+class ClonePrefetcher:
+    """
+    Clones many repositories at once and hands finished checkouts to the grader.
+
+    Up to `concurrency` clones run in parallel threads (git does the real work
+    in a subprocess, so threads are enough). Finished checkouts wait in a
+    bounded ready queue; when it holds `max_ready` checkouts the clone threads
+    block until the grader takes one, so disk usage stays bounded no matter how
+    far cloning gets ahead of testing.
+    """
+
+    def __init__(self, checkout_func, concurrency=4, max_ready=8):
+        """
+        Args:
+            checkout_func: Callable(submission) -> (repo_dir, success, message)
+            concurrency: Maximum number of clones running at the same time
+            max_ready: Maximum number of finished checkouts waiting to be graded
+        """
+        self.checkout_func = checkout_func
+        self.concurrency = max(1, concurrency)
+        self.max_ready = max(1, max_ready)
+
+    def prefetch(self, submissions):
+        """
+        Clone all submissions, yielding checkouts in completion order.
+
+        Args:
+            submissions: Iterable of Submission tuples
+
+        Yields:
+            Checkout: One per submission, as soon as its clone finishes
+        """
+        pending = queue.Queue()
+        for submission in submissions:
+            pending.put(submission)
+
+        ready = queue.Queue(maxsize=self.max_ready)
+        stop = threading.Event()
+        workers = [
+            threading.Thread(target=self._clone_worker, args=(pending, ready, stop), daemon=True)
+            for _ in range(min(self.concurrency, pending.qsize()))
+        ]
+        remaining = len(workers)
+
+        for worker in workers:
+            worker.start()
+
+        try:
+            while remaining:
+                item = ready.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            # Consumer stopped early: let the clone threads exit
+            stop.set()
+
+    def _clone_worker(self, pending, ready, stop):
+        """Clone submissions from the pending queue until it is empty"""
+        while not stop.is_set():
+            try:
+                submission = pending.get_nowait()
+            except queue.Empty:
+                break
+
+            try:
+                repo_dir, success, message = self.checkout_func(submission)
+            except Exception as e:
+                repo_dir, success, message = None, False, f"Git clone error: {str(e)}"
+
+            if not self._put(ready, Checkout(submission, repo_dir, success, message), stop):
+                return
+
+        self._put(ready, _DONE, stop)
+
+    @staticmethod
+    def _put(ready, item, stop):
+        """Blocking put that gives up once the consumer has gone away"""
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
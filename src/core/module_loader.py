@@ -0,0 +1,139 @@
+"""
+Isolated Module Loading for CS 2500 Autograder
+Gives each submission a private package namespace instead of mutating sys.path
+"""
+
+import os
+import sys
+import itertools
+import importlib
+import importlib.abc
+import importlib.util
+
+_namespace_ids = itertools.count(1)
+
+
+class StudentNamespace:
+    """
+    Private import namespace for one submission.
+
+    The student's files are loaded as submodules of a uniquely named package
+    (e.g. `_cs2500_submission_3.graph`) whose __path__ is the repo directory.
+    While the namespace is open, a meta path finder makes top-level imports
+    inside student code (`from graph import Graph`) resolve to that package's
+    modules, so a submission can never pick up another student's files and
+    sys.path never grows. close() removes every module the submission added.
+
+    Usage:
+        with StudentNamespace(repo_dir) as namespace:
+            graph_module = namespace.load("graph")
+    """
+
+    def __init__(self, repo_dir):
+        self.repo_dir = os.path.abspath(repo_dir)
+        self.package = f"_cs2500_submission_{next(_namespace_ids)}"
+        self._finder = None
+        self._shadowed = {}
+        self._modules_before = set()
+        self._provided = self._scan_repo()
+
+    def _scan_repo(self):
+        """Top-level module and package names the repo provides (computed once)"""
+        provided = set()
+        try:
+            entries = os.listdir(self.repo_dir)
+        except OSError:
+            return provided
+        for entry in entries:
+            if entry.endswith(".py"):
+                provided.add(entry[:-3])
+            elif os.path.isfile(os.path.join(self.repo_dir, entry, "__init__.py")):
+                provided.add(entry)
+        return provided
+
+    def provides(self, name):
+        return name in self._provided
+
+    def open(self):
+        """Register the private package and start redirecting top-level imports"""
+        self._modules_before = set(sys.modules)
+
+        # Stale top-level modules with the same names (e.g. from code that
+        # imported the reference implementation flat) must not win
+        for name in self._provided:
+            if name in sys.modules:
+                self._shadowed[name] = sys.modules.pop(name)
+
+        package = importlib.util.module_from_spec(
+            importlib.util.spec_from_loader(self.package, loader=None, is_package=True)
+        )
+        package.__path__ = [self.repo_dir]
+        sys.modules[self.package] = package
+
+        self._finder = _SubmissionFinder(self)
+        sys.meta_path.insert(0, self._finder)
+        return self
+
+    def load(self, module_name):
+        """Import one of the student's top-level modules into the private package"""
+        return importlib.import_module(f"{self.package}.{module_name}")
+
+    def close(self):
+        """Remove the finder and every module this submission added"""
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+        prefix = self.package + "."
+        for name in list(sys.modules):
+            if name in self._modules_before:
+                continue
+            module = sys.modules[name]
+            if name == self.package or name.startswith(prefix) or self._is_student_module(module):
+                del sys.modules[name]
+
+        sys.modules.update(self._shadowed)
+        self._shadowed = {}
+
+    def _is_student_module(self, module):
+        """True for modules loaded from inside the repo directory"""
+        path = getattr(module, "__file__", None)
+        if not path:
+            return getattr(module, "__name__", "").startswith(self.package)
+        return os.path.abspath(path).startswith(self.repo_dir + os.sep)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class _SubmissionFinder(importlib.abc.MetaPathFinder):
+    """Resolves top-level imports of the student's own modules to the private package"""
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+
+    def find_spec(self, fullname, path=None, target=None):
+        if path is not None or not self.namespace.provides(fullname):
+            return None
+        return importlib.util.spec_from_loader(fullname, _AliasLoader(self.namespace))
+
+
+class _AliasLoader(importlib.abc.Loader):
+    """Hands out the private-package module under its plain top-level name"""
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+
+    def create_module(self, spec):
+        return self.namespace.load(spec.name)
+
+    def exec_module(self, module):
+        # Already executed by load() under its private name
+        pass
@@ -17,6 +17,53 @@ from reportlab.graphics.charts.barcharts import VerticalBarChart
 from datetime import datetime
 
 
+def _chart_value(value):
+    """Bar height for a nodes_explored entry (0 for missing or non-numeric values)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return 0
+
+
+def _format_timing(timing):
+    """'median / p95' in milliseconds for a performance timing entry"""
+    if not timing:
+        return "N/A"
+    return f"{timing['median_ms']:.3f} / {timing['p95_ms']:.3f}"
+
+
+def _format_peak(timing):
+    """Peak allocation of a performance timing entry"""
+    if not timing or timing.get("peak_kb") is None:
+        return "N/A"
+    return f"{timing['peak_kb']:.1f} KB"
+
+
+def _append_generated_summary(elements, generated, styles):
+    """One line (plus latency and a few examples) for the generated-query batch"""
+    if not generated or not generated.get("total"):
+        return
+    label = "scored" if generated.get("scored") else "unscored"
+    elements.append(Paragraph(
+        f"Generated queries ({label}): {generated['passed']}/{generated['total']} "
+        f"({generated['pass_rate'] * 100:.1f}%) match the reference oracle",
+        styles['Normal']
+    ))
+    latency = generated.get("latency")
+    if latency:
+        elements.append(Paragraph(
+            f"Latency per query: median {latency['median_ms']:.3f} ms, p95 {latency['p95_ms']:.3f} ms; "
+            f"{generated.get('timeouts', 0)} timed out",
+            styles['Normal']
+        ))
+    for failure in generated.get("failures", [])[:3]:
+        elements.append(Paragraph(
+            f"• Query {failure['start']}→{failure['end']}: returned {failure['actual_cost']}, "
+            f"expected {failure['expected_cost']:.3f}",
+            styles['Normal']
+        ))
+    elements.append(Spacer(1, 0.2 * inch))
+
+
 def generate_pdf_report(results, output_path):
     """Generate a comprehensive PDF grading report"""
 
@@ -261,6 +308,8 @@ def generate_pdf_report(results, output_path):
         elements.append(dijkstra_table)
         elements.append(Spacer(1, 0.3 * inch))
 
+        _append_generated_summary(elements, dijkstra_tests.get("generated"), styles)
+
     # Section 4: A* Algorithm
     astar_tests = results.get("astar_tests", {})
     if astar_tests:
@@ -296,6 +345,8 @@ def generate_pdf_report(results, output_path):
         elements.append(astar_table)
         elements.append(Spacer(1, 0.3 * inch))
 
+        _append_generated_summary(elements, astar_tests.get("generated"), styles)
+
         # Check for failed tests and show details
         failed_tests = [t for t in astar_tests.get("tests", []) if not t['passed']]
         if failed_tests:
@@ -333,9 +384,9 @@ def generate_pdf_report(results, output_path):
             chart.height = 125
             chart.width = 300
 
-            # Prepare data
-            dijkstra_nodes = [c.get("dijkstra_nodes", 0) or 0 for c in comparisons[:5]]
-            astar_nodes = [c.get("astar_nodes", 0) or 0 for c in comparisons[:5]]
+            # Prepare data (failed/timed-out queries carry an error string instead of a count)
+            dijkstra_nodes = [_chart_value(c.get("dijkstra_nodes")) for c in comparisons[:5]]
+            astar_nodes = [_chart_value(c.get("astar_nodes")) for c in comparisons[:5]]
 
             chart.data = [dijkstra_nodes, astar_nodes]
             chart.categoryAxis.categoryNames = [f"Q{i + 1}" for i in range(len(comparisons[:5]))]
@@ -359,20 +410,38 @@ def generate_pdf_report(results, output_path):
             elements.append(legend_table)
             elements.append(Spacer(1, 0.2 * inch))
 
-        # Performance table
+        # Performance table (plus the reference bidirectional searches, when measured)
+        has_baseline = any("bidirectional_dijkstra_nodes" in c for c in comparisons)
+        has_alt = any("alt_astar_nodes" in c for c in comparisons)
         perf_data = [["Query", "Dijkstra Nodes", "A* Nodes", "A* Improvement"]]
+        if has_baseline:
+            perf_data[0] += ["Ref. Bidir.\nDijkstra", "Ref. Bidir.\nA*"]
+        if has_alt:
+            perf_data[0] += ["Ref. ALT\nA*"]
         for comp in comparisons:
             improvement = comp.get("astar_improvement")
             imp_str = f"{improvement:.1f}%" if improvement is not None else "N/A"
 
-            perf_data.append([
+            row = [
                 comp.get("query", "Unknown"),
                 str(comp.get("dijkstra_nodes", "N/A")),
                 str(comp.get("astar_nodes", "N/A")),
                 imp_str
-            ])
-
-        perf_table = Table(perf_data, colWidths=[2.5 * inch, 1.3 * inch, 1.2 * inch, 1.5 * inch])
+            ]
+            if has_baseline:
+                row += [str(comp.get("bidirectional_dijkstra_nodes", "N/A")),
+                        str(comp.get("bidirectional_astar_nodes", "N/A"))]
+            if has_alt:
+                row.append(str(comp.get("alt_astar_nodes", "N/A")))
+            perf_data.append(row)
+
+        if has_baseline and has_alt:
+            col_widths = [1.6 * inch, 0.95 * inch, 0.7 * inch, 0.95 * inch, 0.75 * inch, 0.75 * inch, 0.75 * inch]
+        elif has_baseline:
+            col_widths = [2.0 * inch, 1.05 * inch, 0.75 * inch, 1.1 * inch, 0.8 * inch, 0.8 * inch]
+        else:
+            col_widths = [2.5 * inch, 1.3 * inch, 1.2 * inch, 1.5 * inch]
+        perf_table = Table(perf_data, colWidths=col_widths)
         perf_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
@@ -389,6 +458,43 @@ def generate_pdf_report(results, output_path):
         elements.append(perf_table)
         elements.append(Spacer(1, 0.2 * inch))
 
+        # Runtime and memory table (median/p95 of repeated, warmed-up runs)
+        if any(c.get("dijkstra_timing") or c.get("astar_timing") for c in comparisons):
+            timing_info = perf_tests.get("timing", {})
+            elements.append(Paragraph(
+                f"<b>Runtime &amp; Memory</b> (median / p95 of up to {timing_info.get('repeats', 'N/A')} runs "
+                f"after {timing_info.get('warmup_runs', 0)} warm-up, outliers removed; peak allocation via tracemalloc)",
+                styles['Normal']
+            ))
+            elements.append(Spacer(1, 0.1 * inch))
+
+            timing_data = [["Query", "Dijkstra ms", "A* ms", "Dijkstra Peak", "A* Peak"]]
+            for comp in comparisons:
+                timing_data.append([
+                    comp.get("query", "Unknown"),
+                    _format_timing(comp.get("dijkstra_timing")),
+                    _format_timing(comp.get("astar_timing")),
+                    _format_peak(comp.get("dijkstra_timing")),
+                    _format_peak(comp.get("astar_timing")),
+                ])
+
+            timing_table = Table(timing_data, colWidths=[2.5 * inch, 1.1 * inch, 1.1 * inch, 0.9 * inch, 0.9 * inch])
+            timing_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 4),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+                ('TOPPADDING', (0, 0), (-1, -1), 4),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ]))
+            elements.append(timing_table)
+            elements.append(Spacer(1, 0.2 * inch))
+
         # Summary
         if perf_tests.get("tracking_works"):
             elements.append(Paragraph("✓ Both algorithms track nodes_explored", styles['Normal']))
@@ -401,6 +507,24 @@ def generate_pdf_report(results, output_path):
                 styles['Normal']
             ))
 
+        # Scaling benchmark (only present with --benchmark)
+        scaling = perf_tests.get("scaling")
+        if scaling:
+            elements.append(Spacer(1, 0.1 * inch))
+            elements.append(Paragraph("<b>Scaling Benchmark</b> (synthetic road networks)", styles['Normal']))
+            for name, label in [("dijkstra", "Dijkstra"), ("astar", "A*")]:
+                entry = scaling.get(name, {})
+                sizes = entry.get("sizes", [])
+                if entry.get("exponent") is not None:
+                    text = f"{label}: time grows as n^{entry['exponent']:.2f} over {sizes[0]:,}-{sizes[-1]:,} nodes"
+                else:
+                    text = f"{label}: not enough sizes measured to fit a growth rate"
+                if entry.get("wrong_costs"):
+                    text += f"; {entry['wrong_costs']} queries returned a wrong cost"
+                if entry.get("stopped"):
+                    text += f" (stopped: {entry['stopped']})"
+                elements.append(Paragraph(text, styles['Normal']))
+
     # Section 6: Informational Flags
     flags = results.get("flags", [])
     if flags:
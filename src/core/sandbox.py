@@ -0,0 +1,263 @@
+"""
+Sandboxed Execution for CS 2500 Autograder
+Runs student code in a child process with time and memory limits
+"""
+
+import os
+import sys
+import time
+import signal
+import threading
+import traceback
+import multiprocessing
+from collections import namedtuple
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, wall-clock budget still applies
+    resource = None
+
+# query_timeout: wall-clock and CPU seconds for one student query
+# memory_mb: extra address space the child may allocate (RLIMIT_AS)
+# submission_timeout: wall-clock/CPU budget for all tests of one submission
+SandboxLimits = namedtuple("SandboxLimits", ["query_timeout", "memory_mb", "submission_timeout"])
+
+DEFAULT_LIMITS = SandboxLimits(query_timeout=10, memory_mb=2048, submission_timeout=300)
+
+# status: "ok", "error", "timeout" or "crashed"
+# value: last progress snapshot (or the final return value when status is "ok")
+SandboxOutcome = namedtuple("SandboxOutcome", ["status", "value", "message"])
+
+
+class QueryTimeout(BaseException):
+    """
+    Raised inside student code when a query runs out of time.
+
+    Derives from BaseException so that `except Exception` blocks in student
+    code cannot swallow it.
+    """
+
+
+@contextmanager
+def time_limit(seconds):
+    """
+    Interrupt the enclosed block after `seconds` of wall-clock or CPU time.
+
+    Uses interval timers, so it only takes effect in the main thread on Unix;
+    elsewhere it is a no-op.
+    """
+    if (not seconds or not hasattr(signal, "setitimer")
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+
+    def _expired(signum, frame):
+        raise QueryTimeout(f"Timeout: query exceeded {seconds}s")
+
+    old_alarm = signal.signal(signal.SIGALRM, _expired)
+    old_prof = signal.signal(signal.SIGPROF, _expired)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    signal.setitimer(signal.ITIMER_PROF, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGALRM, old_alarm)
+        signal.signal(signal.SIGPROF, old_prof)
+
+
+class QueryTimer:
+    """
+    time_limit() for a loop of queries: the signal handlers are installed
+    once for the whole batch, and each query only arms and disarms the
+    interval timers.
+
+    Usage:
+        with QueryTimer(seconds) as timer:
+            for query in queries:
+                timer.arm()
+                try:
+                    run(query)
+                finally:
+                    timer.disarm()
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.enabled = False
+        self._old_handlers = None
+
+    def __enter__(self):
+        self.enabled = bool(self.seconds and hasattr(signal, "setitimer")
+                            and threading.current_thread() is threading.main_thread())
+        if self.enabled:
+            self._old_handlers = (signal.signal(signal.SIGALRM, self._expired),
+                                  signal.signal(signal.SIGPROF, self._expired))
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.enabled:
+            self.disarm()
+            signal.signal(signal.SIGALRM, self._old_handlers[0])
+            signal.signal(signal.SIGPROF, self._old_handlers[1])
+            self.enabled = False
+        return False
+
+    def arm(self):
+        """Start the time limit of one query"""
+        if self.enabled:
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+            signal.setitimer(signal.ITIMER_PROF, self.seconds)
+
+    def disarm(self):
+        """Stop it (the handlers stay installed for the next query)"""
+        if self.enabled:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.setitimer(signal.ITIMER_PROF, 0)
+
+    def _expired(self, signum, frame):
+        raise QueryTimeout(f"Timeout: query exceeded {self.seconds}s")
+
+
+def apply_resource_limits(limits):
+    """Apply RLIMIT_AS and RLIMIT_CPU to the current process (Unix only)"""
+    if resource is None:
+        return
+
+    if limits.memory_mb:
+        # Relative to what is already mapped: the grader runtime itself
+        # (reportlab, numpy, ...) must not count against the student
+        limit = _current_address_space() + limits.memory_mb * 1024 * 1024
+        _set_soft_limit(resource.RLIMIT_AS, limit)
+
+    if limits.submission_timeout:
+        used = resource.getrusage(resource.RUSAGE_SELF)
+        cpu_used = int(used.ru_utime + used.ru_stime) + 1
+        _set_soft_limit(resource.RLIMIT_CPU, cpu_used + int(limits.submission_timeout))
+
+
+def _set_soft_limit(which, value):
+    soft, hard = resource.getrlimit(which)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    try:
+        resource.setrlimit(which, (value, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _current_address_space():
+    """Bytes of virtual memory currently mapped by this process (0 if unknown)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def get_sandbox_context():
+    """
+    Pick the cheapest safe start method for sandbox children.
+
+    fork() is only used from single-threaded processes: forking while other
+    threads (e.g. the clone prefetch stage) hold locks can deadlock the child.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def run_sandboxed(target, args, limits):
+    """
+    Run target(*args, report) in a child process.
+
+    The target receives a `report(snapshot)` callback; every snapshot is sent
+    to the parent immediately, so results gathered before a timeout or crash
+    are not lost. The child is killed once limits.submission_timeout expires.
+
+    Returns:
+        SandboxOutcome
+    """
+    context = get_sandbox_context()
+    parent_conn, child_conn = context.Pipe(duplex=False)
+
+    # Don't let the child inherit (and print again) our buffered output
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    process = context.Process(target=_child_main, args=(child_conn, target, args, limits), daemon=True)
+    process.start()
+    child_conn.close()
+
+    snapshot = None
+    deadline = time.monotonic() + limits.submission_timeout
+    outcome = None
+
+    try:
+        while outcome is None:
+            if not parent_conn.poll(max(0.0, deadline - time.monotonic())):
+                outcome = SandboxOutcome("timeout", snapshot,
+                                         f"Submission exceeded its {limits.submission_timeout}s time budget")
+                break
+            try:
+                kind, payload = parent_conn.recv()
+            except EOFError:
+                outcome = SandboxOutcome("crashed", snapshot, _describe_exit(process))
+                break
+
+            if kind == "progress":
+                snapshot = payload
+            elif kind == "done":
+                outcome = SandboxOutcome("ok", payload, "")
+            else:
+                outcome = SandboxOutcome("error", snapshot, payload)
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        parent_conn.close()
+
+    return outcome
+
+
+def _describe_exit(process):
+    """Human-readable reason for a child that died without reporting back"""
+    process.join(1)
+    code = process.exitcode
+    if code is not None and code < 0:
+        try:
+            name = signal.Signals(-code).name
+        except ValueError:
+            name = f"signal {-code}"
+        if name == "SIGXCPU":
+            return "Student code exceeded the CPU time limit"
+        if name == "SIGKILL":
+            return "Student code was killed (likely out of memory)"
+        return f"Student code crashed ({name})"
+    return f"Student code exited unexpectedly (exit code {code})"
+
+
+def _child_main(conn, target, args, limits):
+    """Entry point of the sandbox child"""
+    apply_resource_limits(limits)
+
+    def report(snapshot):
+        conn.send(("progress", snapshot))
+
+    try:
+        result = target(*args, report)
+        conn.send(("done", result))
+    except MemoryError:
+        conn.send(("error", "Student code exceeded the memory limit"))
+    except BaseException as e:
+        try:
+            conn.send(("error", f"Sandbox error: {str(e)}\n{traceback.format_exc()}"))
+        except Exception:
+            pass
+    finally:
+        conn.close()
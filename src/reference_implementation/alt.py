@@ -0,0 +1,341 @@
+"""
+ALT Landmarks - Reference Implementation
+CS 2500 Extra Credit Project
+
+A* with Landmarks and the Triangle inequality. A few landmark nodes are
+picked and the exact distances from every landmark to every node (forward)
+and from every node to every landmark (backward) are precomputed. For any
+node v and goal t, the triangle inequality gives two lower bounds per
+landmark L:
+
+    d(v, t) >= d(L, t) - d(L, v)
+    d(v, t) >= d(v, L) - d(t, L)
+
+The largest of these is an admissible, consistent heuristic that, unlike
+the straight-line distance, follows the actual roads, so A* settles far
+fewer nodes on road-like graphs whose weights exceed Euclidean distance.
+
+Usage:
+    landmarks = load_or_build(graph, landmarks_path("data/nodes.csv"))
+    result = astar(graph, 1, 14, heuristic=landmarks)
+"""
+
+import os
+import zlib
+import heapq
+import random
+import struct
+import tempfile
+from array import array
+from math import inf
+
+MAGIC = b"CS2500L\x00"
+VERSION = 2
+
+# magic, version, num_nodes, num_landmarks, requested landmarks, graph checksum
+HEADER = struct.Struct("<8sHxxqqqI")
+
+DEFAULT_LANDMARKS = 8
+
+
+class LandmarkIndex:
+    """
+    Landmark distance arrays for one graph, usable as an astar() heuristic.
+
+    forward[k][i] is the distance from landmark k to the node ids[i];
+    backward[k][i] is the distance from ids[i] to landmark k (inf if none).
+    """
+
+    def __init__(self, ids, landmarks, forward, backward, checksum=0, requested=None):
+        """
+        Args:
+            ids: Node ids in index order
+            landmarks: Landmark node ids
+            forward: One array of distances per landmark (landmark -> node)
+            backward: One array of distances per landmark (node -> landmark)
+            checksum (int): graph_checksum() of the graph they were built for
+            requested (int): k passed to build(); small graphs may get fewer landmarks
+        """
+        self.ids = ids
+        self.index = {node_id: i for i, node_id in enumerate(ids)}
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+        self.checksum = checksum
+        self.requested = len(landmarks) if requested is None else requested
+
+    def __repr__(self):
+        return f"ALT({len(self.landmarks)} landmarks)"
+
+    @classmethod
+    def build(cls, graph, num_landmarks=DEFAULT_LANDMARKS, seed=0):
+        """
+        Pick landmarks by farthest selection and compute their distance arrays.
+
+        Each of the k largest (weakly) connected components with an edge
+        gets one landmark first, since farthest selection never reaches a
+        component that has none. Costs 3 full Dijkstra searches per landmark
+        at most.
+
+        Args:
+            graph: Graph object with `nodes` and getNeighbors(node_id)
+            num_landmarks (int): Number of landmarks (k)
+            seed (int): Seed for the first, random pick
+
+        Returns:
+            LandmarkIndex
+        """
+        ids = sorted(graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        outgoing = [[(index[v], w) for v, w in graph.getNeighbors(node_id) if v in index] for node_id in ids]
+        incoming = [[] for _ in ids]
+        for u, edges in enumerate(outgoing):
+            for v, w in edges:
+                incoming[v].append((u, w))
+
+        landmarks, forward, backward = [], [], []
+        if ids:
+            # Seeds: in each of the num_landmarks largest components, the node
+            # farthest from a random one
+            rng = random.Random(seed)
+            seeds = []
+            for component in _components(outgoing, incoming)[:num_landmarks]:
+                start = component[rng.randrange(len(component))]
+                first = _distances(outgoing, start)
+                seeds.append(max(component, key=lambda i: first[i] if first[i] != inf else -1))
+            seeds.reverse()
+
+            # Farthest selection: then repeatedly take the node farthest (in
+            # both directions) from all landmarks so far
+            closeness = array('d', [inf]) * len(ids)
+            candidate = seeds.pop() if seeds else 0
+
+            while len(landmarks) < min(num_landmarks, len(ids)):
+                landmarks.append(ids[candidate])
+                forward.append(_distances(outgoing, candidate))
+                backward.append(_distances(incoming, candidate))
+                for i in range(len(ids)):
+                    spread = min(forward[-1][i], backward[-1][i])
+                    if spread < closeness[i]:
+                        closeness[i] = spread
+                if seeds:
+                    candidate = seeds.pop()
+                    continue
+                candidate = max(range(len(ids)), key=lambda i: closeness[i] if closeness[i] != inf else -1)
+                if closeness[candidate] <= 0:
+                    break  # Every reachable node already is a landmark
+
+        return cls(ids, landmarks, forward, backward, graph_checksum(graph), num_landmarks)
+
+    def for_goal(self, goal):
+        """
+        Heuristic toward one goal: the best triangle-inequality bound.
+
+        Args:
+            goal (int): Goal node ID
+
+        Returns:
+            function: estimate(node_id) -> lower bound on the remaining cost
+        """
+        t = self.index.get(goal)
+        terms = []
+        if t is not None:
+            for forward, backward in zip(self.forward, self.backward):
+                # A landmark that cannot reach t (or that t cannot reach) gives no bound
+                terms.append((forward, forward[t] if forward[t] != inf else None,
+                              backward, backward[t] if backward[t] != inf else None))
+        index = self.index
+
+        def estimate(node_id):
+            v = index.get(node_id)
+            if v is None:
+                return 0
+            best = 0
+            for forward, to_goal, backward, from_goal in terms:
+                if to_goal is not None:
+                    bound = to_goal - forward[v]
+                    if bound > best:
+                        best = bound
+                if from_goal is not None:
+                    bound = backward[v] - from_goal
+                    if bound > best:
+                        best = bound
+            return best
+
+        return estimate
+
+    def save(self, path):
+        """
+        Write the landmark arrays next to the graph (temp file + rename).
+
+        Args:
+            path (str): Destination file, e.g. landmarks_path(nodes_csv)
+
+        Returns:
+            str: path
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=".landmarks_", dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(self.ids), len(self.landmarks), self.requested,
+                                    self.checksum))
+                array('q', self.ids).tofile(f)
+                array('q', self.landmarks).tofile(f)
+                for distances in self.forward + self.backward:
+                    array('d', distances).tofile(f)
+            os.replace(staging, path)
+        finally:
+            if os.path.exists(staging):
+                os.remove(staging)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read landmark arrays written by save().
+
+        Returns:
+            LandmarkIndex
+
+        Raises:
+            ValueError: If the file is not a landmark file of this version
+        """
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path}: not a landmark file")
+            magic, version, num_nodes, num_landmarks, requested, checksum = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a version {VERSION} landmark file")
+            try:
+                ids = _read_array(f, 'q', num_nodes)
+                landmarks = _read_array(f, 'q', num_landmarks)
+                arrays = [_read_array(f, 'd', num_nodes) for _ in range(2 * num_landmarks)]
+            except EOFError:
+                raise ValueError(f"{path}: truncated landmark file")
+        return cls(list(ids), list(landmarks), arrays[:num_landmarks], arrays[num_landmarks:], checksum, requested)
+
+
+def landmarks_path(nodes_path):
+    """Where the landmarks for a dataset live: landmarks.alt next to its nodes.csv"""
+    return os.path.join(os.path.dirname(os.path.abspath(nodes_path)), "landmarks.alt")
+
+
+def load_or_build(graph, path, num_landmarks=DEFAULT_LANDMARKS, seed=0):
+    """
+    Load saved landmarks for this graph, or build and save them.
+
+    Saved landmarks are only reused if their checksum matches the graph and
+    they were built for the same k (they may hold fewer landmarks than k on
+    a small graph).
+
+    Args:
+        graph: Graph object
+        path (str): Landmark file
+        num_landmarks (int): Number of landmarks (k)
+        seed (int): Seed for the first landmark
+
+    Returns:
+        LandmarkIndex
+    """
+    if os.path.exists(path):
+        try:
+            saved = LandmarkIndex.load(path)
+            if saved.checksum == graph_checksum(graph) and saved.requested == num_landmarks:
+                return saved
+        except ValueError:
+            pass  # Rebuilt below
+    built = LandmarkIndex.build(graph, num_landmarks, seed)
+    built.save(path)
+    return built
+
+
+def graph_checksum(graph):
+    """CRC32 of the graph's node ids and edges, to detect stale landmark files"""
+    checksum = 0
+    for node_id in sorted(graph.nodes):
+        neighbors = graph.getNeighbors(node_id)
+        checksum = zlib.crc32(array('q', [node_id, len(neighbors)]).tobytes(), checksum)
+        checksum = zlib.crc32(array('q', [v for v, _ in neighbors]).tobytes(), checksum)
+        checksum = zlib.crc32(array('d', [w for _, w in neighbors]).tobytes(), checksum)
+    return checksum
+
+
+def _distances(adjacency, source):
+    """Single-source Dijkstra over index-based adjacency lists; inf where unreachable"""
+    dist = array('d', [inf]) * len(adjacency)
+    dist[source] = 0.0
+    pq = [(0.0, source)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        for v, w in adjacency[u]:
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+    return dist
+
+
+def _components(outgoing, incoming):
+    """Weakly connected components that have an edge, largest first, as lists of indices"""
+    seen = bytearray(len(outgoing))
+    components = []
+    for root in range(len(outgoing)):
+        if seen[root] or not (outgoing[root] or incoming[root]):
+            continue
+        seen[root] = 1
+        component, stack = [], [root]
+        while stack:
+            u = stack.pop()
+            component.append(u)
+            for v, _ in outgoing[u] + incoming[u]:
+                if not seen[v]:
+                    seen[v] = 1
+                    stack.append(v)
+        components.append(component)
+    components.sort(key=len, reverse=True)
+    return components
+
+
+def _read_array(f, typecode, count):
+    values = array(typecode)
+    values.fromfile(f, count)
+    return values
+
+
+if __name__ == "__main__":
+    """Compare Dijkstra, Euclidean A* and ALT A* on random queries"""
+    import time
+    from astar import astar
+    from workspace import SearchWorkspace
+    from benchmark_support import csv_paths, argument, load_graph, random_queries
+
+    nodes_path, edges_path = csv_paths()
+    num_queries = argument(3, 100, int)
+    output = argument(4, os.path.join(tempfile.gettempdir(), "landmarks.alt"))
+
+    g = load_graph(nodes_path, edges_path)
+
+    started = time.perf_counter()
+    alt = LandmarkIndex.build(g)
+    alt.save(output)
+    print(f"  {len(alt.landmarks)} landmarks built and saved in {(time.perf_counter() - started) * 1000:.1f} ms")
+    started = time.perf_counter()
+    alt = load_or_build(g, output)
+    print(f"  Reloaded in {(time.perf_counter() - started) * 1000:.1f} ms: {output}")
+
+    queries = random_queries(g, num_queries)
+    ws = SearchWorkspace(g)
+    optimal = {(s, t): astar(g, s, t, ws, heuristic="zero")['cost'] for s, t in queries}
+
+    for label, heuristic in [("Dijkstra (zero)", "zero"), ("A* euclidean", "euclidean"), ("A* ALT", alt)]:
+        started = time.perf_counter()
+        results = [(s, t, astar(g, s, t, ws, heuristic=heuristic)) for s, t in queries]
+        elapsed = (time.perf_counter() - started) * 1000
+        explored = sum(r['nodes_explored'] for _, _, r in results)
+        wrong = sum(1 for s, t, r in results if abs(r['cost'] - optimal[(s, t)]) > 1e-9)
+        print(f"  {label:16s} {explored:9d} nodes explored, {elapsed:9.1f} ms, {wrong} wrong costs")
@@ -4,8 +4,91 @@ CS 2500 Extra Credit Project
 """
 
 import heapq
+import time
 from math import inf, sqrt
 
+try:
+    from .priority_queue import make_queue
+except ImportError:
+    from priority_queue import make_queue
+
+OCTILE_DIAGONAL = sqrt(2) - 1
+
+
+def euclidean(dx, dy):
+    """Straight-line distance: admissible whenever no edge is shorter than the line between its ends"""
+    return sqrt(dx ** 2 + dy ** 2)
+
+
+def manhattan(dx, dy):
+    """City-block distance: overestimates diagonal travel, so A* may return longer paths"""
+    return abs(dx) + abs(dy)
+
+
+def octile(dx, dy):
+    """8-direction grid distance: between Euclidean and Manhattan"""
+    dx, dy = abs(dx), abs(dy)
+    return max(dx, dy) + OCTILE_DIAGONAL * min(dx, dy)
+
+
+def zero(dx, dy):
+    """No estimate: A* explores exactly like Dijkstra"""
+    return 0
+
+
+# Heuristics selectable by name; each takes the offset (dx, dy) to the goal
+HEURISTICS = {
+    "euclidean": euclidean,
+    "manhattan": manhattan,
+    "octile": octile,
+    "zero": zero,
+}
+
+
+def resolve_heuristic(heuristic):
+    """
+    Look up a heuristic by name (callables are returned unchanged).
+
+    Args:
+        heuristic: Name from HEURISTICS, or a function h(dx, dy)
+
+    Returns:
+        function: h(dx, dy) -> estimated remaining cost
+    """
+    if callable(heuristic):
+        return heuristic
+    try:
+        return HEURISTICS[heuristic]
+    except KeyError:
+        raise ValueError(f"Unknown heuristic '{heuristic}' (expected one of: {', '.join(HEURISTICS)})")
+
+
+def goal_estimate(graph, heuristic, goal):
+    """
+    Heuristic bound to one goal: estimate(node_id) -> remaining cost.
+
+    Args:
+        graph: Graph object with get_node_coords() method
+        heuristic: Name from HEURISTICS, a function h(dx, dy), or a
+            goal-aware object with for_goal(goal) (e.g. alt.LandmarkIndex)
+        goal (int): Goal node ID
+
+    Returns:
+        function: estimate(node_id)
+    """
+    if hasattr(heuristic, "for_goal"):
+        return heuristic.for_goal(goal)
+
+    h = resolve_heuristic(heuristic)
+    get_coords = graph.get_node_coords
+    goal_x, goal_y = get_coords(goal)
+
+    def estimate(node_id):
+        x, y = get_coords(node_id)
+        return h(goal_x - x, goal_y - y)
+
+    return estimate
+
 
 def heuristic(graph, node, goal):
     """
@@ -27,14 +110,29 @@ def heuristic(graph, node, goal):
     return sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
 
-def astar(graph, start, goal):
+def astar(graph, start, goal, workspace=None, heuristic="euclidean", queue=None):
     """
     Find shortest path using A* search algorithm.
 
+    The goal's coordinates are looked up once per search, each reached
+    node's estimate is computed once, and the default Euclidean estimate is
+    computed inline. Without a workspace only reached nodes are stored; with
+    one, node coordinates come from its flat x/y arrays instead of the graph.
+    Goal-aware heuristics such as ALT landmarks (alt.LandmarkIndex) bound
+    the remaining cost from precomputed distances instead of coordinates.
+
     Args:
         graph: Graph object with getNeighbors(node_id) and get_node_coords(node_id) methods
         start (int): Starting node ID
         goal (int): Goal node ID
+        workspace (SearchWorkspace): Reusable per-node state for this graph;
+            avoids the O(V) setup of a fresh search
+        heuristic: Name from HEURISTICS ("euclidean", "manhattan", "octile",
+            "zero"), a function h(dx, dy), or an object with for_goal(goal)
+        queue: Priority queue backend, a name from priority_queue.QUEUES or
+            an empty queue object; cannot be combined with a workspace.
+            The radix and bucket backends need integer f-values, e.g.
+            heuristic="zero" on priority_queue.integer_weights(graph)
 
     Returns:
         dict: Dictionary containing:
@@ -42,19 +140,37 @@ def astar(graph, start, goal):
             - 'cost': Total cost of the shortest path
             - 'nodes_explored': Number of nodes explored
     """
-    # g(n): actual cost from start to n
-    g = {node_id: inf for node_id in graph.nodes}
-    g[start] = 0
+    if queue is not None:
+        if workspace is not None:
+            raise ValueError("astar() takes a workspace or a queue, not both")
+        return _astar_with_queue(graph, start, goal, heuristic, make_queue(queue))
+    if workspace is not None:
+        return _astar_in_workspace(graph, start, goal, workspace, heuristic)
+
+    # Euclidean (the default) is computed inline; other heuristics go
+    # through goal_estimate()
+    inline = _is_euclidean(heuristic)
+    estimate = None if inline else goal_estimate(graph, heuristic, goal)
+    get_coords = graph.get_node_coords
+    if inline:
+        goal_x, goal_y = get_coords(goal)
+        x, y = get_coords(start)
+        h_start = sqrt((goal_x - x) ** 2 + (goal_y - y) ** 2)
+    else:
+        h_start = estimate(start)
 
-    # f(n) = g(n) + h(n): estimated total cost
-    f = {node_id: inf for node_id in graph.nodes}
-    f[start] = heuristic(graph, start, goal)
+    # g(n): actual cost from start to n, only for nodes reached so far,
+    # so a search costs nothing for the parts of the graph it never touches
+    g = {start: 0}
+
+    # h(n), computed once per reached node rather than once per relaxation
+    h = {start: h_start}
 
     # Track previous nodes for path reconstruction
-    prev = {node_id: None for node_id in graph.nodes}
+    prev = {start: None}
 
     # Priority queue: (f_score, node_id)
-    pq = [(f[start], start)]
+    pq = [(h_start, start)]
 
     # Track visited nodes
     visited = set()
@@ -75,18 +191,27 @@ def astar(graph, start, goal):
             break
 
         # Explore neighbors
+        g_u = g[u]
         for neighbor, weight in graph.getNeighbors(u):
-            tentative_g = g[u] + weight
+            tentative_g = g_u + weight
 
-            if tentative_g < g[neighbor]:
+            if tentative_g < g.get(neighbor, inf):
                 # This path to neighbor is better
                 g[neighbor] = tentative_g
-                f[neighbor] = tentative_g + heuristic(graph, neighbor, goal)
                 prev[neighbor] = u
-                heapq.heappush(pq, (f[neighbor], neighbor))
+                h_v = h.get(neighbor)
+                if h_v is None:
+                    if inline:
+                        x, y = get_coords(neighbor)
+                        dx, dy = goal_x - x, goal_y - y
+                        h_v = sqrt(dx * dx + dy * dy)
+                    else:
+                        h_v = estimate(neighbor)
+                    h[neighbor] = h_v
+                heapq.heappush(pq, (tentative_g + h_v, neighbor))
 
     # Check if path exists
-    if g[goal] == inf:
+    if goal not in visited:
         return {
             'path': [],
             'cost': inf,
@@ -108,6 +233,179 @@ def astar(graph, start, goal):
     }
 
 
+def _astar_in_workspace(graph, start, goal, workspace, heuristic):
+    """astar() on a SearchWorkspace: same search, per-node state in reused arrays"""
+    if start not in workspace.index:
+        # Not in the graph's node table: keep the plain search's behavior
+        return astar(graph, start, goal, heuristic=heuristic)
+
+    generation = workspace.begin(graph)
+    index, g, prev = workspace.index, workspace.dist, workspace.prev
+    reached, closed = workspace.reached, workspace.closed
+
+    # Euclidean is computed inline from the workspace's flat coordinate arrays
+    inline = _is_euclidean(heuristic)
+    if inline:
+        xs, ys = workspace.coordinates()
+        goal_x, goal_y = graph.get_node_coords(goal)
+        estimate = None
+    else:
+        estimate = _workspace_estimate(graph, heuristic, goal, workspace)
+
+    start_index, goal_index = index[start], index[goal]
+    if inline:
+        h_start = sqrt((goal_x - xs[start_index]) ** 2 + (goal_y - ys[start_index]) ** 2)
+    else:
+        h_start = estimate(start_index)
+    pq = [(h_start, start)]
+    g[start_index] = 0
+    prev[start_index] = -1
+    reached[start_index] = generation
+    nodes_explored = 0
+
+    while pq:
+        current_f, u = heapq.heappop(pq)
+        u_index = index[u]
+
+        if closed[u_index] == generation:
+            continue
+
+        closed[u_index] = generation
+        nodes_explored += 1
+
+        if u == goal:
+            break
+
+        g_u = g[u_index]
+        for neighbor, weight in graph.getNeighbors(u):
+            v = index[neighbor]
+            tentative_g = g_u + weight
+
+            if tentative_g < (g[v] if reached[v] == generation else inf):
+                g[v] = tentative_g
+                prev[v] = u_index
+                reached[v] = generation
+                if inline:
+                    dx, dy = goal_x - xs[v], goal_y - ys[v]
+                    heapq.heappush(pq, (tentative_g + sqrt(dx * dx + dy * dy), neighbor))
+                else:
+                    heapq.heappush(pq, (tentative_g + estimate(v), neighbor))
+
+    if reached[goal_index] != generation:
+        return {
+            'path': [],
+            'cost': inf,
+            'nodes_explored': nodes_explored
+        }
+
+    return {
+        'path': workspace.path_to(goal_index),
+        'cost': g[goal_index],
+        'nodes_explored': nodes_explored
+    }
+
+
+def _astar_with_queue(graph, start, goal, heuristic, pq):
+    """astar() on a pluggable priority queue; only reached nodes are stored"""
+    estimate = goal_estimate(graph, heuristic, goal)
+    g = {start: 0}
+    prev = {start: None}
+    closed = set()
+    nodes_explored = 0
+    pq.push(estimate(start), start)
+
+    while pq:
+        current_f, u = pq.pop()
+
+        if u in closed:
+            continue
+
+        closed.add(u)
+        nodes_explored += 1
+
+        if u == goal:
+            break
+
+        g_u = g[u]
+        for neighbor, weight in graph.getNeighbors(u):
+            tentative_g = g_u + weight
+
+            if tentative_g < g.get(neighbor, inf):
+                g[neighbor] = tentative_g
+                prev[neighbor] = u
+                pq.push(tentative_g + estimate(neighbor), neighbor)
+
+    if goal not in closed:
+        return {
+            'path': [],
+            'cost': inf,
+            'nodes_explored': nodes_explored
+        }
+
+    path = []
+    current = goal
+    while current is not None:
+        path.append(current)
+        current = prev[current]
+    path.reverse()
+
+    return {
+        'path': path,
+        'cost': g[goal],
+        'nodes_explored': nodes_explored
+    }
+
+
+def _is_euclidean(heuristic):
+    """True for the default heuristic, which the search loops compute inline"""
+    return heuristic is euclidean or (isinstance(heuristic, str) and heuristic == "euclidean")
+
+
+def _workspace_estimate(graph, heuristic, goal, workspace):
+    """goal_estimate() keyed by workspace index instead of node id"""
+    if hasattr(heuristic, "for_goal"):
+        by_id, ids = heuristic.for_goal(goal), workspace.ids
+        return lambda v: by_id(ids[v])
+
+    h = resolve_heuristic(heuristic)
+    xs, ys = workspace.coordinates()
+    goal_x, goal_y = graph.get_node_coords(goal)
+    return lambda v: h(goal_x - xs[v], goal_y - ys[v])
+
+
+def compare_heuristics(graph, queries, heuristics=None, workspace=None):
+    """
+    Run A* with each heuristic on the same queries.
+
+    Args:
+        graph: Graph object
+        queries: List of (start, goal) tuples
+        heuristics: Names or callables to compare (default: all of HEURISTICS)
+        workspace (SearchWorkspace): Optional reusable workspace for the graph
+
+    Returns:
+        dict: heuristic -> {'nodes_explored', 'time_ms', 'suboptimal'}, where
+            suboptimal counts queries whose cost is above the optimal
+            (zero-heuristic) cost
+    """
+    optimal = {(s, t): astar(graph, s, t, workspace, heuristic="zero")['cost'] for s, t in queries}
+    results = {}
+    for name in heuristics or list(HEURISTICS):
+        nodes_explored, suboptimal = 0, 0
+        started = time.perf_counter()
+        for start, goal in queries:
+            result = astar(graph, start, goal, workspace, heuristic=name)
+            nodes_explored += result['nodes_explored']
+            if result['cost'] > optimal[(start, goal)] + 1e-9:
+                suboptimal += 1
+        results[getattr(name, '__name__', None) or str(name)] = {
+            'nodes_explored': nodes_explored,
+            'time_ms': (time.perf_counter() - started) * 1000,
+            'suboptimal': suboptimal,
+        }
+    return results
+
+
 if __name__ == "__main__":
     """Test A* algorithm"""
     from graph import Graph
@@ -137,4 +435,10 @@ if __name__ == "__main__":
         print(f"  Path: {' → '.join(map(str, result['path']))}")
         print(f"  Cost: {result['cost']}")
         print(f"  Nodes explored: {result['nodes_explored']}")
-        print()
\ No newline at end of file
+        print()
+
+    # Heuristic choice: nodes explored, runtime and optimality on the same queries
+    print("Heuristic comparison:")
+    for name, stats in compare_heuristics(g, queries).items():
+        print(f"  {name:10s} nodes explored {stats['nodes_explored']:5d}, "
+              f"{stats['time_ms']:8.2f} ms, {stats['suboptimal']} suboptimal")
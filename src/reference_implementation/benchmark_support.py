@@ -0,0 +1,69 @@
+"""
+Benchmark Script Support - Reference Implementation
+CS 2500 Extra Credit Project
+
+Command-line scaffolding shared by the `__main__` benchmarks of the
+reference modules. They all take the same leading arguments:
+
+    python <module>.py [nodes.csv [edges.csv [extra arguments...]]]
+
+A lone nodes.csv uses the edges.csv next to it; with no paths, the sample
+dataset in data/ is used.
+"""
+
+import os
+import sys
+import random
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+
+
+def csv_paths(argv=None):
+    """
+    Dataset paths from argv[1] and argv[2].
+
+    Returns:
+        tuple: (nodes_path, edges_path)
+    """
+    argv = sys.argv if argv is None else argv
+    nodes_path = argv[1] if len(argv) > 1 else os.path.join(DATA_DIR, "nodes.csv")
+    default_edges = os.path.join(os.path.dirname(os.path.abspath(nodes_path)), "edges.csv")
+    edges_path = argv[2] if len(argv) > 2 else default_edges
+    return nodes_path, edges_path
+
+
+def argument(index, default, cast=str, argv=None):
+    """argv[index] converted with cast, or default if it was not given"""
+    argv = sys.argv if argv is None else argv
+    return cast(argv[index]) if len(argv) > index else default
+
+
+def load_graph(nodes_path, edges_path, quiet=False):
+    """
+    Load a reference Graph from CSVs and print its size.
+
+    Returns:
+        Graph
+    """
+    try:
+        from .graph import Graph
+    except ImportError:
+        from graph import Graph
+
+    graph = Graph()
+    graph.load_from_csv(nodes_path, edges_path)
+    if not quiet:
+        print(f"Graph loaded: {graph.num_nodes()} nodes, {graph.num_edges()} edges")
+    return graph
+
+
+def random_queries(graph, count, seed=0):
+    """
+    Seeded random (start, goal) pairs of distinct nodes.
+
+    Returns:
+        list: (start, goal) tuples
+    """
+    rng = random.Random(seed)
+    ids = sorted(graph.nodes)
+    return [tuple(rng.sample(ids, 2)) for _ in range(count)]
@@ -0,0 +1,202 @@
+"""
+Bidirectional Search - Reference Implementation
+CS 2500 Extra Credit Project
+
+Searches forward from the start and backward from the goal at the same
+time and stops once the two frontiers prove that no shorter connection
+can exist. On long cross-map queries each side only grows a "ball" of
+about half the radius, so far fewer nodes are settled than by a
+unidirectional search.
+
+Bidirectional A* uses the average potential
+    p(v) = (h(v, goal) - h(v, start)) / 2
+forward and -p(v) backward. Both sides then see the same non-negative
+reduced edge costs, so the Dijkstra stopping rule still holds: stop when
+the smallest forward key plus the smallest backward key reaches the best
+path found so far.
+"""
+
+import heapq
+from math import inf
+
+try:
+    from .astar import resolve_heuristic
+except ImportError:
+    from astar import resolve_heuristic
+
+
+def reverse_adjacency(graph):
+    """
+    Incoming edges of every node, for the backward search.
+
+    Build it once and pass it as `reverse=` when running many queries on
+    the same graph.
+
+    Args:
+        graph: Graph object with `nodes` and getNeighbors(node_id)
+
+    Returns:
+        dict: node_id -> [(source_id, weight), ...]
+    """
+    reverse = {node_id: [] for node_id in graph.nodes}
+    for node_id in graph.nodes:
+        for neighbor, weight in graph.getNeighbors(node_id):
+            reverse.setdefault(neighbor, []).append((node_id, weight))
+    return reverse
+
+
+def bidirectional_dijkstra(graph, start, goal, reverse=None):
+    """
+    Find shortest path with bidirectional Dijkstra.
+
+    Args:
+        graph: Graph object with getNeighbors(node_id) method
+        start (int): Starting node ID
+        goal (int): Goal node ID
+        reverse (dict): reverse_adjacency(graph), built here if omitted
+
+    Returns:
+        dict: Dictionary containing:
+            - 'path': List of node IDs in the shortest path
+            - 'cost': Total cost of the shortest path
+            - 'nodes_explored': Nodes settled by both searches together
+    """
+    return _bidirectional_search(graph, start, goal, reverse, None)
+
+
+def bidirectional_astar(graph, start, goal, reverse=None, heuristic="euclidean"):
+    """
+    Find shortest path with bidirectional A* (average potentials).
+
+    The heuristic must be consistent (e.g. Euclidean distance when no edge
+    is shorter than the straight line between its ends) for the result to
+    be optimal.
+
+    Args:
+        graph: Graph object with getNeighbors(node_id) and get_node_coords(node_id) methods
+        start (int): Starting node ID
+        goal (int): Goal node ID
+        reverse (dict): reverse_adjacency(graph), built here if omitted
+        heuristic: Name from astar.HEURISTICS or a function h(dx, dy)
+
+    Returns:
+        dict: Same keys as bidirectional_dijkstra()
+    """
+    h = resolve_heuristic(heuristic)
+    start_x, start_y = graph.get_node_coords(start)
+    goal_x, goal_y = graph.get_node_coords(goal)
+    potentials = {}
+
+    def potential(node_id):
+        value = potentials.get(node_id)
+        if value is None:
+            x, y = graph.get_node_coords(node_id)
+            value = potentials[node_id] = (h(goal_x - x, goal_y - y) - h(start_x - x, start_y - y)) / 2
+        return value
+
+    return _bidirectional_search(graph, start, goal, reverse, potential)
+
+
+def _bidirectional_search(graph, start, goal, reverse, potential):
+    """
+    Shared search loop. With potential=None the keys are plain distances;
+    otherwise the forward key of v is dist + p(v) and the backward key is
+    dist - p(v).
+    """
+    if start not in graph.nodes or goal not in graph.nodes:
+        return {'path': [], 'cost': inf, 'nodes_explored': 0}
+    if start == goal:
+        return {'path': [start], 'cost': 0, 'nodes_explored': 1}
+    if reverse is None:
+        reverse = reverse_adjacency(graph)
+
+    # Index 0: forward search from start, index 1: backward search from goal
+    dist = ({start: 0}, {goal: 0})
+    parent = ({start: None}, {goal: None})
+    settled = (set(), set())
+    neighbors = (graph.getNeighbors, lambda node_id: reverse.get(node_id, ()))
+    sign = (1, -1)
+    queues = ([(potential(start) if potential else 0, start)],
+              [(-potential(goal) if potential else 0, goal)])
+
+    best_cost, meeting = inf, None
+    nodes_explored = 0
+
+    while queues[0] and queues[1]:
+        # Stopping rule: no connection through unsettled nodes can be shorter
+        if queues[0][0][0] + queues[1][0][0] >= best_cost:
+            break
+
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        _, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        nodes_explored += 1
+
+        own_dist, other_dist = dist[side], dist[1 - side]
+        du = own_dist[u]
+        for v, weight in neighbors[side](u):
+            if v in settled[side]:
+                continue
+            new_dist = du + weight
+            if new_dist < own_dist.get(v, inf):
+                own_dist[v] = new_dist
+                parent[side][v] = u
+                key = new_dist + sign[side] * potential(v) if potential else new_dist
+                heapq.heappush(queues[side], (key, v))
+            if v in other_dist and own_dist[v] + other_dist[v] < best_cost:
+                best_cost = own_dist[v] + other_dist[v]
+                meeting = v
+
+    if meeting is None:
+        return {'path': [], 'cost': inf, 'nodes_explored': nodes_explored}
+
+    # start ... meeting from the forward tree, meeting ... goal from the backward tree
+    path = []
+    current = meeting
+    while current is not None:
+        path.append(current)
+        current = parent[0][current]
+    path.reverse()
+    current = parent[1][meeting]
+    while current is not None:
+        path.append(current)
+        current = parent[1][current]
+
+    return {
+        'path': path,
+        'cost': best_cost,
+        'nodes_explored': nodes_explored
+    }
+
+
+if __name__ == "__main__":
+    """Compare unidirectional and bidirectional searches on random queries"""
+    import time
+    from dijkstra import dijkstra
+    from astar import astar
+    from benchmark_support import csv_paths, argument, load_graph, random_queries
+
+    nodes_path, edges_path = csv_paths()
+    num_queries = argument(3, 100, int)
+
+    g = load_graph(nodes_path, edges_path)
+    reverse = reverse_adjacency(g)
+
+    queries = random_queries(g, num_queries)
+    optimal = {(s, t): dijkstra(g, s, t)['cost'] for s, t in queries}
+
+    searches = [
+        ("Dijkstra", lambda s, t: dijkstra(g, s, t)),
+        ("Bidirectional Dijkstra", lambda s, t: bidirectional_dijkstra(g, s, t, reverse)),
+        ("A*", lambda s, t: astar(g, s, t)),
+        ("Bidirectional A*", lambda s, t: bidirectional_astar(g, s, t, reverse)),
+    ]
+    for name, search in searches:
+        started = time.perf_counter()
+        results = [(s, t, search(s, t)) for s, t in queries]
+        elapsed = (time.perf_counter() - started) * 1000
+        explored = sum(r['nodes_explored'] for _, _, r in results)
+        wrong = sum(1 for s, t, r in results if abs(r['cost'] - optimal[(s, t)]) > 1e-9)
+        print(f"  {name:24s} {explored:9d} nodes explored, {elapsed:9.1f} ms, {wrong} wrong costs")
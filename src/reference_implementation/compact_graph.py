@@ -0,0 +1,373 @@
+"""
+Compact Graph - Array-Backed Reference Implementation
+CS 2500 Extra Credit Project
+
+A read-only graph stored in a handful of contiguous buffers instead of
+Python dicts, lists and tuples:
+
+    offsets[i]..offsets[i + 1]   slice of targets/weights holding node i's edges (CSR)
+    targets, weights             neighbor ids and edge weights
+    xs, ys                       coordinates of node i
+    name_index[i]                index of node i's name in the interned name table
+
+Node ids that form a contiguous range (1..n in every dataset this project
+uses) are not stored at all; anything else falls back to an id array plus
+an id -> index dict. It exposes the same read API as Graph (getNeighbors,
+getEdgeWeight, get_node_coords, get_node_name, nodes, ...), so dijkstra()
+and astar() run on it unchanged.
+"""
+
+import csv
+from array import array
+from collections.abc import Mapping
+
+
+class CompactGraph:
+    """
+    Read-only, CSR-backed graph built once from CSV files (or another graph).
+
+    Usage:
+        g = CompactGraph.from_csv("nodes.csv", "edges.csv")
+        result = dijkstra(g, 1, 14)
+    """
+
+    def __init__(self, offsets, targets, weights, xs, ys, name_index, name_table, name_offsets,
+                 ids=None, id_base=1):
+        """
+        Wrap prebuilt buffers (array.array, memoryview or anything sliceable).
+
+        Args:
+            offsets: n + 1 edge offsets (CSR row pointers)
+            targets: Neighbor node ids, grouped by source node
+            weights: Edge weights, parallel to targets
+            xs, ys: Node coordinates
+            name_index: Per-node index into the name table
+            name_table: All distinct names, concatenated (str, or UTF-8
+                bytes/memoryview as loaded from a snapshot)
+            name_offsets: len(distinct names) + 1 offsets into name_table
+            ids: Node ids in index order, or None when ids are
+                id_base, id_base + 1, ... (no id storage needed)
+            id_base (int): First id of the contiguous range
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.xs = xs
+        self.ys = ys
+        self.name_index = name_index
+        self.name_table = name_table
+        self.name_offsets = name_offsets
+        self.ids = ids
+        self.id_base = id_base
+        self._index = {node_id: i for i, node_id in enumerate(ids)} if ids is not None else None
+        self.nodes = NodeView(self)
+
+    @classmethod
+    def from_csv(cls, nodes_path, edges_path):
+        """
+        Build a CompactGraph from nodes.csv (id,name,x,y) and edges.csv (from,to,weight).
+
+        Args:
+            nodes_path (str): Path to nodes.csv file
+            edges_path (str): Path to edges.csv file
+
+        Returns:
+            CompactGraph
+        """
+        node_ids, xs, ys, name_index = array('q'), array('d'), array('d'), array('l')
+        names = _NameInterner()
+        with open(nodes_path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            for row in reader:
+                if not row:  # Skip empty rows
+                    continue
+                node_ids.append(int(row[0]))
+                name_index.append(names.intern(row[1]))
+                xs.append(float(row[2]))
+                ys.append(float(row[3]))
+
+        sources, targets, weights = array('q'), array('q'), array('d')
+        with open(edges_path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            for row in reader:
+                if not row:  # Skip empty rows
+                    continue
+                sources.append(int(row[0]))
+                targets.append(int(row[1]))
+                weights.append(float(row[2]))
+
+        return cls._build(node_ids, xs, ys, name_index, names, sources, targets, weights)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Build a CompactGraph from any graph with `nodes` and getNeighbors().
+
+        Args:
+            graph: Graph object (e.g. the dict-based reference Graph)
+
+        Returns:
+            CompactGraph
+        """
+        node_ids, xs, ys, name_index = array('q'), array('d'), array('d'), array('l')
+        names = _NameInterner()
+        sources, targets, weights = array('q'), array('q'), array('d')
+        for node_id, (name, (x, y)) in graph.nodes.items():
+            node_ids.append(node_id)
+            name_index.append(names.intern(name))
+            xs.append(float(x))
+            ys.append(float(y))
+            for neighbor, weight in graph.getNeighbors(node_id):
+                sources.append(node_id)
+                targets.append(neighbor)
+                weights.append(float(weight))
+
+        return cls._build(node_ids, xs, ys, name_index, names, sources, targets, weights)
+
+    @classmethod
+    def _build(cls, node_ids, xs, ys, name_index, names, sources, targets, weights):
+        """Sort nodes by id and group edges by source (counting sort, O(V + E))"""
+        order = sorted(range(len(node_ids)), key=node_ids.__getitem__)
+        # A repeated id keeps its last row, like Graph.addNode overwriting it;
+        # the sort is stable, so that is the last of each run of equal ids
+        order = [i for k, i in enumerate(order)
+                 if k + 1 == len(order) or node_ids[order[k + 1]] != node_ids[i]]
+        n = len(order)
+        if n != len(node_ids) or any(order[i] != i for i in range(n)):
+            node_ids = array('q', (node_ids[i] for i in order))
+            xs = array('d', (xs[i] for i in order))
+            ys = array('d', (ys[i] for i in order))
+            name_index = array('l', (name_index[i] for i in order))
+
+        contiguous = n == 0 or node_ids[-1] - node_ids[0] == n - 1
+        id_base = node_ids[0] if n else 1
+        lookup = None if contiguous else {node_id: i for i, node_id in enumerate(node_ids)}
+
+        # Edges whose source is not a known node are dropped, as getNeighbors
+        # could never return them anyway
+        source_index = array('q')
+        counts = array('q', bytes(8 * (n + 1)))
+        for source in sources:
+            if lookup is None:
+                i = source - id_base
+                if not 0 <= i < n:
+                    i = -1
+            else:
+                i = lookup.get(source, -1)
+            source_index.append(i)
+            if i >= 0:
+                counts[i + 1] += 1
+
+        offsets = counts
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        total = offsets[n]
+        grouped_targets = array('q', bytes(8 * total))
+        grouped_weights = array('d', bytes(8 * total))
+        fill = array('q', offsets[:n])
+        for i, target, weight in zip(source_index, targets, weights):
+            if i < 0:
+                continue
+            slot = fill[i]
+            grouped_targets[slot] = target
+            grouped_weights[slot] = weight
+            fill[i] = slot + 1
+
+        name_table, name_offsets = names.table()
+        return cls(offsets, grouped_targets, grouped_weights, xs, ys, name_index, name_table, name_offsets,
+                   ids=None if contiguous else node_ids, id_base=id_base)
+
+    def _index_of(self, node_id):
+        """Dense index of a node id, or None if it is not in the graph"""
+        if self._index is not None:
+            return self._index.get(node_id)
+        i = node_id - self.id_base if isinstance(node_id, int) else -1
+        return i if 0 <= i < len(self.xs) else None
+
+    def _id_of(self, i):
+        return self.ids[i] if self.ids is not None else i + self.id_base
+
+    def getNeighbors(self, node_id):
+        """
+        Get all neighbors of a node.
+
+        Args:
+            node_id (int): Node ID
+
+        Returns:
+            list: List of (neighbor_id, weight) tuples
+        """
+        i = self._index_of(node_id)
+        if i is None:
+            return []
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return list(zip(self.targets[start:end], self.weights[start:end]))
+
+    def getEdgeWeight(self, from_node, to_node):
+        """
+        Get the weight of an edge between two nodes.
+
+        Args:
+            from_node (int): Source node ID
+            to_node (int): Destination node ID
+
+        Returns:
+            float: Edge weight, or None if edge doesn't exist
+        """
+        i = self._index_of(from_node)
+        if i is None:
+            return None
+        for slot in range(self.offsets[i], self.offsets[i + 1]):
+            if self.targets[slot] == to_node:
+                return self.weights[slot]
+        return None
+
+    def num_nodes(self):
+        """Return the number of nodes in the graph"""
+        return len(self.xs)
+
+    def num_edges(self):
+        """Return the number of edges in the graph"""
+        return len(self.targets)
+
+    def has_node(self, node_id):
+        """Check if a node exists in the graph"""
+        return self._index_of(node_id) is not None
+
+    def has_edge(self, from_node, to_node):
+        """Check if an edge exists between two nodes"""
+        return self.getEdgeWeight(from_node, to_node) is not None
+
+    def get_node_coords(self, node_id):
+        """
+        Get the coordinates of a node.
+
+        Args:
+            node_id (int): Node ID
+
+        Returns:
+            tuple: (x, y) coordinates, or None if node doesn't exist
+        """
+        i = self._index_of(node_id)
+        if i is None:
+            return None
+        return self.xs[i], self.ys[i]
+
+    def get_node_name(self, node_id):
+        """
+        Get the name of a node.
+
+        Args:
+            node_id (int): Node ID
+
+        Returns:
+            str: Node name, or None if node doesn't exist
+        """
+        i = self._index_of(node_id)
+        if i is None:
+            return None
+        return self._name_at(i)
+
+    def _name_at(self, i):
+        k = self.name_index[i]
+        name = self.name_table[self.name_offsets[k]:self.name_offsets[k + 1]]
+        return name if isinstance(name, str) else str(name, "utf-8")
+
+    def memory_bytes(self):
+        """Approximate size of the graph's buffers in bytes"""
+        buffers = [self.offsets, self.targets, self.weights, self.xs, self.ys, self.name_index, self.name_offsets]
+        if self.ids is not None:
+            buffers.append(self.ids)
+        size = sum(len(b) * b.itemsize for b in buffers)
+        if isinstance(self.name_table, str):
+            return size + len(self.name_table.encode("utf-8"))
+        return size + len(self.name_table)
+
+
+class NodeView(Mapping):
+    """
+    Read-only `nodes` mapping of a CompactGraph: node_id -> (name, (x, y)).
+
+    Values are built on access, so iterating over ids (as dijkstra and astar
+    do) costs no per-node storage.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, node_id):
+        i = self._graph._index_of(node_id)
+        if i is None:
+            raise KeyError(node_id)
+        return self._graph._name_at(i), (self._graph.xs[i], self._graph.ys[i])
+
+    def __contains__(self, node_id):
+        return self._graph._index_of(node_id) is not None
+
+    def __iter__(self):
+        graph = self._graph
+        if graph.ids is not None:
+            return iter(graph.ids)
+        return iter(range(graph.id_base, graph.id_base + len(graph.xs)))
+
+    def __len__(self):
+        return len(self._graph.xs)
+
+
+class _NameInterner:
+    """Collects distinct names once each, for the concatenated name table"""
+
+    def __init__(self):
+        self._index = {}
+        self._names = []
+
+    def intern(self, name):
+        index = self._index.get(name)
+        if index is None:
+            index = self._index[name] = len(self._names)
+            self._names.append(name)
+        return index
+
+    def table(self):
+        """Returns (concatenated names, offsets array)"""
+        offsets = array('q', [0])
+        for name in self._names:
+            offsets.append(offsets[-1] + len(name))
+        return "".join(self._names), offsets
+
+
+if __name__ == "__main__":
+    """Compare memory and results of Graph and CompactGraph"""
+    import tracemalloc
+    from graph import Graph
+    from dijkstra import dijkstra
+    from astar import astar
+    from benchmark_support import csv_paths
+
+    nodes_path, edges_path = csv_paths()
+
+    tracemalloc.start()
+    g = Graph()
+    g.load_from_csv(nodes_path, edges_path)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    cg = CompactGraph.from_csv(nodes_path, edges_path)
+    compact_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"Graph loaded: {cg.num_nodes()} nodes, {cg.num_edges()} edges")
+    print(f"  Graph:        {dict_bytes / 1024:10.1f} KB ({dict_bytes / max(1, g.num_edges()):.0f} bytes/edge)")
+    print(f"  CompactGraph: {compact_bytes / 1024:10.1f} KB ({compact_bytes / max(1, cg.num_edges()):.0f} bytes/edge)")
+
+    ids = list(cg.nodes)
+    queries = [(ids[0], ids[-1]), (ids[len(ids) // 3], ids[2 * len(ids) // 3])]
+    for start, goal in queries:
+        for name, search in [("Dijkstra", dijkstra), ("A*", astar)]:
+            expected, actual = search(g, start, goal), search(cg, start, goal)
+            same = expected['cost'] == actual['cost'] and expected['path'] == actual['path']
+            print(f"  {name} {start} → {goal}: cost {actual['cost']} ({'matches' if same else 'DIFFERS from'} Graph)")
@@ -0,0 +1,484 @@
+"""
+Contraction Hierarchies - Reference Implementation
+CS 2500 Extra Credit Project
+
+Preprocessing contracts the nodes one at a time, least important first.
+Contracting v removes it from the remaining graph; for every pair u -> v -> w
+whose path through v is the only shortest one (no "witness" path avoids v),
+a shortcut edge u -> w is added so distances between the remaining nodes do
+not change. The contraction order is the node's rank.
+
+A query then only ever climbs: a forward search from the start relaxes edges
+to higher-ranked nodes, a backward search from the goal does the same on
+reversed edges, and the shortest path is the best node where they meet. On
+road networks each side settles a few hundred nodes even on a million-node
+graph. Shortcuts remember the node they skip, so paths are unpacked back to
+original edges.
+
+Usage:
+    ch = load_or_build(graph, hierarchy_path("data/nodes.csv"))
+    result = ch.query(1, 14)  # same dict as dijkstra()
+"""
+
+import os
+import heapq
+import struct
+import tempfile
+from array import array
+from math import inf
+
+try:
+    from .alt import graph_checksum
+except ImportError:
+    from alt import graph_checksum
+
+MAGIC = b"CS2500H\x00"
+VERSION = 1
+
+# magic, version, num_nodes, upward edges, downward edges, shortcuts, graph checksum
+HEADER = struct.Struct("<8sHxxqqqqI")
+
+# Witness searches give up after settling this many nodes. Stopping early
+# only adds shortcuts that were not needed; it never makes a query wrong.
+WITNESS_SETTLE_LIMIT = 64
+
+# Node priorities only estimate the shortcut count, with cheaper searches
+ESTIMATE_SETTLE_LIMIT = 16
+
+
+class ContractionHierarchy:
+    """
+    A contracted graph: node ranks, upward edges and shortcut middles.
+
+    up[i] lists (j, weight) for edges i -> j with rank[j] > rank[i];
+    down[i] lists (j, weight) for edges j -> i with rank[j] > rank[i], the
+    edges the backward search climbs. middle[(i, j)] is the node skipped by
+    shortcut i -> j. All nodes are indices into ids.
+    """
+
+    def __init__(self, ids, rank, up, down, middle, checksum=0):
+        """
+        Args:
+            ids: Node ids in index order
+            rank: Contraction order of each index
+            up: Upward edge lists per index
+            down: Reversed upward edge lists per index
+            middle (dict): (from_index, to_index) -> skipped index
+            checksum (int): graph_checksum() of the graph it was built for
+        """
+        self.ids = ids
+        self.index = {node_id: i for i, node_id in enumerate(ids)}
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self.middle = middle
+        self.checksum = checksum
+
+    def __repr__(self):
+        return f"ContractionHierarchy({len(self.ids)} nodes, {len(self.middle)} shortcuts)"
+
+    @classmethod
+    def build(cls, graph, witness_limit=WITNESS_SETTLE_LIMIT):
+        """
+        Contract every node of the graph.
+
+        Nodes are ordered by edge difference (shortcuts added minus edges
+        removed) plus the number of already contracted neighbors, which
+        spreads contraction evenly over the map. Priorities are updated
+        lazily: a popped node is re-evaluated and put back if it is no
+        longer the cheapest, and the neighbors of each contracted node are
+        re-evaluated right away.
+
+        Args:
+            graph: Graph object with `nodes` and getNeighbors(node_id)
+            witness_limit (int): Settled-node limit of each witness search
+
+        Returns:
+            ContractionHierarchy
+        """
+        ids = sorted(graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        n = len(ids)
+
+        # Remaining graph; parallel edges keep their lightest weight
+        outgoing = [{} for _ in range(n)]
+        incoming = [{} for _ in range(n)]
+        for u, node_id in enumerate(ids):
+            for neighbor, weight in graph.getNeighbors(node_id):
+                v = index.get(neighbor)
+                if v is None or v == u or weight >= outgoing[u].get(v, inf):
+                    continue
+                outgoing[u][v] = weight
+                incoming[v][u] = weight
+
+        rank = [-1] * n
+        up = [None] * n
+        down = [None] * n
+        middle = {}
+        contracted_neighbors = [0] * n
+
+        def priority(v):
+            shortcuts = _shortcuts(outgoing, incoming, v, ESTIMATE_SETTLE_LIMIT)
+            return len(shortcuts) - len(incoming[v]) - len(outgoing[v]) + contracted_neighbors[v]
+
+        queue = [(priority(v), v) for v in range(n)]
+        heapq.heapify(queue)
+
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            if rank[v] != -1:
+                continue
+            # Lazy update: contract v only if it is still the cheapest node
+            current = priority(v)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, cost in _shortcuts(outgoing, incoming, v, witness_limit):
+                if cost < outgoing[u].get(w, inf):
+                    outgoing[u][w] = cost
+                    incoming[w][u] = cost
+                    middle[(u, w)] = v
+
+            # Every neighbor still in the graph is contracted later, so ranks higher
+            up[v] = list(outgoing[v].items())
+            down[v] = list(incoming[v].items())
+            for w in outgoing[v]:
+                del incoming[w][v]
+                contracted_neighbors[w] += 1
+            for u in incoming[v]:
+                del outgoing[u][v]
+                contracted_neighbors[u] += 1
+            neighbors = set(outgoing[v]) | set(incoming[v])
+            outgoing[v], incoming[v] = {}, {}
+            rank[v] = order
+            order += 1
+
+            for u in neighbors:
+                heapq.heappush(queue, (priority(u), u))
+
+        return cls(ids, rank, up, down, middle, graph_checksum(graph))
+
+    def query(self, start, goal):
+        """
+        Shortest path by bidirectional upward search.
+
+        The searches stall nodes that a higher-ranked node already reaches
+        more cheaply (stall-on-demand): their distance cannot be on a
+        shortest path, so their edges are not relaxed.
+
+        Args:
+            start (int): Starting node ID
+            goal (int): Goal node ID
+
+        Returns:
+            dict: Dictionary containing:
+                - 'path': List of node IDs in the shortest path
+                - 'cost': Total cost of the shortest path
+                - 'nodes_explored': Nodes settled by both searches together
+        """
+        s, t = self.index.get(start), self.index.get(goal)
+        if s is None or t is None:
+            return {'path': [], 'cost': inf, 'nodes_explored': 0}
+        if s == t:
+            return {'path': [start], 'cost': 0, 'nodes_explored': 1}
+
+        # Index 0: forward search from start, index 1: backward search from goal
+        dist = ({s: 0}, {t: 0})
+        parent = ({s: -1}, {t: -1})
+        queues = ([(0, s)], [(0, t)])
+        edges = (self.up, self.down)
+        best_cost, meeting = inf, -1
+        nodes_explored = 0
+
+        while True:
+            # A side is done once its smallest key cannot improve the best path
+            forward = queues[0][0][0] if queues[0] else inf
+            backward = queues[1][0][0] if queues[1] else inf
+            if min(forward, backward) >= best_cost:
+                break
+            side = 0 if forward <= backward else 1
+            d, u = heapq.heappop(queues[side])
+            own_dist = dist[side]
+            if d > own_dist[u]:
+                continue
+            nodes_explored += 1
+
+            through = d + dist[1 - side].get(u, inf)
+            if through < best_cost:
+                best_cost, meeting = through, u
+
+            # Stall-on-demand: a higher node reaches u more cheaply from this side
+            if any(own_dist.get(x, inf) + weight < d for x, weight in edges[1 - side][u]):
+                continue
+
+            for v, weight in edges[side][u]:
+                new_dist = d + weight
+                if new_dist < own_dist.get(v, inf):
+                    own_dist[v] = new_dist
+                    parent[side][v] = u
+                    heapq.heappush(queues[side], (new_dist, v))
+
+        if meeting == -1:
+            return {'path': [], 'cost': inf, 'nodes_explored': nodes_explored}
+
+        # start ... meeting climbs the forward tree, meeting ... goal the backward tree
+        hops = []
+        current = meeting
+        while current != -1:
+            hops.append(current)
+            current = parent[0][current]
+        hops.reverse()
+        current = parent[1][meeting]
+        while current != -1:
+            hops.append(current)
+            current = parent[1][current]
+
+        return {
+            'path': [self.ids[i] for i in self.unpack(hops)],
+            'cost': best_cost,
+            'nodes_explored': nodes_explored
+        }
+
+    def unpack(self, hops):
+        """
+        Replace shortcuts by the original edges they stand for.
+
+        Args:
+            hops: Node indices along a path in the hierarchy
+
+        Returns:
+            list: Node indices along the same path in the original graph
+        """
+        if not hops:
+            return []
+        path = [hops[0]]
+        middle = self.middle
+        for a, b in zip(hops, hops[1:]):
+            stack = [(a, b)]
+            while stack:
+                u, w = stack.pop()
+                v = middle.get((u, w))
+                if v is None:
+                    path.append(w)
+                else:
+                    stack.append((v, w))
+                    stack.append((u, v))
+        return path
+
+    def save(self, path):
+        """
+        Write the hierarchy next to the graph (temp file + rename).
+
+        Edge lists are stored in CSR form (offsets, targets, weights) and
+        shortcuts as three parallel arrays.
+
+        Args:
+            path (str): Destination file, e.g. hierarchy_path(nodes_csv)
+
+        Returns:
+            str: path
+        """
+        up = _to_csr(self.up)
+        down = _to_csr(self.down)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=".hierarchy_", dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(self.ids), len(up[1]), len(down[1]),
+                                    len(self.middle), self.checksum))
+                array('q', self.ids).tofile(f)
+                array('q', self.rank).tofile(f)
+                for offsets, targets, weights in (up, down):
+                    offsets.tofile(f)
+                    targets.tofile(f)
+                    weights.tofile(f)
+                for column in zip(*self.middle) if self.middle else ((), ()):
+                    array('q', column).tofile(f)
+                array('q', self.middle.values()).tofile(f)
+            os.replace(staging, path)
+        finally:
+            if os.path.exists(staging):
+                os.remove(staging)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a hierarchy written by save().
+
+        Returns:
+            ContractionHierarchy
+
+        Raises:
+            ValueError: If the file is not a hierarchy file of this version
+        """
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path}: not a contraction hierarchy file")
+            magic, version, n, num_up, num_down, num_shortcuts, checksum = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a version {VERSION} contraction hierarchy file")
+            try:
+                ids = _read_array(f, 'q', n)
+                rank = _read_array(f, 'q', n)
+                up = _from_csr(*(_read_array(f, code, count) for code, count
+                                 in (('q', n + 1), ('q', num_up), ('d', num_up))))
+                down = _from_csr(*(_read_array(f, code, count) for code, count
+                                   in (('q', n + 1), ('q', num_down), ('d', num_down))))
+                sources, targets, middles = (_read_array(f, 'q', num_shortcuts) for _ in range(3))
+            except EOFError:
+                raise ValueError(f"{path}: truncated contraction hierarchy file")
+        middle = dict(zip(zip(sources, targets), middles))
+        return cls(list(ids), list(rank), up, down, middle, checksum)
+
+
+def hierarchy_path(nodes_path):
+    """Where the hierarchy for a dataset lives: hierarchy.ch next to its nodes.csv"""
+    return os.path.join(os.path.dirname(os.path.abspath(nodes_path)), "hierarchy.ch")
+
+
+def load_or_build(graph, path, witness_limit=WITNESS_SETTLE_LIMIT):
+    """
+    Load a saved hierarchy for this graph, or build and save one.
+
+    A saved hierarchy is only reused if its checksum matches the graph.
+
+    Args:
+        graph: Graph object
+        path (str): Hierarchy file
+        witness_limit (int): Settled-node limit of each witness search
+
+    Returns:
+        ContractionHierarchy
+    """
+    if os.path.exists(path):
+        try:
+            saved = ContractionHierarchy.load(path)
+            if saved.checksum == graph_checksum(graph):
+                return saved
+        except ValueError:
+            pass  # Rebuilt below
+    built = ContractionHierarchy.build(graph, witness_limit)
+    built.save(path)
+    return built
+
+
+def _shortcuts(outgoing, incoming, v, witness_limit):
+    """
+    Shortcuts needed to contract v: (u, w, cost) for each u -> v -> w
+    with no path of at most that cost around v.
+    """
+    shortcuts = []
+    if not outgoing[v]:
+        return shortcuts
+    longest_out = max(outgoing[v].values())
+    for u, weight_in in incoming[v].items():
+        targets = set(outgoing[v])
+        targets.discard(u)
+        if not targets:
+            continue
+        witness = _witness_distances(outgoing, u, v, targets, weight_in + longest_out, witness_limit)
+        for w, weight_out in outgoing[v].items():
+            if w != u and witness.get(w, inf) > weight_in + weight_out:
+                shortcuts.append((u, w, weight_in + weight_out))
+    return shortcuts
+
+
+def _witness_distances(outgoing, source, skip, targets, limit, max_settled):
+    """
+    Bounded Dijkstra from source in the remaining graph, avoiding skip.
+    Stops once every target is settled; targets is consumed.
+    """
+    dist = {source: 0}
+    pq = [(0, source)]
+    settled = 0
+    while pq and settled < max_settled:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        if d > limit:
+            break
+        settled += 1
+        targets.discard(u)
+        if not targets:
+            break
+        for v, weight in outgoing[u].items():
+            if v == skip:
+                continue
+            new_dist = d + weight
+            if new_dist < dist.get(v, inf):
+                dist[v] = new_dist
+                heapq.heappush(pq, (new_dist, v))
+    return dist
+
+
+def _to_csr(lists):
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array('d')
+    for edges in lists:
+        for v, weight in edges:
+            targets.append(v)
+            weights.append(weight)
+        offsets.append(len(targets))
+    return offsets, targets, weights
+
+
+def _from_csr(offsets, targets, weights):
+    return [list(zip(targets[offsets[i]:offsets[i + 1]], weights[offsets[i]:offsets[i + 1]]))
+            for i in range(len(offsets) - 1)]
+
+
+def _read_array(f, typecode, count):
+    values = array(typecode)
+    values.fromfile(f, count)
+    return values
+
+
+if __name__ == "__main__":
+    """Build a hierarchy and compare its queries with Dijkstra and bidirectional Dijkstra"""
+    import time
+    from dijkstra import dijkstra
+    from bidirectional import bidirectional_dijkstra, reverse_adjacency
+    from benchmark_support import csv_paths, argument, load_graph, random_queries
+
+    nodes_path, edges_path = csv_paths()
+    num_queries = argument(3, 100, int)
+    output = argument(4, os.path.join(tempfile.gettempdir(), "hierarchy.ch"))
+
+    g = load_graph(nodes_path, edges_path)
+
+    started = time.perf_counter()
+    ch = ContractionHierarchy.build(g)
+    ch.save(output)
+    print(f"  Contracted in {(time.perf_counter() - started) * 1000:.1f} ms: {len(ch.middle)} shortcuts")
+    started = time.perf_counter()
+    ch = load_or_build(g, output)
+    print(f"  Reloaded in {(time.perf_counter() - started) * 1000:.1f} ms: {output}")
+
+    queries = random_queries(g, num_queries)
+    reverse = reverse_adjacency(g)
+    optimal = {(s, t): dijkstra(g, s, t) for s, t in queries}
+
+    searches = [
+        ("Dijkstra", lambda s, t: dijkstra(g, s, t)),
+        ("Bidirectional Dijkstra", lambda s, t: bidirectional_dijkstra(g, s, t, reverse)),
+        ("Contraction hierarchy", ch.query),
+    ]
+    for name, search in searches:
+        started = time.perf_counter()
+        results = [(s, t, search(s, t)) for s, t in queries]
+        elapsed = (time.perf_counter() - started) * 1000
+        explored = sum(r['nodes_explored'] for _, _, r in results)
+        wrong = sum(1 for s, t, r in results if abs(r['cost'] - optimal[(s, t)]['cost']) > 1e-9)
+        # A returned path must exist and add up to the returned cost
+        broken = sum(1 for s, t, r in results if r['path'] and (
+            r['path'][0] != s or r['path'][-1] != t or
+            abs(sum(min(w for v, w in g.getNeighbors(a) if v == b)
+                    for a, b in zip(r['path'], r['path'][1:])) - r['cost']) > 1e-6))
+        print(f"  {name:24s} {explored:9d} nodes explored, {elapsed:9.1f} ms "
+              f"({elapsed * 1000 / len(queries):8.1f} us/query), {wrong} wrong costs, {broken} bad paths")
@@ -6,8 +6,13 @@ CS 2500 Extra Credit Project
 import heapq
 from math import inf
 
+try:
+    from .priority_queue import make_queue
+except ImportError:
+    from priority_queue import make_queue
 
-def dijkstra(graph, start, goal):
+
+def dijkstra(graph, start, goal, workspace=None, queue=None):
     """
     Find shortest path using Dijkstra's algorithm.
 
@@ -15,6 +20,10 @@ def dijkstra(graph, start, goal):
         graph: Graph object with getNeighbors(node_id) method
         start (int): Starting node ID
         goal (int): Goal node ID
+        workspace (SearchWorkspace): Reusable per-node state for this graph;
+            avoids the O(V) setup of a fresh search
+        queue: Priority queue backend, a name from priority_queue.QUEUES or
+            an empty queue object; cannot be combined with a workspace
 
     Returns:
         dict: Dictionary containing:
@@ -22,6 +31,13 @@ def dijkstra(graph, start, goal):
             - 'cost': Total cost of the shortest path
             - 'nodes_explored': Number of nodes explored
     """
+    if queue is not None:
+        if workspace is not None:
+            raise ValueError("dijkstra() takes a workspace or a queue, not both")
+        return _dijkstra_with_queue(graph, start, goal, make_queue(queue))
+    if workspace is not None:
+        return _dijkstra_in_workspace(graph, start, goal, workspace)
+
     # Initialize distances
     dist = {node_id: inf for node_id in graph.nodes}
     dist[start] = 0
@@ -85,6 +101,187 @@ def dijkstra(graph, start, goal):
     }
 
 
+def _dijkstra_in_workspace(graph, start, goal, workspace):
+    """dijkstra() on a SearchWorkspace: same search, per-node state in reused arrays"""
+    if start not in workspace.index:
+        # Not in the graph's node table: keep the plain search's behavior
+        return dijkstra(graph, start, goal)
+
+    generation = workspace.begin(graph)
+    index, dist, prev = workspace.index, workspace.dist, workspace.prev
+    reached, closed = workspace.reached, workspace.closed
+
+    start_index, goal_index = index[start], index[goal]
+    dist[start_index] = 0
+    prev[start_index] = -1
+    reached[start_index] = generation
+
+    pq = [(0, start)]
+    nodes_explored = 0
+
+    while pq:
+        current_dist, u = heapq.heappop(pq)
+        u_index = index[u]
+
+        if closed[u_index] == generation:
+            continue
+
+        closed[u_index] = generation
+        nodes_explored += 1
+
+        if u == goal:
+            break
+
+        for neighbor, weight in graph.getNeighbors(u):
+            v = index[neighbor]
+            if closed[v] == generation:
+                continue
+
+            new_dist = current_dist + weight
+
+            if new_dist < (dist[v] if reached[v] == generation else inf):
+                dist[v] = new_dist
+                prev[v] = u_index
+                reached[v] = generation
+                heapq.heappush(pq, (new_dist, neighbor))
+
+    if reached[goal_index] != generation:
+        return {
+            'path': [],
+            'cost': inf,
+            'nodes_explored': nodes_explored
+        }
+
+    return {
+        'path': workspace.path_to(goal_index),
+        'cost': dist[goal_index],
+        'nodes_explored': nodes_explored
+    }
+
+
+def _dijkstra_with_queue(graph, start, goal, pq):
+    """dijkstra() on a pluggable priority queue; only reached nodes are stored"""
+    dist = {start: 0}
+    prev = {start: None}
+    closed = set()
+    nodes_explored = 0
+    pq.push(0, start)
+
+    while pq:
+        current_dist, u = pq.pop()
+
+        if u in closed:
+            continue
+
+        closed.add(u)
+        nodes_explored += 1
+
+        if u == goal:
+            break
+
+        for neighbor, weight in graph.getNeighbors(u):
+            if neighbor in closed:
+                continue
+
+            new_dist = current_dist + weight
+
+            if new_dist < dist.get(neighbor, inf):
+                dist[neighbor] = new_dist
+                prev[neighbor] = u
+                pq.push(new_dist, neighbor)
+
+    if goal not in closed:
+        return {
+            'path': [],
+            'cost': inf,
+            'nodes_explored': nodes_explored
+        }
+
+    path = []
+    current = goal
+    while current is not None:
+        path.append(current)
+        current = prev[current]
+    path.reverse()
+
+    return {
+        'path': path,
+        'cost': dist[goal],
+        'nodes_explored': nodes_explored
+    }
+
+
+def distances_to(graph, source, targets=None):
+    """
+    One-to-many Dijkstra: costs from source to each target.
+
+    The search stops as soon as every target that exists in the graph has
+    been settled; with targets=None it runs to completion (one-to-all).
+    Only nodes the search reaches are stored, so there is no O(V) setup.
+
+    Args:
+        graph: Graph object with getNeighbors(node_id) method
+        source (int): Starting node ID
+        targets: Iterable of goal node IDs, or None for every node
+
+    Returns:
+        dict: node_id -> cost for every settled node (unreachable targets are missing)
+    """
+    remaining = None
+    if targets is not None:
+        remaining = {t for t in targets if t in graph.nodes}
+        remaining.discard(source)
+
+    dist = {source: 0}
+    settled = {}
+    pq = [(0, source)]
+
+    while pq:
+        current_dist, u = heapq.heappop(pq)
+        if u in settled:
+            continue
+        settled[u] = current_dist
+
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+        for neighbor, weight in graph.getNeighbors(u):
+            if neighbor in settled:
+                continue
+            new_dist = current_dist + weight
+            if new_dist < dist.get(neighbor, inf):
+                dist[neighbor] = new_dist
+                heapq.heappush(pq, (new_dist, neighbor))
+
+    return settled
+
+
+def distance_table(graph, sources, targets):
+    """
+    Many-to-many shortest-path costs.
+
+    Runs one search per distinct source (see distances_to), so N queries
+    that share a source cost a single expansion instead of N.
+
+    Args:
+        graph: Graph object with getNeighbors(node_id) method
+        sources: List of starting node IDs (rows)
+        targets: List of goal node IDs (columns)
+
+    Returns:
+        list: Dense matrix, table[i][j] = cost from sources[i] to targets[j]
+            (inf if there is no path)
+    """
+    targets = list(targets)
+    rows = {}
+    for source in dict.fromkeys(sources):
+        settled = distances_to(graph, source, targets)
+        rows[source] = [settled.get(target, inf) for target in targets]
+    return [list(rows[source]) for source in sources]
+
+
 def calculate_expected_costs(graph, queries):
     """
     Calculate expected costs for test queries.
@@ -3,21 +3,50 @@ Graph Data Structure - Reference Implementation
 Matches CS 2500 Extra Credit Project Specification (Section 2.1.3)
 """
 
+import gc
 import csv
+import warnings
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # optional: edges are parsed with the csv module instead
+    np = None
+
+# Rows parsed per batch by load_from_csv
+CHUNK_SIZE = 65536
+
+EDGE_DTYPE = [("from", "i8"), ("to", "i8"), ("weight", "f8")]
 
 
 class Graph:
     """
     Graph data structure for representing weighted, directed graphs.
     Supports nodes with coordinates and weighted edges.
+
+    With indexed=True the graph also keeps, per node, a neighbor -> slot map
+    into its adjacency list plus the set of nodes with an edge into it. Edge
+    lookups are then O(1), and removals only touch the edges involved
+    (removeNode is O(degree) instead of O(E)). Removed edges are swapped with
+    the last edge of their list, so neighbor order is not preserved.
     """
 
-    def __init__(self):
-        """Initialize empty graph"""
+    def __init__(self, indexed=False):
+        """
+        Initialize empty graph
+
+        Args:
+            indexed (bool): Maintain the slot maps and incoming-edge index
+        """
         # Store nodes: node_id -> (name, (x, y))
         self.nodes = {}
         # Adjacency list: node_id -> [(neighbor_id, weight), ...]
         self.adj = {}
+        self.indexed = indexed
+        # Indexed mode only: node_id -> {neighbor_id: [slots in adj[node_id]]}
+        self._slots = {} if indexed else None
+        # Indexed mode only: node_id -> {source_id: None}, in insertion order
+        self._incoming = {} if indexed else None
 
     def addNode(self, node_id, name, coordinates):
         """
@@ -31,6 +60,9 @@ class Graph:
         self.nodes[node_id] = (name, coordinates)
         if node_id not in self.adj:
             self.adj[node_id] = []
+        if self.indexed:
+            self._slots.setdefault(node_id, {})
+            self._incoming.setdefault(node_id, {})
 
     def addEdge(self, from_node, to_node, weight):
         """
@@ -44,6 +76,10 @@ class Graph:
         if from_node not in self.adj:
             self.adj[from_node] = []
         self.adj[from_node].append((to_node, weight))
+        if self.indexed:
+            slots = self._slots.setdefault(from_node, {})
+            slots.setdefault(to_node, []).append(len(self.adj[from_node]) - 1)
+            self._incoming.setdefault(to_node, {})[from_node] = None
 
     def removeNode(self, node_id):
         """
@@ -52,6 +88,10 @@ class Graph:
         Args:
             node_id (int): Node ID to remove
         """
+        if self.indexed:
+            self._remove_node_indexed(node_id)
+            return
+
         # Remove from nodes dict
         if node_id in self.nodes:
             del self.nodes[node_id]
@@ -73,6 +113,11 @@ class Graph:
             from_node (int): Source node ID
             to_node (int): Destination node ID
         """
+        if self.indexed:
+            self._remove_edges_indexed(from_node, to_node)
+            self._incoming.get(to_node, {}).pop(from_node, None)
+            return
+
         if from_node in self.adj:
             self.adj[from_node] = [(neighbor, weight) for neighbor, weight in self.adj[from_node]
                                    if neighbor != to_node]
@@ -100,43 +145,131 @@ class Graph:
         Returns:
             float: Edge weight, or None if edge doesn't exist
         """
+        if self.indexed:
+            slots = self._slots.get(from_node, {}).get(to_node)
+            return self.adj[from_node][min(slots)][1] if slots else None
+
         for neighbor, weight in self.adj.get(from_node, []):
             if neighbor == to_node:
                 return weight
         return None
 
-    def load_from_csv(self, nodes_path, edges_path):
+    def add_nodes_from(self, nodes):
+        """
+        Add many nodes at once.
+
+        Args:
+            nodes: Iterable of (node_id, name, (x, y)) tuples
+        """
+        if self.indexed:
+            for node_id, name, coordinates in nodes:
+                self.addNode(node_id, name, coordinates)
+            return
+
+        graph_nodes, adj = self.nodes, self.adj
+        for node_id, name, coordinates in nodes:
+            graph_nodes[node_id] = (name, coordinates)
+            if node_id not in adj:
+                adj[node_id] = []
+
+    def add_edges_from(self, edges):
+        """
+        Add many directed edges at once.
+
+        Args:
+            edges: Iterable of (from_node, to_node, weight) tuples
+        """
+        if self.indexed:
+            for from_node, to_node, weight in edges:
+                self.addEdge(from_node, to_node, weight)
+            return
+
+        adj = self.adj
+        for from_node, to_node, weight in edges:
+            neighbors = adj.get(from_node)
+            if neighbors is None:
+                neighbors = adj[from_node] = []
+            neighbors.append((to_node, weight))
+
+    def load_from_csv(self, nodes_path, edges_path, chunk_size=CHUNK_SIZE):
         """
         Load graph data from CSV files.
 
+        Rows are read and converted a chunk at a time, so apart from the
+        graph itself memory use stays bounded by chunk_size. With NumPy, the
+        numeric edge columns are parsed by np.loadtxt; rows it cannot parse
+        go through the csv module as before.
+
         Args:
             nodes_path (str): Path to nodes.csv file
             edges_path (str): Path to edges.csv file
+            chunk_size (int): Rows parsed per batch
         """
-        # Load nodes from CSV
-        with open(nodes_path, 'r', newline='') as f:
-            reader = csv.reader(f)
-            next(reader, None)  # Skip header
-            for row in reader:
-                if not row:  # Skip empty rows
-                    continue
-                node_id = int(row[0])
-                name = row[1]
-                x = float(row[2])
-                y = float(row[3])
-                self.addNode(node_id, name, (x, y))
-
-        # Load edges from CSV
-        with open(edges_path, 'r', newline='') as f:
-            reader = csv.reader(f)
-            next(reader, None)  # Skip header
-            for row in reader:
-                if not row:  # Skip empty rows
-                    continue
-                from_node = int(row[0])
-                to_node = int(row[1])
-                weight = float(row[2])
-                self.addEdge(from_node, to_node, weight)
+        # Every chunk keeps thousands of row objects alive, which sets off
+        # repeated full collections over the growing graph; nothing created
+        # here can form a reference cycle, so collection is paused meanwhile
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # Load nodes from CSV: id,name,x,y
+            for rows in _read_chunks(nodes_path, chunk_size):
+                self.add_nodes_from((int(row[0]), row[1], (float(row[2]), float(row[3]))) for row in rows)
+
+            # Load edges from CSV: from,to,weight
+            for sources, targets, weights in _edge_chunks(edges_path, chunk_size):
+                self.add_edges_from(zip(sources, targets, weights))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def getIncoming(self, node_id):
+        """
+        Get all edges that end at a node.
+
+        O(in-degree) in indexed mode, O(E) otherwise.
+
+        Args:
+            node_id (int): Node ID
+
+        Returns:
+            list: List of (source_id, weight) tuples
+        """
+        if self.indexed:
+            incoming = []
+            for source in self._incoming.get(node_id, {}):
+                neighbors = self.adj[source]
+                incoming.extend((source, neighbors[slot][1]) for slot in sorted(self._slots[source][node_id]))
+            return incoming
+
+        return [(source, weight) for source, neighbors in self.adj.items()
+                for neighbor, weight in neighbors if neighbor == node_id]
+
+    def _remove_node_indexed(self, node_id):
+        """removeNode() for indexed mode: only edges touching node_id are visited"""
+        self.nodes.pop(node_id, None)
+        for source in self._incoming.pop(node_id, {}):
+            if source != node_id:
+                self._remove_edges_indexed(source, node_id)
+        for neighbor in self._slots.pop(node_id, {}):
+            self._incoming.get(neighbor, {}).pop(node_id, None)
+        self.adj.pop(node_id, None)
+
+    def _remove_edges_indexed(self, from_node, to_node):
+        """Swap-remove every from_node -> to_node edge, keeping the slot maps in step"""
+        node_slots = self._slots.get(from_node, {})
+        removed = node_slots.pop(to_node, None)
+        if not removed:
+            return
+        neighbors = self.adj[from_node]
+        # Highest slot first, so a slot still to be removed is never the one moved
+        for slot in sorted(removed, reverse=True):
+            last = len(neighbors) - 1
+            if slot != last:
+                moved = neighbors[last]
+                neighbors[slot] = moved
+                moved_slots = node_slots[moved[0]]
+                moved_slots[moved_slots.index(last)] = slot
+            neighbors.pop()
 
     def num_nodes(self):
         """Return the number of nodes in the graph"""
@@ -182,4 +315,67 @@ class Graph:
         if node_id in self.nodes:
             name, coords = self.nodes[node_id]
             return name
-        return None
\ No newline at end of file
+        return None
+
+
+def _read_chunks(path, chunk_size):
+    """Yield lists of up to chunk_size non-empty CSV rows, after the header"""
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip header
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            yield [row for row in rows if row]  # Skip empty rows
+
+
+def _edge_chunks(path, chunk_size):
+    """Yield (sources, targets, weights) lists for up to chunk_size edge lines, after the header"""
+    with open(path, 'r', newline='') as f:
+        next(f, None)  # Skip header
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            yield _parse_edges(lines)
+
+
+def _parse_edges(lines):
+    """Parse from,to,weight lines into three column lists"""
+    if np is not None:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # a chunk of blank lines is "no data"
+                # comments=None: '#' is data, as it is for the csv module
+                table = np.loadtxt(lines, delimiter=',', dtype=EDGE_DTYPE, usecols=(0, 1, 2), ndmin=1,
+                                   comments=None)
+            return table["from"].tolist(), table["to"].tolist(), table["weight"].tolist()
+        except ValueError:
+            pass  # Quoted fields, short rows, ...: the csv module decides
+    rows = [row for row in csv.reader(lines) if row]  # Skip empty rows
+    return [int(row[0]) for row in rows], [int(row[1]) for row in rows], [float(row[2]) for row in rows]
+
+
+if __name__ == "__main__":
+    """Time node removals with and without the edge index"""
+    import time
+    import random
+    from benchmark_support import csv_paths, argument
+
+    nodes_path, edges_path = csv_paths()
+    removals = argument(3, 10, int)
+
+    for indexed in (False, True):
+        g = Graph(indexed=indexed)
+        started = time.perf_counter()
+        g.load_from_csv(nodes_path, edges_path)
+        load_ms = (time.perf_counter() - started) * 1000
+
+        victims = random.Random(0).sample(sorted(g.nodes), min(removals, g.num_nodes()))
+        started = time.perf_counter()
+        for node_id in victims:
+            g.removeNode(node_id)
+        remove_ms = (time.perf_counter() - started) * 1000
+        print(f"indexed={indexed}: load {load_ms:.1f} ms, {len(victims)} removeNode calls {remove_ms:.1f} ms, "
+              f"{g.num_nodes()} nodes / {g.num_edges()} edges left")
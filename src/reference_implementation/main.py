@@ -7,6 +7,7 @@ Demonstrates graph operations, Dijkstra's algorithm, and A* search
 from graph import Graph
 from dijkstra import dijkstra
 from astar import astar
+from bidirectional import bidirectional_dijkstra, bidirectional_astar, reverse_adjacency
 import time
 
 
@@ -23,6 +24,9 @@ def main():
     print(f"  Edges: {g.num_edges()}")
     print()
 
+    # Incoming edges for the backward half of the bidirectional searches
+    reverse = reverse_adjacency(g)
+
     # Required test queries from project spec (Section 2.4.2)
     queries = [
         (1, 14),  # Query 1: Main Gateway → Parking Garage (Long Path)
@@ -70,6 +74,13 @@ def main():
         print(f"    Nodes explored: {astar_result['nodes_explored']}")
         print(f"    Time: {astar_time:.4f} ms")
 
+        # Bidirectional baselines
+        bidi_dijkstra_result = bidirectional_dijkstra(g, start, goal, reverse)
+        bidi_astar_result = bidirectional_astar(g, start, goal, reverse)
+        print("  Bidirectional Dijkstra / A*:")
+        print(f"    Cost: {bidi_dijkstra_result['cost']:.2f} / {bidi_astar_result['cost']:.2f}")
+        print(f"    Nodes explored: {bidi_dijkstra_result['nodes_explored']} / {bidi_astar_result['nodes_explored']}")
+
         # Comparison
         if dijkstra_result['cost'] == astar_result['cost']:
             print("  ✓ Both algorithms found the same optimal path")
@@ -91,16 +102,22 @@ def main():
 
     total_dijkstra_nodes = 0
     total_astar_nodes = 0
+    total_bidi_dijkstra_nodes = 0
+    total_bidi_astar_nodes = 0
 
     for start, goal in queries:
         d_result = dijkstra(g, start, goal)
         a_result = astar(g, start, goal)
         total_dijkstra_nodes += d_result['nodes_explored']
         total_astar_nodes += a_result['nodes_explored']
+        total_bidi_dijkstra_nodes += bidirectional_dijkstra(g, start, goal, reverse)['nodes_explored']
+        total_bidi_astar_nodes += bidirectional_astar(g, start, goal, reverse)['nodes_explored']
 
     print(f"Total nodes explored across all queries:")
     print(f"  Dijkstra: {total_dijkstra_nodes}")
     print(f"  A*: {total_astar_nodes}")
+    print(f"  Bidirectional Dijkstra: {total_bidi_dijkstra_nodes}")
+    print(f"  Bidirectional A*: {total_bidi_astar_nodes}")
 
     if total_astar_nodes < total_dijkstra_nodes:
         improvement = ((total_dijkstra_nodes - total_astar_nodes) / total_dijkstra_nodes * 100)
@@ -0,0 +1,329 @@
+"""
+Synthetic Road Network Generator
+Builds large graphs in the project's CSV format for stress-testing submissions
+
+Three kinds of network are supported:
+    grid       - rectangular street grid with randomly varied block lengths
+    geometric  - random geometric graph (points joined to neighbors within a radius)
+    road       - planar road-like network: jittered grid with missing streets
+                 and occasional diagonal avenues
+
+All edges are written in both directions with the same weight, and every
+weight is at least the Euclidean distance between its endpoints (rounded up
+to 3 decimals), so the straight-line A* heuristic stays admissible. The same
+seed always produces the same files.
+"""
+
+import os
+import csv
+import math
+import random
+from array import array
+from collections import namedtuple
+
+# Undirected network: node i (0-based) is written with id i + 1.
+# sources/targets/weights are parallel arrays with one entry per undirected edge.
+Network = namedtuple("Network", ["kind", "xs", "ys", "sources", "targets", "weights"])
+
+KINDS = ["grid", "geometric", "road"]
+
+# Average distance between neighboring nodes, in CSV coordinate units
+DEFAULT_SPACING = 10.0
+
+
+def admissible_weight(x1, y1, x2, y2, detour=0.0, rng=None):
+    """
+    Edge weight that is never shorter than the straight-line distance.
+
+    Args:
+        x1, y1, x2, y2 (float): Endpoint coordinates
+        detour (float): Up to this fraction is randomly added on top of the
+            Euclidean length (winding roads, traffic)
+        rng (random.Random): Source of randomness for the detour
+
+    Returns:
+        float: Weight rounded *up* to 3 decimals
+    """
+    length = math.hypot(x2 - x1, y2 - y1)
+    if detour and rng is not None:
+        length *= 1.0 + detour * rng.random()
+    weight = math.ceil(length * 1000) / 1000
+    if weight < length:  # float rounding in the division
+        weight += 0.001
+    return max(weight, 0.001)
+
+
+def grid_network(num_nodes, spacing=DEFAULT_SPACING, detour=0.25, seed=0):
+    """
+    Rectangular street grid (the last row may be partial).
+
+    Args:
+        num_nodes (int): Number of intersections
+        spacing (float): Distance between neighboring intersections
+        detour (float): Random extra length per street, as a fraction
+        seed (int): Random seed
+
+    Returns:
+        Network
+    """
+    rng = random.Random(seed)
+    cols = max(1, math.ceil(math.sqrt(num_nodes)))
+    xs, ys = _grid_coordinates(num_nodes, cols, spacing, 0.0, rng)
+    network = Network("grid", xs, ys, array('l'), array('l'), array('d'))
+
+    for i in range(num_nodes):
+        col = i % cols
+        if col + 1 < cols and i + 1 < num_nodes:
+            _add_edge(network, i, i + 1, detour, rng)
+        if i + cols < num_nodes:
+            _add_edge(network, i, i + cols, detour, rng)
+    return network
+
+
+def random_geometric_network(num_nodes, avg_degree=6.0, spacing=DEFAULT_SPACING, detour=0.1, seed=0):
+    """
+    Random geometric graph built with a spatial hash.
+
+    Points are scattered uniformly over a square sized so that there is one
+    point per spacing x spacing cell on average. Two points are joined when
+    they are closer than the radius that gives `avg_degree` neighbors on
+    average. Only the 3x3 block of hash cells around a point is searched, so
+    construction is roughly linear in the number of edges. Leftover
+    components are then joined to a nearby node outside them so every query
+    has an answer.
+
+    Args:
+        num_nodes (int): Number of points
+        avg_degree (float): Expected number of neighbors per point
+        spacing (float): Average distance between neighboring points
+        detour (float): Random extra length per edge, as a fraction
+        seed (int): Random seed
+
+    Returns:
+        Network
+    """
+    rng = random.Random(seed)
+    side = spacing * math.sqrt(num_nodes)
+    radius = spacing * math.sqrt(avg_degree / math.pi)
+
+    # Rounded to the precision written to the CSV, so weights stay admissible
+    xs = array('d', (round(rng.random() * side, 3) for _ in range(num_nodes)))
+    ys = array('d', (round(rng.random() * side, 3) for _ in range(num_nodes)))
+    network = Network("geometric", xs, ys, array('l'), array('l'), array('d'))
+
+    cells = {}
+    for i in range(num_nodes):
+        cells.setdefault((int(xs[i] // radius), int(ys[i] // radius)), []).append(i)
+
+    parent = list(range(num_nodes))
+    radius_sq = radius * radius
+    # Each pair of cells is visited once: the cell itself plus 4 "forward" neighbors
+    forward = [(1, -1), (1, 0), (1, 1), (0, 1)]
+
+    for (cx, cy), members in cells.items():
+        for a, i in enumerate(members):
+            xi, yi = xs[i], ys[i]
+            for j in members[a + 1:]:
+                if (xs[j] - xi) ** 2 + (ys[j] - yi) ** 2 <= radius_sq:
+                    _add_edge(network, i, j, detour, rng)
+                    _union(parent, i, j)
+            for dx, dy in forward:
+                for j in cells.get((cx + dx, cy + dy), ()):
+                    if (xs[j] - xi) ** 2 + (ys[j] - yi) ** 2 <= radius_sq:
+                        _add_edge(network, i, j, detour, rng)
+                        _union(parent, i, j)
+
+    _connect_components(network, parent, cells, radius, detour, rng)
+    return network
+
+
+def road_network(num_nodes, keep_fraction=0.8, diagonal_fraction=0.1, spacing=DEFAULT_SPACING,
+                 jitter=0.3, detour=0.2, seed=0):
+    """
+    Planar, road-like network: a jittered grid with some streets removed.
+
+    Intersections sit on a grid, each moved randomly by up to `jitter`
+    spacings. Each grid street survives with probability `keep_fraction`;
+    removed streets are put back only where needed to keep the network
+    connected. A few blocks get one diagonal avenue (never two, so no
+    streets cross and the network stays planar).
+
+    Args:
+        num_nodes (int): Number of intersections
+        keep_fraction (float): Probability that a grid street is kept
+        diagonal_fraction (float): Probability that a block gets a diagonal
+        spacing (float): Grid spacing
+        jitter (float): Maximum displacement of an intersection, in spacings (< 0.5)
+        detour (float): Random extra length per street, as a fraction
+        seed (int): Random seed
+
+    Returns:
+        Network
+    """
+    rng = random.Random(seed)
+    cols = max(1, math.ceil(math.sqrt(num_nodes)))
+    xs, ys = _grid_coordinates(num_nodes, cols, spacing, jitter, rng)
+    network = Network("road", xs, ys, array('l'), array('l'), array('d'))
+
+    parent = list(range(num_nodes))
+    dropped_from, dropped_to = array('l'), array('l')
+
+    for i in range(num_nodes):
+        col = i % cols
+        for j in (i + 1 if col + 1 < cols else None, i + cols):
+            if j is None or j >= num_nodes:
+                continue
+            if rng.random() < keep_fraction:
+                _add_edge(network, i, j, detour, rng)
+                _union(parent, i, j)
+            else:
+                dropped_from.append(i)
+                dropped_to.append(j)
+
+        # One diagonal per block at most, in a random direction
+        if col + 1 < cols and i + cols + 1 < num_nodes and rng.random() < diagonal_fraction:
+            if rng.random() < 0.5:
+                a, b = i, i + cols + 1
+            else:
+                a, b = i + 1, i + cols
+            _add_edge(network, a, b, detour, rng)
+            _union(parent, a, b)
+
+    # Put back just enough of the removed streets to reconnect the network
+    for i, j in zip(dropped_from, dropped_to):
+        if _find(parent, i) != _find(parent, j):
+            _add_edge(network, i, j, detour, rng)
+            _union(parent, i, j)
+
+    return network
+
+
+def generate(kind, num_nodes, seed=0, **options):
+    """
+    Generate a network by kind name.
+
+    Args:
+        kind (str): "grid", "geometric" or "road"
+        num_nodes (int): Number of nodes
+        seed (int): Random seed
+        **options: Passed to the generator function
+
+    Returns:
+        Network
+    """
+    if num_nodes < 1:
+        raise ValueError("num_nodes must be at least 1")
+    if kind == "grid":
+        return grid_network(num_nodes, seed=seed, **options)
+    if kind == "geometric":
+        return random_geometric_network(num_nodes, seed=seed, **options)
+    if kind == "road":
+        return road_network(num_nodes, seed=seed, **options)
+    raise ValueError(f"Unknown network kind '{kind}' (expected one of: {', '.join(KINDS)})")
+
+
+def node_name(kind, node_id):
+    """CSV name for a generated node (no commas, so naive CSV parsers still work)"""
+    prefix = {"grid": "Grid", "geometric": "Point", "road": "Junction"}.get(kind, "Node")
+    return f"{prefix} {node_id}"
+
+
+def write_csv(network, output_dir, nodes_file="nodes.csv", edges_file="edges.csv"):
+    """
+    Write a network as nodes.csv (id,name,x,y) and edges.csv (from,to,weight).
+
+    Every undirected edge is written in both directions.
+
+    Args:
+        network (Network): Generated network
+        output_dir (str): Directory to write into (created if needed)
+
+    Returns:
+        tuple: (nodes_path, edges_path)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    nodes_path = os.path.join(output_dir, nodes_file)
+    edges_path = os.path.join(output_dir, edges_file)
+
+    with open(nodes_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "x", "y"])
+        for i in range(len(network.xs)):
+            writer.writerow([i + 1, node_name(network.kind, i + 1),
+                             f"{network.xs[i]:.3f}", f"{network.ys[i]:.3f}"])
+
+    with open(edges_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["from", "to", "weight"])
+        for u, v, w in zip(network.sources, network.targets, network.weights):
+            writer.writerow([u + 1, v + 1, w])
+            writer.writerow([v + 1, u + 1, w])
+
+    return nodes_path, edges_path
+
+
+def _grid_coordinates(num_nodes, cols, spacing, jitter, rng):
+    """Row-major grid positions, each moved by up to `jitter` spacings"""
+    xs, ys = array('d'), array('d')
+    for i in range(num_nodes):
+        row, col = divmod(i, cols)
+        dx = rng.uniform(-jitter, jitter) if jitter else 0.0
+        dy = rng.uniform(-jitter, jitter) if jitter else 0.0
+        # Round now so the weights are computed from the coordinates that get written
+        xs.append(round((col + dx) * spacing, 3))
+        ys.append(round((row + dy) * spacing, 3))
+    return xs, ys
+
+
+def _add_edge(network, i, j, detour, rng):
+    network.sources.append(i)
+    network.targets.append(j)
+    network.weights.append(admissible_weight(network.xs[i], network.ys[i],
+                                             network.xs[j], network.ys[j], detour, rng))
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent, i, j):
+    root_i, root_j = _find(parent, i), _find(parent, j)
+    if root_i != root_j:
+        parent[root_j] = root_i
+
+
+def _connect_components(network, parent, cells, cell_size, detour, rng):
+    """Join each component to a nearby node outside it until one component remains"""
+    xs, ys = network.xs, network.ys
+    representatives = {}
+    for i in range(len(xs)):
+        representatives.setdefault(_find(parent, i), i)
+    components = len(representatives)
+
+    for i in representatives.values():
+        if components == 1:
+            break
+        root = _find(parent, i)
+        cx, cy = int(xs[i] // cell_size), int(ys[i] // cell_size)
+        best, best_dist, best_ring = None, None, None
+        ring = 0
+        # Search growing rings of cells, plus one ring past the first hit
+        while best is None or ring <= best_ring + 1:
+            for gx in range(cx - ring, cx + ring + 1):
+                for gy in range(cy - ring, cy + ring + 1):
+                    if max(abs(gx - cx), abs(gy - cy)) != ring:
+                        continue
+                    for j in cells.get((gx, gy), ()):
+                        if _find(parent, j) == root:
+                            continue
+                        dist = (xs[j] - xs[i]) ** 2 + (ys[j] - ys[i]) ** 2
+                        if best is None or dist < best_dist:
+                            best, best_dist, best_ring = j, dist, ring
+            ring += 1
+
+        _add_edge(network, i, best, detour, rng)
+        _union(parent, i, best)
+        components -= 1
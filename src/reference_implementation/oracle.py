@@ -0,0 +1,232 @@
+"""
+Reference Oracle - Exact Shortest-Path Costs for Many Queries
+CS 2500 Extra Credit Project
+
+Computes expected costs for thousands of (start, goal) pairs at once, so the
+autograder can check students against generated queries instead of a handful
+of hard-coded constants.
+
+With NumPy, the graph is stored as CSR (compressed sparse row) arrays and a
+batch of sources is solved together with a vectorized Bellman-Ford: each round
+relaxes every edge for every source in the batch, and np.minimum.reduceat
+takes the best incoming candidate per node. Without NumPy (or for graphs where
+many relaxation rounds would be needed), it falls back to one heap-based
+Dijkstra per distinct source that stops once that source's goals are
+settled (dijkstra.distances_to).
+"""
+
+import random
+from math import inf
+
+try:
+    import numpy as np
+except ImportError:  # optional: the pure-Python fallback gives identical costs
+    np = None
+
+try:
+    from .dijkstra import distances_to
+except ImportError:
+    from dijkstra import distances_to
+
+# Floats per batched distance matrix (sources x edges); bounds memory use
+BATCH_CELLS = 4_000_000
+
+# Bellman-Ford needs one round per edge on the longest shortest path, which
+# grows like sqrt(n) on road networks. Measured on generated road networks,
+# per-source Dijkstra is already ~2x faster at 500 nodes and ~7x at 5000, so
+# the vectorized path is only picked automatically for small maps
+VECTORIZE_MAX_NODES = 200
+
+
+class CSRGraph:
+    """
+    Compressed sparse row view of a graph's incoming edges.
+
+    Node ids are mapped to dense indices 0..n-1 (in sorted id order).
+    Incoming edges are grouped by target, which is what the batched
+    relaxation needs: in_sources[in_offsets[t]:in_offsets[t + 1]] are the
+    predecessors of node t and in_weights holds the matching weights.
+    """
+
+    def __init__(self, graph):
+        """
+        Args:
+            graph: Graph object with `nodes` and getNeighbors(node_id)
+        """
+        self.ids = sorted(graph.nodes)
+        self.index = {node_id: i for i, node_id in enumerate(self.ids)}
+
+        incoming = [[] for _ in self.ids]
+        for node_id in self.ids:
+            u = self.index[node_id]
+            for neighbor, weight in graph.getNeighbors(node_id):
+                if neighbor in self.index:
+                    incoming[self.index[neighbor]].append((u, float(weight)))
+
+        offsets = [0]
+        sources, weights = [], []
+        for edges in incoming:
+            for u, weight in edges:
+                sources.append(u)
+                weights.append(weight)
+            offsets.append(len(sources))
+
+        self.in_offsets = np.array(offsets, dtype=np.int64)
+        self.in_sources = np.array(sources, dtype=np.int64)
+        self.in_weights = np.array(weights, dtype=np.float64)
+
+        # reduceat needs non-empty segments: only nodes with incoming edges
+        has_incoming = self.in_offsets[1:] > self.in_offsets[:-1]
+        self.targets = np.nonzero(has_incoming)[0]
+        self.segment_starts = self.in_offsets[:-1][has_incoming]
+
+    def num_nodes(self):
+        return len(self.ids)
+
+    def num_edges(self):
+        return len(self.in_sources)
+
+    def distances_from(self, source_indices):
+        """
+        Batched Bellman-Ford from several sources at once.
+
+        Args:
+            source_indices: Dense indices of the sources
+
+        Returns:
+            numpy.ndarray: (len(source_indices), n) distance matrix, inf where unreachable
+        """
+        k, n = len(source_indices), self.num_nodes()
+        dist = np.full((k, n), np.inf)
+        dist[np.arange(k), source_indices] = 0.0
+        if self.num_edges() == 0:
+            return dist
+
+        for _ in range(max(n - 1, 1)):
+            candidates = dist[:, self.in_sources] + self.in_weights
+            best = np.minimum.reduceat(candidates, self.segment_starts, axis=1)
+            current = dist[:, self.targets]
+            improved = best < current
+            if not improved.any():
+                break
+            dist[:, self.targets] = np.where(improved, best, current)
+        return dist
+
+
+class ReferenceOracle:
+    """
+    Exact shortest-path costs for batches of queries on one graph.
+
+    Usage:
+        oracle = ReferenceOracle(graph)
+        expected = oracle.costs([(1, 14), (8, 9)])   # {(1, 14): 113.0, ...}
+    """
+
+    def __init__(self, graph, vectorize=None):
+        """
+        Args:
+            graph: Graph object (reference Graph or compatible)
+            vectorize: Force (True) or disable (False) the NumPy path;
+                None picks it automatically by graph size
+        """
+        self.graph = graph
+        if vectorize is None:
+            vectorize = np is not None and len(graph.nodes) <= VECTORIZE_MAX_NODES
+        self.vectorize = bool(vectorize) and np is not None
+        self.csr = CSRGraph(graph) if self.vectorize else None
+
+    def costs(self, queries):
+        """
+        Args:
+            queries: Iterable of (start, goal) node id pairs
+
+        Returns:
+            dict: (start, goal) -> cost (inf if unreachable)
+        """
+        by_source = {}
+        for start, goal in queries:
+            by_source.setdefault(start, []).append(goal)
+
+        if self.vectorize:
+            return self._vectorized_costs(by_source)
+
+        results = {}
+        for start, goals in by_source.items():
+            dist = distances_to(self.graph, start, goals)
+            for goal in goals:
+                results[(start, goal)] = dist.get(goal, inf)
+        return results
+
+    def _vectorized_costs(self, by_source):
+        csr = self.csr
+        results = {}
+        sources = [s for s in by_source if s in csr.index]
+        batch = max(1, BATCH_CELLS // max(csr.num_edges(), csr.num_nodes(), 1))
+
+        for first in range(0, len(sources), batch):
+            chunk = sources[first:first + batch]
+            dist = csr.distances_from(np.array([csr.index[s] for s in chunk], dtype=np.int64))
+            for row, start in enumerate(chunk):
+                for goal in by_source[start]:
+                    column = csr.index.get(goal)
+                    results[(start, goal)] = float(dist[row, column]) if column is not None else inf
+
+        for start, goals in by_source.items():
+            if start not in csr.index:
+                for goal in goals:
+                    results[(start, goal)] = inf
+        return results
+
+    def random_queries(self, count, seed=0, reachable_only=True):
+        """
+        Seeded random (start, goal) pairs with their expected costs.
+
+        Args:
+            count (int): Number of queries wanted
+            seed (int): Random seed
+            reachable_only (bool): Drop pairs with no path
+
+        Returns:
+            dict: (start, goal) -> cost, in generation order
+        """
+        rng = random.Random(seed)
+        ids = sorted(self.graph.nodes)
+        if len(ids) < 2:
+            return {}
+
+        expected = {}
+        attempts = 0
+        while len(expected) < count and attempts < 4:
+            needed = count - len(expected)
+            pairs = []
+            for _ in range(needed):
+                start, goal = rng.sample(ids, 2)
+                if (start, goal) not in expected:
+                    pairs.append((start, goal))
+            for pair, cost in self.costs(pairs).items():
+                if len(expected) < count and (cost != inf or not reachable_only):
+                    expected[pair] = cost
+            attempts += 1
+        return expected
+
+
+if __name__ == "__main__":
+    """Compare oracle costs with the reference Dijkstra on random queries"""
+    import time
+    from dijkstra import dijkstra
+    from benchmark_support import csv_paths, load_graph
+
+    nodes_path, edges_path = csv_paths()
+
+    g = load_graph(nodes_path, edges_path)
+
+    for vectorize in ([True, False] if np is not None else [False]):
+        oracle = ReferenceOracle(g, vectorize=vectorize)
+        started = time.perf_counter()
+        expected = oracle.random_queries(1000, seed=1)
+        elapsed = time.perf_counter() - started
+        label = "NumPy batched Bellman-Ford" if vectorize else "per-source Dijkstra"
+        print(f"  {label}: {len(expected)} queries in {elapsed * 1000:.1f} ms")
+
+    mismatches = sum(1 for (s, t), cost in expected.items() if abs(dijkstra(g, s, t)['cost'] - cost) > 1e-9)
+    print(f"  Mismatches against dijkstra(): {mismatches}")
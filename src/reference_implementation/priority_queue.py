@@ -0,0 +1,357 @@
+"""
+Priority Queues - Reference Implementation
+CS 2500 Extra Credit Project
+
+dijkstra() and astar() use heapq with lazy deletion: an improved distance
+pushes a second entry and the stale one is skipped when popped, so the
+heap can hold O(E) entries. These backends share one interface so the
+searches can be run on each of them:
+
+    heapq    binary heap with lazy deletion (the default searches)
+    indexed  binary heap with decrease-key: at most one entry per node
+    radix    radix heap: integer keys, popped in non-decreasing order
+    bucket   Dial's bucket queue: integer keys, one bucket per distance
+
+radix and bucket are monotone queues: a key may never be smaller than the
+last key popped, which holds for Dijkstra and for A* with a consistent
+heuristic. On graphs with fractional weights, search integer_weights(g)
+instead of g.
+
+Usage:
+    queue = make_queue("radix")
+    result = dijkstra(graph, start, goal, queue=queue)
+    print(queue.stats())
+"""
+
+import heapq
+
+try:
+    from .graph import Graph
+except ImportError:
+    from graph import Graph
+
+
+class PriorityQueue:
+    """
+    Operation counters shared by every backend.
+
+    Subclasses implement push(key, item), pop() -> (key, item) and __len__.
+    A push for an item that is already queued may leave a stale entry
+    (lazy backends) or lower the item's key (indexed); the searches skip
+    settled nodes either way.
+    """
+
+    name = None
+
+    def __init__(self):
+        self.pushes = 0
+        self.pops = 0
+        self.peak = 0
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def stats(self):
+        """
+        Returns:
+            dict: pushes, pops and peak (largest number of queued entries)
+        """
+        return {'pushes': self.pushes, 'pops': self.pops, 'peak': self.peak}
+
+
+class HeapQueue(PriorityQueue):
+    """heapq with lazy deletion: every push adds an entry"""
+
+    name = "heapq"
+
+    def __init__(self):
+        super().__init__()
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, key, item):
+        heapq.heappush(self.heap, (key, item))
+        self.pushes += 1
+        if len(self.heap) > self.peak:
+            self.peak = len(self.heap)
+
+    def pop(self):
+        self.pops += 1
+        return heapq.heappop(self.heap)
+
+
+class IndexedHeap(PriorityQueue):
+    """
+    Binary heap with a position map, so a queued item's key is lowered in
+    place (decrease-key) instead of pushing a duplicate. Pushing a key that
+    is not lower than the queued one does nothing.
+    """
+
+    name = "indexed"
+
+    def __init__(self):
+        super().__init__()
+        self.keys = []
+        self.items = []
+        # item -> its slot in keys/items
+        self.position = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, key, item):
+        self.pushes += 1
+        slot = self.position.get(item)
+        if slot is None:
+            slot = len(self.items)
+            self.keys.append(key)
+            self.items.append(item)
+            self.position[item] = slot
+            if len(self.items) > self.peak:
+                self.peak = len(self.items)
+        elif key < self.keys[slot]:
+            self.keys[slot] = key
+        else:
+            return
+        self._sift_up(slot)
+
+    def pop(self):
+        if not self.items:
+            raise IndexError("pop from an empty priority queue")
+        self.pops += 1
+        keys, items = self.keys, self.items
+        key, item = keys[0], items[0]
+        del self.position[item]
+        last_key, last_item = keys.pop(), items.pop()
+        if items:
+            keys[0], items[0] = last_key, last_item
+            self.position[last_item] = 0
+            self._sift_down(0)
+        return key, item
+
+    def _sift_up(self, slot):
+        keys, items, position = self.keys, self.items, self.position
+        key, item = keys[slot], items[slot]
+        while slot > 0:
+            parent = (slot - 1) >> 1
+            if keys[parent] <= key:
+                break
+            keys[slot], items[slot] = keys[parent], items[parent]
+            position[items[slot]] = slot
+            slot = parent
+        keys[slot], items[slot] = key, item
+        position[item] = slot
+
+    def _sift_down(self, slot):
+        keys, items, position = self.keys, self.items, self.position
+        size = len(items)
+        key, item = keys[slot], items[slot]
+        while True:
+            child = 2 * slot + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[child + 1] < keys[child]:
+                child += 1
+            if key <= keys[child]:
+                break
+            keys[slot], items[slot] = keys[child], items[child]
+            position[items[slot]] = slot
+            slot = child
+        keys[slot], items[slot] = key, item
+        position[item] = slot
+
+
+class RadixHeap(PriorityQueue):
+    """
+    Radix heap over non-negative integer keys.
+
+    An entry sits in the bucket numbered by the highest bit in which its key
+    differs from the last popped key. When bucket 0 is empty, the first
+    non-empty bucket is emptied into lower ones around its smallest key, so
+    every entry moves down at most once per bit.
+    """
+
+    name = "radix"
+
+    def __init__(self):
+        super().__init__()
+        self.buckets = [[]]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, item):
+        if type(key) is not int:
+            raise ValueError(f"radix heap keys must be integers, got {key!r}")
+        if key < self.last:
+            raise ValueError(f"radix heap key {key} is below the last popped key {self.last}")
+        self.pushes += 1
+        self._place(key, item)
+        self.size += 1
+        if self.size > self.peak:
+            self.peak = self.size
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty priority queue")
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            entries, buckets[i] = buckets[i], []
+            self.last = min(key for key, _ in entries)
+            for key, item in entries:
+                self._place(key, item)
+        self.pops += 1
+        self.size -= 1
+        return buckets[0].pop()
+
+    def _place(self, key, item):
+        i = (key ^ self.last).bit_length()
+        while i >= len(self.buckets):
+            self.buckets.append([])
+        self.buckets[i].append((key, item))
+
+
+class BucketQueue(PriorityQueue):
+    """
+    Dial's bucket queue over non-negative integer keys.
+
+    Buckets form a ring indexed by key; pop() scans forward from the last
+    popped key to the next non-empty bucket, so a search costs O(E + D) for
+    a largest distance D. The ring doubles whenever a key lands further
+    ahead than it spans (the largest edge weight, once the search settles).
+    """
+
+    name = "bucket"
+
+    def __init__(self, size=16):
+        super().__init__()
+        self.buckets = [[] for _ in range(size)]
+        self.cursor = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, item):
+        if type(key) is not int:
+            raise ValueError(f"bucket queue keys must be integers, got {key!r}")
+        if key < self.cursor:
+            raise ValueError(f"bucket queue key {key} is below the last popped key {self.cursor}")
+        self.pushes += 1
+        if key - self.cursor >= len(self.buckets):
+            self._grow(key - self.cursor + 1)
+        self.buckets[key % len(self.buckets)].append(item)
+        self.size += 1
+        if self.size > self.peak:
+            self.peak = self.size
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty priority queue")
+        buckets = self.buckets
+        ring = len(buckets)
+        cursor = self.cursor
+        while not buckets[cursor % ring]:
+            cursor += 1
+        self.cursor = cursor
+        self.pops += 1
+        self.size -= 1
+        return cursor, buckets[cursor % ring].pop()
+
+    def _grow(self, span):
+        """Re-bucket every entry into a ring of at least span buckets"""
+        old, ring = self.buckets, len(self.buckets)
+        size = ring
+        while size < span:
+            size *= 2
+        self.buckets = [[] for _ in range(size)]
+        for slot, items in enumerate(old):
+            if items:
+                key = self.cursor + (slot - self.cursor) % ring
+                self.buckets[key % size] = items
+
+
+# Backends selectable by name
+QUEUES = {
+    "heapq": HeapQueue,
+    "indexed": IndexedHeap,
+    "radix": RadixHeap,
+    "bucket": BucketQueue,
+}
+
+
+def make_queue(queue):
+    """
+    An empty queue for one search.
+
+    Args:
+        queue: Name from QUEUES, or an empty queue object (returned unchanged,
+            so its counters can be read after the search)
+
+    Returns:
+        PriorityQueue
+    """
+    if not isinstance(queue, str):
+        return queue
+    try:
+        return QUEUES[queue]()
+    except KeyError:
+        raise ValueError(f"Unknown priority queue '{queue}' (expected one of: {', '.join(QUEUES)})")
+
+
+def integer_weights(graph, scale=1000):
+    """
+    Copy of a graph with every weight multiplied by scale and rounded, for
+    the integer-key backends. Generated networks have weights in steps of
+    0.001, so scale=1000 keeps them exact.
+
+    Args:
+        graph: Graph object
+        scale (int): Weight multiplier
+
+    Returns:
+        Graph: Costs on it are scale times the original costs
+    """
+    scaled = Graph()
+    scaled.add_nodes_from((node_id, name, coordinates) for node_id, (name, coordinates) in graph.nodes.items())
+    scaled.add_edges_from((node_id, neighbor, int(round(weight * scale)))
+                          for node_id, neighbors in graph.adj.items() for neighbor, weight in neighbors)
+    return scaled
+
+
+if __name__ == "__main__":
+    """Compare the backends on random Dijkstra queries: operations, peak size and time"""
+    import time
+    from dijkstra import dijkstra
+    from benchmark_support import csv_paths, argument, load_graph, random_queries
+
+    nodes_path, edges_path = csv_paths()
+    num_queries = argument(3, 100, int)
+    scale = argument(4, 1000, int)
+
+    g = integer_weights(load_graph(nodes_path, edges_path, quiet=True), scale)
+    print(f"Graph loaded: {g.num_nodes()} nodes, {g.num_edges()} edges (weights x{scale})")
+
+    queries = random_queries(g, num_queries)
+    expected = [dijkstra(g, s, t)['cost'] for s, t in queries]
+
+    for name in QUEUES:
+        pushes = pops = peak = wrong = 0
+        started = time.perf_counter()
+        for (s, t), cost in zip(queries, expected):
+            queue = make_queue(name)
+            if dijkstra(g, s, t, queue=queue)['cost'] != cost:
+                wrong += 1
+            pushes += queue.pushes
+            pops += queue.pops
+            peak = max(peak, queue.peak)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"  {name:8s} {pushes / len(queries):10.1f} pushes, {pops / len(queries):10.1f} pops per query, "
+              f"peak {peak:7d}, {elapsed / len(queries):8.2f} ms/query, {wrong} wrong costs")
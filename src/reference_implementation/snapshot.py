@@ -0,0 +1,231 @@
+"""
+Graph Snapshots - Binary Graph Files for the Reference Implementation
+CS 2500 Extra Credit Project
+
+A snapshot is a CompactGraph written to disk exactly as it sits in memory,
+so loading it is an mmap plus a few memoryview casts: no parsing and no
+copies. Every process that opens the same snapshot shares its pages
+read-only through the OS page cache.
+
+File layout (version 1, little-endian, sections 8-byte aligned):
+
+    header        magic, version, flags, node/edge/name counts, id_base
+    offsets       int64[num_nodes + 1]     CSR row pointers
+    targets       int64[num_edges]         neighbor ids, grouped by source
+    weights       float64[num_edges]
+    xs, ys        float64[num_nodes]       coordinates
+    name_index    int64[num_nodes]         index into the name table
+    name_offsets  int64[num_names + 1]     byte offsets into the name table
+    ids           int64[num_nodes]         only if FLAG_EXPLICIT_IDS is set
+    name table    UTF-8 bytes of every distinct name, concatenated
+"""
+
+import os
+import sys
+import mmap
+import struct
+import tempfile
+from array import array
+
+try:
+    from .compact_graph import CompactGraph
+except ImportError:
+    from compact_graph import CompactGraph
+
+MAGIC = b"CS2500G\x00"
+VERSION = 1
+
+# Node ids are stored explicitly (they are not id_base, id_base + 1, ...)
+FLAG_EXPLICIT_IDS = 1
+
+# magic, version, flags, num_nodes, num_edges, num_names, name_bytes, id_base
+HEADER = struct.Struct("<8sHHxxxxqqqqq")
+ALIGNMENT = 8
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a readable graph snapshot"""
+
+
+def write_snapshot(graph, path):
+    """
+    Write a graph to a snapshot file.
+
+    The file is written next to its destination and renamed into place, so
+    readers never see a partial snapshot.
+
+    Args:
+        graph: CompactGraph, or any graph with `nodes` and getNeighbors()
+        path (str): Destination file
+
+    Returns:
+        str: path
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph.from_graph(graph)
+
+    names, name_offsets = [], array('q', [0])
+    for k in range(len(graph.name_offsets) - 1):
+        name = graph.name_table[graph.name_offsets[k]:graph.name_offsets[k + 1]]
+        encoded = name.encode("utf-8") if isinstance(name, str) else bytes(name)
+        names.append(encoded)
+        name_offsets.append(name_offsets[-1] + len(encoded))
+    name_table = b"".join(names)
+
+    num_nodes, num_edges = graph.num_nodes(), graph.num_edges()
+    flags = FLAG_EXPLICIT_IDS if graph.ids is not None else 0
+    sections = [
+        _as_array('q', graph.offsets), _as_array('q', graph.targets), _as_array('d', graph.weights),
+        _as_array('d', graph.xs), _as_array('d', graph.ys), _as_array('q', graph.name_index),
+        name_offsets,
+    ]
+    if flags & FLAG_EXPLICIT_IDS:
+        sections.append(_as_array('q', graph.ids))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, staging = tempfile.mkstemp(prefix=".snapshot_", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, flags, num_nodes, num_edges,
+                                len(names), len(name_table), graph.id_base))
+            _pad(f)
+            for section in sections:
+                if sys.byteorder != "little":
+                    section = array(section.typecode, section)
+                    section.byteswap()
+                section.tofile(f)
+                _pad(f)
+            f.write(name_table)
+        os.replace(staging, path)
+    finally:
+        if os.path.exists(staging):
+            os.remove(staging)
+    return path
+
+
+def build_snapshot(nodes_path, edges_path, path):
+    """
+    Convert nodes.csv/edges.csv into a snapshot file.
+
+    Args:
+        nodes_path (str): Path to nodes.csv file
+        edges_path (str): Path to edges.csv file
+        path (str): Destination file
+
+    Returns:
+        str: path
+    """
+    return write_snapshot(CompactGraph.from_csv(nodes_path, edges_path), path)
+
+
+def load_snapshot(path):
+    """
+    Open a snapshot file as a read-only CompactGraph.
+
+    The graph's arrays are memoryviews into a read-only mmap of the file:
+    nothing is parsed or copied, and the mapping stays open for as long as
+    the graph is referenced.
+
+    Args:
+        path (str): Snapshot file
+
+    Returns:
+        CompactGraph
+
+    Raises:
+        SnapshotError: If the file is not a valid snapshot of this version
+    """
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            raise SnapshotError(f"{path}: empty file")
+
+    if len(mapped) < HEADER.size:
+        raise SnapshotError(f"{path}: too short for a graph snapshot")
+    magic, version, flags, num_nodes, num_edges, num_names, name_bytes, id_base = HEADER.unpack_from(mapped)
+    if magic != MAGIC:
+        raise SnapshotError(f"{path}: not a graph snapshot")
+    if version != VERSION:
+        raise SnapshotError(f"{path}: snapshot version {version}, expected {VERSION}")
+
+    counts = [('q', num_nodes + 1), ('q', num_edges), ('d', num_edges), ('d', num_nodes), ('d', num_nodes),
+              ('q', num_nodes), ('q', num_names + 1)]
+    if flags & FLAG_EXPLICIT_IDS:
+        counts.append(('q', num_nodes))
+
+    position = _aligned(HEADER.size)
+    spans = []
+    for typecode, count in counts:
+        spans.append((typecode, position, count))
+        position = _aligned(position + 8 * count)
+    if len(mapped) != position + name_bytes:
+        raise SnapshotError(f"{path}: truncated or corrupt snapshot")
+
+    view = memoryview(mapped)
+    sections = [_section(view, typecode, start, count) for typecode, start, count in spans]
+    sections.append(view[position:position + name_bytes])
+    offsets, targets, weights, xs, ys, name_index, name_offsets = sections[:7]
+    ids = sections[7] if flags & FLAG_EXPLICIT_IDS else None
+    if offsets[0] != 0 or offsets[num_nodes] != num_edges:
+        raise SnapshotError(f"{path}: corrupt edge offsets")
+
+    return CompactGraph(offsets, targets, weights, xs, ys, name_index, sections[-1], name_offsets,
+                        ids=ids, id_base=id_base)
+
+
+def _as_array(typecode, values):
+    """values as an array of the given typecode (no copy if it already is one)"""
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+def _section(view, typecode, start, count):
+    section = view[start:start + 8 * count]
+    if sys.byteorder == "little":
+        return section.cast(typecode)
+    # Big-endian host: the file is little-endian, so this section is copied
+    swapped = array(typecode, section.tobytes())
+    swapped.byteswap()
+    return swapped
+
+
+def _aligned(position):
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _pad(f):
+    f.write(b"\x00" * (_aligned(f.tell()) - f.tell()))
+
+
+if __name__ == "__main__":
+    """Convert CSVs to a snapshot and compare load times with Graph"""
+    import time
+    from graph import Graph
+    from dijkstra import dijkstra
+    from benchmark_support import csv_paths, argument
+
+    nodes_path, edges_path = csv_paths()
+    snapshot_path = argument(3, os.path.join(tempfile.gettempdir(), "graph.snapshot"))
+
+    started = time.perf_counter()
+    build_snapshot(nodes_path, edges_path, snapshot_path)
+    print(f"Snapshot written in {(time.perf_counter() - started) * 1000:.1f} ms: "
+          f"{snapshot_path} ({os.path.getsize(snapshot_path) / 1024:.1f} KB)")
+
+    started = time.perf_counter()
+    g = Graph()
+    g.load_from_csv(nodes_path, edges_path)
+    print(f"  Graph.load_from_csv: {(time.perf_counter() - started) * 1000:10.1f} ms")
+
+    started = time.perf_counter()
+    sg = load_snapshot(snapshot_path)
+    print(f"  load_snapshot:       {(time.perf_counter() - started) * 1000:10.1f} ms")
+
+    ids = sorted(g.nodes)
+    start, goal = ids[0], ids[-1]
+    expected, actual = dijkstra(g, start, goal), dijkstra(sg, start, goal)
+    same = expected['cost'] == actual['cost'] and expected['path'] == actual['path']
+    print(f"  Dijkstra {start} → {goal}: cost {actual['cost']} ({'matches' if same else 'DIFFERS from'} Graph)")
@@ -0,0 +1,67 @@
+"""
+Shared setup for the test suite: import paths and small random graphs.
+
+Run from the project root:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import math
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Grader modules import each other by plain name (as when run from src/core);
+# reference modules are imported as src.reference_implementation.*
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src", "core"))
+
+from src.reference_implementation.graph import Graph  # noqa: E402
+
+
+def random_graph(seed, num_nodes=40, num_edges=110, isolated=3):
+    """
+    Random directed graph with admissible weights (never shorter than the
+    straight line) in steps of 0.001, no parallel edges, and a few nodes
+    without edges, so some queries have no path.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    for node_id in range(1, num_nodes + 1):
+        graph.addNode(node_id, f"n{node_id}", (rng.uniform(0, 100), rng.uniform(0, 100)))
+
+    connected = list(range(1, num_nodes + 1 - isolated))
+    edges = set()
+    while len(edges) < num_edges:
+        u, v = rng.sample(connected, 2)
+        edges.add((u, v))
+    for u, v in sorted(edges):
+        (x1, y1), (x2, y2) = graph.get_node_coords(u), graph.get_node_coords(v)
+        straight = math.hypot(x2 - x1, y2 - y1)
+        graph.addEdge(u, v, math.ceil(straight * (1 + rng.random()) * 1000) / 1000)
+    return graph
+
+
+def random_pairs(graph, seed, count=60):
+    """Seeded (start, goal) pairs, including start == goal and unreachable goals"""
+    rng = random.Random(seed)
+    ids = sorted(graph.nodes)
+    return [(rng.choice(ids), rng.choice(ids)) for _ in range(count)]
+
+
+def same_cost(actual, expected):
+    if expected == math.inf:
+        return actual == math.inf
+    return abs(actual - expected) < 1e-9
+
+
+def path_cost(graph, path):
+    """Cost of walking a path edge by edge (inf if an edge is missing)"""
+    total = 0
+    for u, v in zip(path, path[1:]):
+        weight = graph.getEdgeWeight(u, v)
+        if weight is None:
+            return math.inf
+        total += weight
+    return total
@@ -0,0 +1,129 @@
+"""
+Reference algorithms checked against the plain reference Dijkstra on random graphs
+"""
+
+import math
+
+import pytest
+
+from conftest import random_graph, random_pairs, same_cost, path_cost
+from src.reference_implementation.dijkstra import dijkstra, distance_table
+from src.reference_implementation.astar import astar
+from src.reference_implementation.workspace import SearchWorkspace
+from src.reference_implementation.bidirectional import bidirectional_dijkstra, bidirectional_astar, reverse_adjacency
+from src.reference_implementation.alt import LandmarkIndex, load_or_build
+from src.reference_implementation.contraction_hierarchy import ContractionHierarchy
+from src.reference_implementation.priority_queue import QUEUES, integer_weights
+from src.reference_implementation.compact_graph import CompactGraph
+from src.reference_implementation.snapshot import write_snapshot, load_snapshot
+from src.reference_implementation.oracle import ReferenceOracle
+
+SEEDS = range(12)
+
+
+def check_search(graph, result, start, goal):
+    """A search result must have the optimal cost and a path that walks to it"""
+    expected = dijkstra(graph, start, goal)['cost']
+    assert same_cost(result['cost'], expected), (start, goal)
+    if expected != math.inf:
+        path = result['path']
+        assert path[0] == start and path[-1] == goal
+        assert same_cost(path_cost(graph, path), expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("heuristic", ["euclidean", "zero"])
+def test_astar_matches_dijkstra(seed, heuristic):
+    graph = random_graph(seed)
+    workspace = SearchWorkspace(graph)
+    for start, goal in random_pairs(graph, seed):
+        check_search(graph, astar(graph, start, goal, heuristic=heuristic), start, goal)
+        check_search(graph, astar(graph, start, goal, workspace, heuristic=heuristic), start, goal)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_workspace_dijkstra_matches_dijkstra(seed):
+    graph = random_graph(seed)
+    workspace = SearchWorkspace(graph)
+    for start, goal in random_pairs(graph, seed):
+        check_search(graph, dijkstra(graph, start, goal, workspace), start, goal)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_bidirectional_matches_dijkstra(seed):
+    graph = random_graph(seed)
+    reverse = reverse_adjacency(graph)
+    for start, goal in random_pairs(graph, seed):
+        check_search(graph, bidirectional_dijkstra(graph, start, goal, reverse), start, goal)
+        check_search(graph, bidirectional_astar(graph, start, goal, reverse), start, goal)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_alt_matches_dijkstra(seed, tmp_path):
+    graph = random_graph(seed)
+    built = LandmarkIndex.build(graph, num_landmarks=4, seed=seed)
+    loaded = load_or_build(graph, str(tmp_path / "landmarks.alt"), num_landmarks=4, seed=seed)
+    for start, goal in random_pairs(graph, seed):
+        check_search(graph, astar(graph, start, goal, heuristic=built), start, goal)
+        check_search(graph, astar(graph, start, goal, heuristic=loaded), start, goal)
+
+
+def test_alt_file_reused_when_graph_has_fewer_nodes_than_k(tmp_path):
+    graph = random_graph(0, num_nodes=6, num_edges=8, isolated=1)
+    path = str(tmp_path / "landmarks.alt")
+    first = load_or_build(graph, path, num_landmarks=16)
+    modified = (tmp_path / "landmarks.alt").stat().st_mtime_ns
+    second = load_or_build(graph, path, num_landmarks=16)
+    assert (tmp_path / "landmarks.alt").stat().st_mtime_ns == modified
+    assert second.landmarks == first.landmarks and second.requested == 16
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_contraction_hierarchy_matches_dijkstra(seed, tmp_path):
+    graph = random_graph(seed)
+    hierarchy = ContractionHierarchy.build(graph)
+    path = str(tmp_path / "hierarchy.ch")
+    hierarchy.save(path)
+    loaded = ContractionHierarchy.load(path)
+    for start, goal in random_pairs(graph, seed):
+        check_search(graph, hierarchy.query(start, goal), start, goal)
+        check_search(graph, loaded.query(start, goal), start, goal)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("queue", sorted(QUEUES))
+def test_priority_queues_match_heapq(seed, queue):
+    # A coarse scale keeps the largest weight, and so the bucket ring, small
+    graph = integer_weights(random_graph(seed), scale=10)
+    for start, goal in random_pairs(graph, seed):
+        check_search(graph, dijkstra(graph, start, goal, queue=queue), start, goal)
+        check_search(graph, astar(graph, start, goal, heuristic="zero", queue=queue), start, goal)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_distance_table_and_oracle_match_dijkstra(seed):
+    graph = random_graph(seed)
+    pairs = random_pairs(graph, seed)
+    sources = sorted({start for start, _ in pairs})
+    targets = sorted({goal for _, goal in pairs})
+    table = distance_table(graph, sources, targets)
+    costs = ReferenceOracle(graph).costs(pairs)
+    for start, goal in pairs:
+        expected = dijkstra(graph, start, goal)['cost']
+        assert same_cost(table[sources.index(start)][targets.index(goal)], expected)
+        assert same_cost(costs[(start, goal)], expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_compact_graph_and_snapshot_match_graph(seed, tmp_path):
+    graph = random_graph(seed)
+    compact = CompactGraph.from_graph(graph)
+    path = str(tmp_path / "graph.snapshot")
+    write_snapshot(graph, path)
+    snapshot = load_snapshot(path)
+    for start, goal in random_pairs(graph, seed):
+        expected = dijkstra(graph, start, goal)
+        for other in (compact, snapshot):
+            assert same_cost(dijkstra(other, start, goal)['cost'], expected['cost'])
+            assert same_cost(astar(other, start, goal)['cost'], expected['cost'])
+            assert dijkstra(other, start, goal)['nodes_explored'] == expected['nodes_explored']
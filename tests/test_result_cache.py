@@ -0,0 +1,112 @@
+"""
+The incremental-grading input hash: what must (and must not) change it
+"""
+
+import os
+import shutil
+
+import pytest
+
+import result_cache
+from result_cache import compute_input_hash, student_files
+from sandbox import DEFAULT_LIMITS
+
+from conftest import ROOT
+
+REFERENCE_DIR = os.path.join(ROOT, "src", "reference_implementation")
+
+
+def grading_options(limits=DEFAULT_LIMITS, sandbox=True):
+    """Options as Autograder.test_or_reuse() builds them for a default run"""
+    options = dict(limits._asdict())
+    options["sandbox"] = sandbox
+    return options
+
+
+@pytest.fixture
+def submission(tmp_path):
+    """A minimal checkout: the three required modules, a helper package and the CSVs"""
+    repo = tmp_path / "student"
+    (repo / "helpers").mkdir(parents=True)
+    for name in ["graph.py", "dijkstra.py", "astar.py"]:
+        (repo / name).write_text(f"# {name}\n")
+    (repo / "helpers" / "__init__.py").write_text("")
+    (repo / "helpers" / "heap.py").write_text("SIZE = 1\n")
+    for name in ["nodes.csv", "edges.csv"]:
+        shutil.copy(os.path.join(ROOT, "data", name), repo / name)
+    return str(repo)
+
+
+def test_hash_is_stable(submission):
+    options = grading_options()
+    assert compute_input_hash(submission, options=options) == compute_input_hash(submission, options=options)
+
+
+def test_no_options_matches_empty_options(submission):
+    assert compute_input_hash(submission) == compute_input_hash(submission, options={})
+
+
+@pytest.mark.parametrize("limits", [
+    DEFAULT_LIMITS._replace(query_timeout=DEFAULT_LIMITS.query_timeout + 1),
+    DEFAULT_LIMITS._replace(memory_mb=DEFAULT_LIMITS.memory_mb // 2),
+    DEFAULT_LIMITS._replace(submission_timeout=DEFAULT_LIMITS.submission_timeout * 2),
+])
+def test_limits_change_hash(submission, limits):
+    assert (compute_input_hash(submission, options=grading_options(limits))
+            != compute_input_hash(submission, options=grading_options()))
+
+
+def test_sandbox_flag_changes_hash(submission):
+    assert (compute_input_hash(submission, options=grading_options(sandbox=False))
+            != compute_input_hash(submission, options=grading_options(sandbox=True)))
+
+
+def test_reference_file_changes_hash(submission, tmp_path, monkeypatch):
+    reference = tmp_path / "reference_implementation"
+    shutil.copytree(REFERENCE_DIR, reference, ignore=shutil.ignore_patterns("__pycache__"))
+    monkeypatch.setattr(result_cache, "_REFERENCE_DIR", str(reference))
+    before = compute_input_hash(submission, options=grading_options())
+
+    with open(reference / "workspace.py", "a") as f:
+        f.write("\n# changed\n")
+    assert compute_input_hash(submission, options=grading_options()) != before
+
+
+def test_student_subpackage_changes_hash(submission):
+    before = compute_input_hash(submission)
+    with open(os.path.join(submission, "helpers", "heap.py"), "a") as f:
+        f.write("SIZE = 2\n")
+    assert compute_input_hash(submission) != before
+
+
+def test_dataset_changes_hash(submission):
+    before = compute_input_hash(submission)
+    with open(os.path.join(submission, "edges.csv"), "a") as f:
+        f.write("1,2,1.0\n")
+    assert compute_input_hash(submission) != before
+
+
+def test_student_files_skip_hidden_and_cache_directories(submission):
+    for directory in [".venv", "__pycache__"]:
+        os.makedirs(os.path.join(submission, directory))
+        with open(os.path.join(submission, directory, "ignored.py"), "w") as f:
+            f.write("")
+    assert student_files(submission) == ["astar.py", "dijkstra.py", "graph.py",
+                                         "helpers/__init__.py", "helpers/heap.py"]
+
+
+def test_autograder_hash_follows_limits_and_sandbox(submission, tmp_path, monkeypatch):
+    pytest.importorskip("reportlab")
+    from autograder import Autograder
+
+    def input_hash(**settings):
+        grader = Autograder(output_dir=str(tmp_path / "out"), **settings)
+        monkeypatch.setattr(grader, "run_tests_on_submission", lambda repo_dir, student_name: {})
+        results, reused = grader.test_or_reuse(submission, "Student")
+        assert not reused
+        return results["input_hash"]
+
+    default = input_hash()
+    assert input_hash() == default
+    assert input_hash(sandbox=False) != default
+    assert input_hash(limits=DEFAULT_LIMITS._replace(query_timeout=1)) != default
@@ -0,0 +1,64 @@
+"""
+Scoring: the correctness-section rule and a full run on the reference submission
+"""
+
+import os
+import shutil
+
+import pytest
+
+from test_suite import correctness_points
+
+from conftest import ROOT
+
+REFERENCE_DIR = os.path.join(ROOT, "src", "reference_implementation")
+
+
+def section(passed, failed=0, generated=None):
+    tests = [{"passed": True}] * passed + [{"passed": False}] * failed
+    result = {"tests": tests}
+    if generated is not None:
+        result["generated"] = generated
+    return result
+
+
+def test_required_queries_score_three_points_each():
+    assert correctness_points(section(4, 1)) == 12
+
+
+def test_unscored_generated_batch_is_ignored():
+    generated = {"scored": False, "passed": 0, "total": 20}
+    assert correctness_points(section(5, generated=generated)) == 15
+
+
+def test_scored_generated_batch_scales_the_section():
+    all_failed = {"scored": True, "passed": 0, "total": 20}
+    half_passed = {"scored": True, "passed": 10, "total": 20}
+    all_passed = {"scored": True, "passed": 20, "total": 20}
+    assert correctness_points(section(5, generated=all_failed)) == pytest.approx(10)
+    assert correctness_points(section(5, generated=half_passed)) == pytest.approx(12.5)
+    assert correctness_points(section(5, generated=all_passed)) == pytest.approx(15)
+
+
+def test_empty_generated_batch_is_ignored():
+    assert correctness_points(section(5, generated={"scored": True, "passed": 0, "total": 0})) == 15
+
+
+@pytest.mark.parametrize("sandbox", [True, False])
+def test_reference_submission_scores_full_marks(tmp_path, sandbox):
+    pytest.importorskip("reportlab")
+    from autograder import Autograder
+
+    repo = tmp_path / "reference"
+    repo.mkdir()
+    for name in os.listdir(REFERENCE_DIR):
+        if name.endswith(".py"):
+            shutil.copy(os.path.join(REFERENCE_DIR, name), repo / name)
+    for name in ["nodes.csv", "edges.csv"]:
+        shutil.copy(os.path.join(ROOT, "data", name), repo / name)
+
+    grader = Autograder(output_dir=str(tmp_path / "out"), sandbox=sandbox)
+    results = grader.run_tests_on_submission(str(repo), "Reference")
+
+    assert results["errors"] == []
+    assert results["automated_score"] == results["max_automated_score"] == 52